@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# Ce fichier rend le dossier 'benchmarks' exécutable via `python -m benchmarks.<module>`.
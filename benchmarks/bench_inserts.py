@@ -0,0 +1,113 @@
+# benchmarks/bench_inserts.py
+"""
+Mesure le débit de création de tâches (inserts par seconde) sur une base temporaire.
+
+Quatre mesures :
+- legacy : le comportement d'origine, INSERT puis SELECT ... ORDER BY id DESC LIMIT 1,
+  avec un commit après chaque instruction et les PRAGMA par défaut de SQLite ;
+- insert_then_select : les mêmes deux requêtes, dans une seule transaction du profil actuel ;
+- insert_returning : dans les mêmes conditions, une seule instruction INSERT ... RETURNING * ;
+- create_task : TaskModel.create_task (RETURNING, plus les triggers FTS, images et journal).
+
+Le seul gain de débit vient du nombre de commits (legacy contre les autres). SQLite tourne dans
+le processus : la relecture évitée par RETURNING ne coûte qu'un appel de fonction, et
+insert_returning reste au niveau d'insert_then_select. RETURNING n'est pas une optimisation :
+il garantit de relire la ligne insérée, pas la dernière écrite par un autre écrivain.
+Chaque mesure est répétée --runs fois, la meilleure est retenue.
+
+Usage : python -m benchmarks.bench_inserts [--count 2000] [--runs 5]
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from models.database import DatabaseManager, ConnectionProfile, SUPPORTS_RETURNING
+from models.task_model import TaskModel
+
+INSERT_QUERY = "INSERT INTO tasks (title, description, status) VALUES (?, ?, ?)"
+
+
+def bench_legacy(path: str, count: int) -> float:
+    """Comportement d'origine : un commit par instruction, PRAGMA par défaut."""
+    DatabaseManager(path, ConnectionProfile(journal_mode="DELETE", synchronous="FULL")).close()
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    start = time.perf_counter()
+    for i in range(count):
+        connection.execute(INSERT_QUERY, (f"Tâche {i}", "Description", "À faire"))
+        connection.commit()
+        dict(connection.execute("SELECT * FROM tasks ORDER BY id DESC LIMIT 1").fetchone())
+        connection.commit()
+    elapsed = time.perf_counter() - start
+    connection.close()
+    return count / elapsed
+
+
+def bench_insert_then_select(path: str, count: int) -> float:
+    """Deux requêtes (INSERT puis relecture de la dernière ligne) dans une transaction."""
+    db = DatabaseManager(path)
+    start = time.perf_counter()
+    for i in range(count):
+        with db.transaction():
+            db.execute(INSERT_QUERY, (f"Tâche {i}", "Description", "À faire"))
+            dict(db.query_one("SELECT * FROM tasks ORDER BY id DESC LIMIT 1"))
+    elapsed = time.perf_counter() - start
+    db.close()
+    return count / elapsed
+
+
+def bench_insert_returning(path: str, count: int) -> float:
+    """Une instruction INSERT ... RETURNING * par transaction, sans les signaux de TaskModel."""
+    db = DatabaseManager(path)
+    start = time.perf_counter()
+    for i in range(count):
+        with db.transaction():
+            dict(db.execute(f"{INSERT_QUERY} RETURNING *", (f"Tâche {i}", "Description", "À faire"), fetchone=True))
+    elapsed = time.perf_counter() - start
+    db.close()
+    return count / elapsed
+
+
+def bench_create_task(path: str, count: int) -> float:
+    """Méthode actuelle : une instruction (RETURNING ou lastrowid) et un commit par création."""
+    model = TaskModel(path)
+    start = time.perf_counter()
+    for i in range(count):
+        model.create_task(f"Tâche {i}", "Description", "À faire")
+    elapsed = time.perf_counter() - start
+    model.db.close()
+    return count / elapsed
+
+
+BENCHMARKS = [
+    ("legacy", bench_legacy),
+    ("insert_then_select", bench_insert_then_select),
+    *([("insert_returning", bench_insert_returning)] if SUPPORTS_RETURNING else []),  # SQLite >= 3.35
+    ("create_task", bench_create_task),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000, help="nombre de créations par mesure")
+    parser.add_argument("--runs", type=int, default=5, help="répétitions de chaque mesure (la meilleure est retenue)")
+    args = parser.parse_args(argv)
+
+    results = {name: 0.0 for name, _ in BENCHMARKS}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Mesures entrelacées : un ralentissement passager de la machine ne pénalise pas une seule méthode
+        for run in range(args.runs):
+            for name, bench in BENCHMARKS:
+                path = os.path.join(tmp, f"{name}_{run}.db")
+                results[name] = max(results[name], bench(path, args.count))
+
+    for name, rate in results.items():
+        gain = rate / results["legacy"]
+        print(f"{name:<20} {rate:>10.0f} inserts/s  ({gain:.2f}x legacy)")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# benchmarks/bench_model.py
+"""
+Banc d'essai de la couche modèle (TaskModel / DatabaseManager) à plusieurs volumes.
+
+Pour chaque taille de base (1k, 100k, 1M tâches par défaut), une base temporaire est
+remplie par benchmarks/seed.py (mêmes données d'une exécution à l'autre), puis chaque
+opération est répétée et chronométrée : création, lecture, mise à jour, changement de
+statut, suppression, première page et page profonde de la liste. Chaque taille est mesurée
+--runs fois (DEFAULT_RUNS) ; les résultats (médiane, p95 et meilleure médiane de série, en
+microsecondes, médianes des exécutions) sont écrits en JSON pour être comparés d'une version à l'autre.
+
+Usage :
+    python -m benchmarks.bench_model [--sizes 1000 100000] [--output resultats.json]
+    python -m benchmarks.bench_model --baseline reference.json --strict [--threshold 0.25]
+
+Les durées ne se comparent que sur une même machine. baseline_model.json, mesuré sur la machine
+du mainteneur, est informatif : avec --baseline seul, les écarts sont affichés sans changer le
+code de sortie. Pour une vérification, mesurer d'abord la version de référence sur la machine
+courante (--output reference.json, mêmes --sizes et --runs), puis comparer avec --strict :
+le code de sortie vaut alors 1 si une mesure dépasse la référence de plus de --threshold
+(25 % par défaut) et d'au moins ABSOLUTE_TOLERANCE_US.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.seed import seed_database
+from models.task_model import STATUSES, TaskModel
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_REPEAT = 200
+# Les répétitions sont découpées en ROUNDS séries entrelacées (voir timed) : la comparaison
+# retient la meilleure médiane de série, moins sensible à la charge passagère de la machine
+ROUNDS = 10
+# En deçà de cet écart absolu, une hausse relative n'est pas une régression (bruit de mesure)
+ABSOLUTE_TOLERANCE_US = 15.0
+# Exécutions complètes par taille, en nombre fixe pour la référence comme pour la mesure comparée
+DEFAULT_RUNS = 3
+SEED = 42
+
+
+def populate(path: str, size: int):
+    """Remplit une base neuve avec `size` tâches et autant de commentaires (benchmarks/seed.py)."""
+    seed_database(path, tasks=size, comments=size)
+
+
+def timed(operations: dict, repeat: int) -> dict:
+    """
+    Exécute chaque operation(i) `repeat` fois et retourne, en microsecondes, sa médiane, son p95
+    et la meilleure médiane de ses ROUNDS séries (celle que compare() utilise).
+    Les séries des opérations sont entrelacées : un ralentissement passager de la machine
+    ne touche que quelques séries de chaque opération, pas toutes les mesures de l'une d'elles.
+    """
+    samples = {name: [] for name in operations}
+    medians = {name: [] for name in operations}
+    bounds = [repeat * k // ROUNDS for k in range(ROUNDS + 1)]
+    for first, last in zip(bounds, bounds[1:]):
+        for name, operation in operations.items():
+            series = []
+            for i in range(first, last):
+                start = time.perf_counter()
+                operation(i)
+                series.append((time.perf_counter() - start) * 1e6)
+            if series:
+                samples[name] += series
+                medians[name].append(statistics.median(series))
+    results = {}
+    for name, values in samples.items():
+        values.sort()
+        results[name] = {
+            "median_us": round(statistics.median(values), 2),
+            "best_median_us": round(min(medians[name]), 2),
+            "p95_us": round(values[int(len(values) * 0.95) - 1], 2),
+        }
+    return results
+
+
+def bench_size(path: str, size: int, repeat: int) -> dict:
+    """Mesure chaque opération sur une base de `size` tâches."""
+    model = TaskModel(path)
+    rng = random.Random(SEED)
+    ids = [rng.randint(1, size) for _ in range(repeat)]
+    created = []
+    deep_cursor = tuple(model.db.query_one(
+        "SELECT created_at, id FROM tasks ORDER BY created_at DESC, id DESC LIMIT 1 OFFSET ?",
+        (size // 2,),
+    ))
+
+    # Dans chaque série, "delete" passe après "create" et supprime les tâches qu'elle vient de créer
+    results = timed({
+        "create": lambda i: created.append(model.create_task(f"Nouvelle {i}", "Description")["id"]),
+        "get": lambda i: model.get_task(ids[i]),
+        "update": lambda i: model.update_task_details({
+            "id": ids[i], "title": f"Modifiée {i}", "description": "Nouvelle description", "status": "En cours",
+        }),
+        "status": lambda i: model.update_status(ids[i], STATUSES[i % len(STATUSES)]),
+        "list_first_page": lambda i: model.get_tasks_page(limit=200),
+        "list_deep_page": lambda i: model.get_tasks_page(after=deep_cursor, limit=200),
+        "delete": lambda i: model.delete_task(created[i]),
+    }, repeat)
+    model.db.close()
+    return results
+
+
+def median_of(runs: list) -> dict:
+    """Médiane, opération par opération, de chaque mesure de plusieurs exécutions."""
+    return {
+        name: {key: round(statistics.median(run[name][key] for run in runs), 2) for key in metrics}
+        for name, metrics in runs[0].items()
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """
+    Retourne la liste des régressions : (taille, opération, référence, actuel).
+    La meilleure médiane de série est comparée quand les deux mesures l'ont (sinon la médiane) ;
+    une hausse n'est retenue que si elle dépasse à la fois `threshold` et ABSOLUTE_TOLERANCE_US.
+    """
+    regressions = []
+    for size, operations in results.items():
+        for name, metrics in operations.items():
+            reference = baseline.get(size, {}).get(name)
+            if not reference:
+                continue
+            key = "best_median_us" if "best_median_us" in metrics and "best_median_us" in reference else "median_us"
+            limit = max(reference[key] * (1 + threshold), reference[key] + ABSOLUTE_TOLERANCE_US)
+            if metrics[key] > limit:
+                regressions.append((size, name, reference[key], metrics[key]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="nombres de tâches")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="répétitions par opération")
+    parser.add_argument("--output", help="fichier JSON des résultats (sinon sortie standard)")
+    parser.add_argument("--baseline", help="résultats JSON de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=0.25, help="régression tolérée (0.25 = +25 %%)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="exécutions complètes par taille")
+    parser.add_argument(
+        "--strict", action="store_true",
+        help="la référence a été mesurée sur cette machine : une régression donne le code de sortie 1",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"bench_{size}.db")
+            start = time.perf_counter()
+            populate(path, size)
+            print(f"{size} tâches insérées en {time.perf_counter() - start:.1f} s", file=sys.stderr)
+            results[str(size)] = median_of([bench_size(path, size, args.repeat) for _ in range(args.runs)])
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "runs": args.runs,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        label = "RÉGRESSION" if args.strict else "écart (informatif, voir --strict)"
+        for size, name, reference, current in regressions:
+            print(f"{label} {size} {name} : {reference:.1f} µs -> {current:.1f} µs", file=sys.stderr)
+        if regressions and args.strict:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+# benchmarks/bench_ui.py
+"""
+Banc d'essai de l'interface, sans écran (plateforme Qt « offscreen »).
+
+Pour chaque taille de base (10k et 100k tâches par défaut), la fenêtre principale et son
+contrôleur sont créés sur une base temporaire, puis chaque action est chronométrée :
+ouverture (fenêtre + première page), chargement complet de la liste, ajout d'une tâche
+(add_task_to_list), défilement, ouverture de l'éditeur de survol, bascule du thème et
+ouverture/fermeture de la vue de détail. Chaque taille tourne dans son propre processus :
+le pic de mémoire (RSS) et le nombre de widgets relevés ne dépendent que de cette taille.
+
+Usage :
+    python -m benchmarks.bench_ui [--sizes 10000 100000] [--output resultats.json]
+    python -m benchmarks.bench_ui --baseline benchmarks/baseline_ui.json [--threshold 0.25]
+
+Le code de sortie vaut 1 si l'ajout d'une page en fin de liste coûte plus de PAGE_GROWTH_LIMIT
+fois l'ajout des premières (il doit rester constant quel que soit N), ou, avec --baseline, si le
+nombre de widgets augmente (fuite probable) : ces vérifications ne dépendent pas de la machine.
+Les durées et le pic de mémoire ne se comparent que sur une même machine : baseline_ui.json est
+informatif, leurs écarts ne font échouer qu'avec --strict, contre une référence mesurée sur la
+machine courante (voir benchmarks/bench_model.py).
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks.bench_model import compare, populate  # noqa: E402
+
+DEFAULT_SIZES = (10_000, 100_000)
+DEFAULT_REPEAT = 50
+WINDOW_SIZE = (900, 700)
+WAIT_TIMEOUT = 60  # secondes
+PAGE_WINDOW = 10  # pages comparées au début et à la fin du chargement complet
+PAGE_GROWTH_LIMIT = 2.0
+
+
+def sample(samples: list) -> dict:
+    """Médiane et p95 d'une liste de durées en secondes, converties en microsecondes."""
+    samples = sorted(s * 1e6 for s in samples)
+    return {
+        "median_us": round(samples[len(samples) // 2], 2),
+        "p95_us": round(samples[max(0, int(len(samples) * 0.95) - 1)], 2),
+    }
+
+
+def bench_size(path: str, size: int, repeat: int) -> dict:
+    """Mesure l'interface sur une base de `size` tâches ; exécuté dans un processus dédié."""
+    from PySide6.QtCore import QEvent, QSettings
+    from PySide6.QtWidgets import QApplication
+
+    # Le réglage du mode sombre est écrit à côté de la base, pas dans la configuration de l'utilisateur
+    QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, os.path.dirname(path))
+    app = QApplication([sys.argv[0]])
+
+    from controllers.task_controller import TaskController
+    from views.main_window import MainWindow
+
+    def process_events():
+        """Comme un tour de boucle d'événements, y compris les deleteLater() (ignorés par processEvents)."""
+        app.processEvents()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def run_pending(controller):
+        """Traite les événements jusqu'à la fin des requêtes en cours dans le thread de la base."""
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        process_events()
+        while controller.db.is_busy():
+            if time.monotonic() > deadline:
+                raise TimeoutError("la base ne répond pas")
+            time.sleep(0.0005)
+            process_events()
+        process_events()
+
+    def timed(operation) -> dict:
+        samples = []
+        for i in range(repeat):
+            start = time.perf_counter()
+            operation(i)
+            samples.append(time.perf_counter() - start)
+        return sample(samples)
+
+    results = {}
+
+    start = time.perf_counter()
+    window = MainWindow()
+    window.resize(*WINDOW_SIZE)
+    window.show()
+    controller = TaskController(window, path)
+    run_pending(controller)
+    results["startup"] = sample([time.perf_counter() - start])
+
+    view = window.task_list
+    model = window.task_list_model
+
+    # Chargement complet de la liste, page par page comme au défilement
+    pages = []
+    while model.canFetchMore():
+        start = time.perf_counter()
+        model.fetchMore()
+        run_pending(controller)
+        pages.append(time.perf_counter() - start)
+    results["populate"] = sample([sum(pages)])
+    # Coût d'une page au début et à la fin : il ne doit pas dépendre du nombre de lignes chargées
+    results["page_append_first"] = sample(pages[:PAGE_WINDOW])
+    results["page_append_last"] = sample(pages[-PAGE_WINDOW:])
+    assert model.rowCount() == size, (model.rowCount(), size)
+
+    # Tâches plus récentes que toutes les autres : insérées en tête de liste
+    results["add_task"] = timed(lambda i: window.add_task_to_list({
+        "id": size + 1 + i, "title": f"Ajoutée {i}", "description": "", "status": "À faire",
+        "created_at": f"9999-01-01 00:00:{i % 60:02d}", "image_path": None,
+    }))
+
+    # Défilement réparti sur toute la liste, chaque position étant peinte immédiatement
+    scroll_bar = view.verticalScrollBar()
+
+    def scroll(i):
+        scroll_bar.setValue(scroll_bar.maximum() * i // max(1, repeat - 1))
+        view.viewport().repaint()
+
+    results["scroll"] = timed(scroll)
+
+    results["hover_editor"] = timed(lambda i: (
+        view.open_hover_editor(model.index(i % 10, 0)), process_events()
+    ))
+    view.close_hover_editor()
+    process_events()
+
+    def toggle_theme(i):
+        window.toggle_dark_mode()
+        process_events()
+
+    results["theme_toggle"] = timed(toggle_theme)
+
+    task_ids = model.task_ids(range(0, model.rowCount(), max(1, model.rowCount() // repeat)))
+
+    def open_close_detail(i):
+        controller.open_task_detail(task_ids[i % len(task_ids)])
+        process_events()
+        controller.back_to_main()
+        process_events()
+
+    results["detail_open_close"] = timed(open_close_detail)
+
+    resources = {
+        # ru_maxrss est en Kio sous Linux
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "widgets": len(QApplication.allWidgets()),
+    }
+    controller.shutdown()
+    window.close()
+    return {"timings": results, "resources": resources}
+
+
+def run_child(size: int, repeat: int) -> dict:
+    """
+    Lance la mesure d'une taille dans un processus séparé et retourne son résultat.
+    La base est créée dans un dossier temporaire, avec son magasin d'images et ses réglages.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (root, os.environ.get("PYTHONPATH")))))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"bench_ui_{size}.db")
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_ui", "--child", str(size), "--db", path, "--repeat", str(repeat)],
+            stdout=subprocess.PIPE, check=True, text=True, env=env,
+        )
+    return json.loads(completed.stdout)
+
+
+def compare_memory(resources: dict, baseline: dict, threshold: float):
+    """Retourne les régressions du pic de mémoire : (taille, mesure, référence, actuel)."""
+    regressions = []
+    for size, current in resources.items():
+        reference = baseline.get(size)
+        if reference and current["peak_rss_kib"] > reference["peak_rss_kib"] * (1 + threshold):
+            regressions.append((size, "peak_rss_kib", reference["peak_rss_kib"], current["peak_rss_kib"]))
+    return regressions
+
+
+def compare_widgets(resources: dict, baseline: dict):
+    """Retourne les tailles où le nombre de widgets augmente : (taille, mesure, référence, actuel)."""
+    regressions = []
+    for size, current in resources.items():
+        reference = baseline.get(size)
+        if reference and current["widgets"] > reference["widgets"]:
+            regressions.append((size, "widgets", reference["widgets"], current["widgets"]))
+    return regressions
+
+
+def check_flat_pages(results: dict, limit: float = PAGE_GROWTH_LIMIT):
+    """Retourne les tailles où une page ajoutée en fin de liste coûte plus que `limit` fois une des premières."""
+    regressions = []
+    for size, timings in results.items():
+        first, last = timings["page_append_first"]["median_us"], timings["page_append_last"]["median_us"]
+        if last > first * limit:
+            regressions.append((size, "page_append_last", first, last))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="nombres de tâches")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="répétitions par action")
+    parser.add_argument("--output", help="fichier JSON des résultats (sinon sortie standard)")
+    parser.add_argument("--baseline", help="résultats JSON de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=0.25, help="régression tolérée (0.25 = +25 %%)")
+    parser.add_argument(
+        "--strict", action="store_true",
+        help="la référence a été mesurée sur cette machine : durées et mémoire en régression donnent le code 1",
+    )
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        path = os.path.abspath(args.db or f"bench_ui_{args.child}.db")
+        populate(path, args.child)
+        print(json.dumps(bench_size(path, args.child, args.repeat)))
+        return 0
+
+    results, resources = {}, {}
+    for size in args.sizes:
+        start = time.perf_counter()
+        measured = run_child(size, args.repeat)
+        print(f"{size} tâches mesurées en {time.perf_counter() - start:.1f} s", file=sys.stderr)
+        results[str(size)] = measured["timings"]
+        resources[str(size)] = measured["resources"]
+
+    from PySide6 import __version__ as pyside_version
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pyside": pyside_version,
+            "qpa_platform": os.environ["QT_QPA_PLATFORM"],
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+        "resources": resources,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    regressions = check_flat_pages(results)
+    timings = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions += compare_widgets(resources, baseline.get("resources", {}))
+        timings = compare(results, baseline["results"], args.threshold)
+        timings += compare_memory(resources, baseline.get("resources", {}), args.threshold)
+    if args.strict:
+        regressions, timings = regressions + timings, []
+    for size, name, reference, current in regressions:
+        print(f"RÉGRESSION {size} {name} : {reference} -> {current}", file=sys.stderr)
+    for size, name, reference, current in timings:
+        print(f"écart (informatif, voir --strict) {size} {name} : {reference} -> {current}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+# benchmarks/seed.py
+"""
+Génère une base de test réaliste et reproductible, à partir du schéma de DatabaseManager.
+
+Les données dépendent uniquement de la graine (--seed) : titres et descriptions de longueurs
+variées (beaucoup de descriptions courtes, quelques-unes de plusieurs Kio), répartition des
+statuts, commentaires concentrés sur une minorité de tâches, bannières partagées et dates
+étalées sur plusieurs années. Deux générations avec les mêmes paramètres donnent la même base.
+
+Tout est inséré en une transaction. Les triggers d'insertion (index plein texte, compteurs
+de références des images et de commentaires, journal des changements) sont suspendus pendant le remplissage, puis les
+index et compteurs sont reconstruits en une passe et les triggers recréés à l'identique,
+dans la même transaction.
+
+Usage :
+    python -m benchmarks.seed chemin.db [--tasks 100000] [--comments 500000] [--seed 42]
+"""
+import argparse
+import calendar
+import hashlib
+import os
+import random
+import sys
+import time
+
+from models import image_store
+from models.database import ConnectionProfile, DatabaseManager
+
+DEFAULT_TASKS = 100_000
+DEFAULT_COMMENTS = 500_000
+DEFAULT_BANNERS = 200
+SEED = 42
+BATCH_SIZE = 50_000
+
+END = calendar.timegm((2025, 1, 1, 0, 0, 0))  # date fixe : les dates ne dépendent pas du jour de génération
+SPAN_DAYS = 3 * 365
+
+STATUS_WEIGHTS = {"À faire": 30, "En cours": 15, "Terminée": 55}
+BANNER_RATIO = 0.1  # part des tâches avec une bannière
+
+# Triggers suspendus pendant le remplissage : ceux d'insertion sont remplacés par une reconstruction,
+# le journal des changements est inutile pour une base neuve (aucune instance ne l'a encore lu)
+SUSPENDED_TRIGGERS = (
+    "tasks_fts_insert", "comments_fts_insert", "images_ref_insert", "comments_count_insert",
+    "changes_task_insert", "changes_task_update",
+)
+REBUILD_QUERIES = (
+    "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')",
+    "INSERT INTO comments_fts (comments_fts) VALUES ('rebuild')",
+    "UPDATE tasks SET comment_count = (SELECT COUNT(*) FROM comments WHERE task_id = tasks.id) "
+    "WHERE id IN (SELECT task_id FROM comments)",
+    "INSERT INTO images (path, refcount) "
+    "SELECT image_path, COUNT(*) FROM tasks WHERE image_path IS NOT NULL GROUP BY image_path "
+    "ON CONFLICT(path) DO UPDATE SET refcount = refcount + excluded.refcount, orphaned_at = NULL",
+)
+
+# Profil de remplissage : la base est neuve, une coupure ne ferait perdre que des données de test
+SEED_PROFILE = ConnectionProfile(journal_mode="MEMORY", synchronous="OFF")
+
+WORDS = (
+    "tâche réunion client rapport budget projet équipe livraison test correction bug "
+    "interface base données serveur réseau sauvegarde documentation revue code analyse "
+    "planning sprint démo maquette design export import migration performance sécurité "
+    "facture contrat devis relance appel courriel archive formation support mise à jour "
+    "priorité urgent semaine prochaine demain vérifier préparer envoyer valider terminer "
+    "ajouter supprimer corriger relire mesurer optimiser installer configurer déployer "
+    "le la les un une des du de pour avec sans sur dans après avant"
+).split()
+
+
+class TextGenerator:
+    """Textes pseudo-aléatoires, tirés d'un petit stock de phrases pour rester rapide."""
+
+    SENTENCES = 4096
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.sentences = [self.sentence() for _ in range(self.SENTENCES)]
+
+    def sentence(self) -> str:
+        words = self.rng.choices(WORDS, k=self.rng.randint(4, 18))
+        return " ".join(words).capitalize() + "."
+
+    def title(self) -> str:
+        # 2 à 12 mots, les titres courts étant les plus fréquents
+        count = min(12, 2 + int(self.rng.expovariate(0.4)))
+        return " ".join(self.rng.choices(WORDS, k=count)).capitalize()
+
+    def description(self) -> str:
+        roll = self.rng.random()
+        if roll < 0.2:
+            return ""
+        if roll < 0.85:
+            count = self.rng.randint(1, 4)  # quelques phrases
+        elif roll < 0.98:
+            count = self.rng.randint(5, 30)  # un ou deux paragraphes
+        else:
+            count = self.rng.randint(30, 80)  # plusieurs Kio
+        return " ".join(self.rng.choices(self.sentences, k=count))
+
+    def comment(self) -> str:
+        return " ".join(self.rng.choices(self.sentences, k=self.rng.randint(1, 3)))
+
+
+def banner_paths(store: image_store.ImageStore, count: int):
+    """Chemins de bannières du magasin d'images de la base (références seulement, sans fichier)."""
+    return [store.store_path(hashlib.sha1(f"banner-{i}".encode()).hexdigest()) for i in range(count)]
+
+
+def task_times(tasks: int):
+    """Dates de création (secondes Unix), croissantes avec l'id et étalées jusqu'à END."""
+    step = SPAN_DAYS * 86400 / max(1, tasks)
+    start = END - SPAN_DAYS * 86400
+    return [start + i * step for i in range(tasks)]
+
+
+def generate_tasks(rng: random.Random, text: TextGenerator, times: list, banners: list):
+    statuses, weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+    for task_id, created in enumerate(times, start=1):
+        created += rng.random() * 60
+        updated = created + rng.random() * (END - created)
+        banner = rng.choice(banners) if banners and rng.random() < BANNER_RATIO else None
+        yield (
+            task_id, text.title(), text.description(), rng.choices(statuses, weights)[0],
+            created, updated, banner,
+        )
+
+
+def generate_comments(rng: random.Random, text: TextGenerator, times: list, comments: int):
+    # Répartition très inégale : quelques tâches rassemblent la plupart des commentaires
+    tasks = len(times)
+    for _ in range(comments):
+        task_id = 1 + int(tasks * rng.random() ** 4)
+        created = times[task_id - 1]
+        yield task_id, text.comment(), created + 60 + rng.random() * (END - created)
+
+
+def insert_batches(connection, query: str, rows):
+    """executemany par lots, pour limiter la mémoire des générateurs consommés."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            connection.executemany(query, batch)
+            batch.clear()
+    if batch:
+        connection.executemany(query, batch)
+
+
+def seed_database(path, tasks: int = DEFAULT_TASKS, comments: int = DEFAULT_COMMENTS,
+                  banners: int = DEFAULT_BANNERS, seed: int = SEED) -> dict:
+    """
+    Remplit une base neuve (ou vide) et retourne le nombre de lignes insérées par table.
+    Lève ValueError si la base contient déjà des tâches.
+    """
+    db = DatabaseManager(path, SEED_PROFILE)
+    try:
+        if db.query_one("SELECT 1 FROM tasks LIMIT 1"):
+            raise ValueError(f"{path} contient déjà des tâches")
+
+        rng = random.Random(seed)
+        text = TextGenerator(rng)
+        times = task_times(tasks)
+        with db.transaction() as connection:
+            triggers = connection.execute(
+                f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' "
+                f"AND name IN ({', '.join('?' * len(SUSPENDED_TRIGGERS))})",
+                SUSPENDED_TRIGGERS,
+            ).fetchall()
+            for trigger in triggers:
+                connection.execute(f"DROP TRIGGER {trigger['name']}")
+
+            insert_batches(
+                connection,
+                "INSERT INTO tasks (id, title, description, status, created_at, updated_at, image_path) "
+                "VALUES (?, ?, ?, ?, datetime(?, 'unixepoch'), datetime(?, 'unixepoch'), ?)",
+                generate_tasks(rng, text, times, banner_paths(image_store.ImageStore(path), banners)),
+            )
+            insert_batches(
+                connection,
+                "INSERT INTO comments (task_id, content, created_at) VALUES (?, ?, datetime(?, 'unixepoch'))",
+                generate_comments(rng, text, times, comments) if tasks else (),
+            )
+
+            for query in REBUILD_QUERIES:
+                connection.execute(query)
+            for trigger in triggers:
+                connection.execute(trigger["sql"])
+
+        return {
+            table: db.query_one(f"SELECT COUNT(*) FROM {table}")[0] for table in ("tasks", "comments", "images")
+        }
+    finally:
+        db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="base SQLite à créer")
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS, help="nombre de tâches")
+    parser.add_argument("--comments", type=int, default=DEFAULT_COMMENTS, help="nombre de commentaires")
+    parser.add_argument("--banners", type=int, default=DEFAULT_BANNERS, help="nombre de bannières distinctes")
+    parser.add_argument("--seed", type=int, default=SEED, help="graine du générateur")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        counts = seed_database(args.path, args.tasks, args.comments, args.banners, args.seed)
+    except ValueError as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    rows = counts["tasks"] + counts["comments"]
+    print(
+        f"{counts['tasks']} tâches, {counts['comments']} commentaires, {counts['images']} bannières "
+        f"en {elapsed:.1f} s ({rows / elapsed * 60 / 1e6:.1f} M lignes/min, "
+        f"{os.path.getsize(args.path) / 1e6:.0f} Mo)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,117 +1,345 @@
 # controllers/task_controller.py
-from models.task_model import TaskModel
+from models import image_store
+from models.db_worker import DatabaseClient
+from models.status_queue import StatusWriteQueue
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import QMessageBox
-from views.task_detail_view import TaskDetailView
+
+# La vue détail, le tableau et le traitement des bannières ne sont importés qu'à leur première
+# utilisation : ils ne ralentissent pas le démarrage.
 
 class TaskController:
-    def __init__(self, view):
+    IMAGE_GC_DELAY_MS = 5000  # premier passage du ramasse-miettes, après le chargement initial
+    IMAGE_GC_INTERVAL_MS = 10 * 60 * 1000
+    PREFETCH_NEIGHBOURS = 2  # tâches voisines dont la bannière est préparée à l'ouverture d'une tâche
+    BOARD_COUNTS_DELAY_MS = 300  # regroupe les recomptages du tableau après une série de modifications
+    CHANGE_POLL_INTERVAL_MS = 1000  # détection des écritures des autres instances sur la même base
+
+    def __init__(self, view, db_path="app_data.db"):
         self.view = view
-        self.model = TaskModel()
-         
+        # Toutes les requêtes passent par le thread de la base : l'interface ne bloque jamais
+        self.db = DatabaseClient(db_path)
+        self.images = image_store.ImageStore(db_path)  # les bannières de cette base, à côté d'elle
+        # Changements de statut : affichés tout de suite, écrits par lots
+        self.status_queue = StatusWriteQueue(self.db)
+        self._search_request = None  # dernière recherche lancée, les réponses plus anciennes sont ignorées
+        self.detail_view = None  # créée à la première ouverture, puis réutilisée
+        self.board = None  # tableau kanban, créé au premier affichage
+
         # Établit la relation entre la vue et son contrôleur
         self.view.parent_controller = self
         # Connecte les signaux de la vue aux méthodes du contrôleur
         self.view.add_button.clicked.connect(self.create_task)
+        self.view.task_list_model.set_source(self.db)
+        self.db.busy_changed.connect(self.view.set_loading)
+        self.db.task_update_failed.connect(
+            lambda task_id, message: self.view.show_error(f"Erreur lors de la mise à jour : {message}")
+        )
+        # Un lot de statuts en échec : un seul message, quel que soit le nombre de tâches
+        self.db.tasks_update_failed.connect(
+            lambda task_ids, message: self.view.show_error(
+                f"Erreur lors de la mise à jour de {len(task_ids)} tâche(s) : {message}"
+            )
+        )
 
         # Charge les tâches au démarrage
         self.load_tasks()
-        
-    def load_tasks(self):
-        """Charge toutes les tâches depuis la BDD et les affiche via la vue."""
-        self.view.clear_tasks()  # Vide la liste avant rechargement
 
-        tasks = self.model.get_all_tasks()
-        for task in tasks:
-            self.view.add_task_to_list(task)  # affichage via widget custom
+        # Nettoyage périodique du magasin d'images, dans le thread de la base
+        self.image_gc_timer = QTimer()
+        self.image_gc_timer.setInterval(self.IMAGE_GC_INTERVAL_MS)
+        self.image_gc_timer.timeout.connect(self.collect_image_garbage)
+        self.image_gc_timer.timeout.connect(lambda: self.db.call("prune_changes", background=True))
+        self.image_gc_timer.start()
+        QTimer.singleShot(self.IMAGE_GC_DELAY_MS, self.sweep_images)
+
+        # Écritures des autres instances : un PRAGMA par tour tant que personne d'autre n'écrit
+        self.change_timer = QTimer()
+        self.change_timer.setInterval(self.CHANGE_POLL_INTERVAL_MS)
+        self.change_timer.timeout.connect(self.poll_changes)
+        self.change_timer.start()
+
+    def shutdown(self):
+        """Termine les écritures en attente et ferme la base (à la fermeture de l'application)."""
+        self.image_gc_timer.stop()
+        self.change_timer.stop()
+        if self.detail_view is not None:
+            self.detail_view.flush_autosave()
+        self.status_queue.flush()
+        if self.detail_view is not None:  # sinon aucune bannière n'a pu être traitée
+            from models.banner_pipeline import banner_pipeline
+            banner_pipeline().cancel_all()
+            banner_pipeline().wait()
+        self.db.shutdown()
+
+    def load_tasks(self):
+        """Charge la première page de tâches ; la liste demande les suivantes au défilement."""
+        self.view.task_list_model.reload()
 
     def create_task(self):
-        """Crée une nouvelle tâche en base, puis rafraîchit la vue."""
+        """Crée une nouvelle tâche en base ; la liste l'insère via le signal task_added."""
         title, desc = self.view.get_task_inputs()
 
         if not title:
             self.view.show_error("Veuillez entrer un titre de tâche.")
             return
 
-        try:
-            # Crée la tâche dans la base de données
-            new_task = self.model.create_task(title, desc)
+        def created(new_task):
             print(f"Tâche créée en base : {new_task}")
-
-            # Met à jour l'affichage avec la nouvelle tâche
-            self.view.add_task_to_list(new_task)
             self.view.clear_inputs()
 
-        except Exception as e:
-            self.view.show_error(f"Erreur lors de la création : {e}")
+        self.db.call(
+            "create_task", title, desc,
+            on_result=created,
+            on_error=lambda message: self.view.show_error(f"Erreur lors de la création : {message}"),
+        )
 
     def delete_task(self, task_id):
         confirm = QMessageBox.question(
-            self.view, "Supprimer", "Supprimer cette tâche ?", 
+            self.view, "Supprimer", "Supprimer cette tâche ?",
             QMessageBox.Yes | QMessageBox.No
         )
         if confirm == QMessageBox.Yes:
-            self.model.delete_task(task_id)
-            self.load_tasks()
-    
+            # La ligne est retirée de la liste via le signal task_deleted
+            self.db.call("delete_task", task_id, on_error=self.view.show_error)
+
+    def search_tasks(self, text: str):
+        """Affiche les résultats de la recherche plein texte, ou la liste complète si le champ est vide."""
+        if not text:
+            self._search_request = None
+            self.view.show_search_notice(False)
+            if self.view.task_list_model.is_searching():
+                self.load_tasks()
+            return
+
+        def found(results, request_id):
+            # Pendant la frappe, seule la réponse à la dernière saisie est affichée
+            if request_id == self._search_request:
+                self.view.task_list_model.show_search_results(results)
+
+        def truncated(value, request_id):
+            if request_id == self._search_request:
+                self.view.show_search_notice(value)
+
+        request_id = self.db.call(
+            "search", text,
+            on_result=lambda results: found(results, request_id),
+            on_error=lambda message: self.view.show_error(f"Erreur lors de la recherche : {message}"),
+        )
+        self._search_request = request_id
+        # Exécuté après la recherche sur le thread de la base : l'avertissement suit les résultats
+        self.db.call("search_truncated", text, on_result=lambda value: truncated(value, request_id))
+
+    # Actions groupées sur la sélection de la liste
+
+    def update_selected_status(self, status: str):
+        """Applique un statut à toutes les tâches sélectionnées, en une transaction."""
+        task_ids = self.view.selected_task_ids()
+        if task_ids:
+            self.db.call("update_status_many", task_ids, status, on_error=self.view.show_error)
+
+    def delete_selected_tasks(self):
+        """Supprime toutes les tâches sélectionnées après confirmation, en une transaction."""
+        task_ids = self.view.selected_task_ids()
+        if not task_ids:
+            return
+        confirm = QMessageBox.question(
+            self.view, "Supprimer", f"Supprimer {len(task_ids)} tâche(s) ?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if confirm == QMessageBox.Yes:
+            self.db.call("delete_tasks", task_ids, on_error=self.view.show_error)
+
+    def poll_changes(self):
+        """Applique les tâches modifiées par une autre instance ; les listes suivent via tasks_*."""
+        if self.db.is_busy():
+            return  # une requête est en cours : le tour suivant suffit
+
+        def polled(in_sync):
+            if not in_sync:
+                # Journal purgé depuis notre dernier passage : rechargement complet
+                self.load_tasks()
+                if self.board is not None:
+                    self.board.reload()
+
+        self.db.call("poll_changes", on_result=polled, background=True)
+
+    # Tableau kanban
+
+    def toggle_board(self):
+        """Bascule entre la liste et le tableau ; le tableau est rechargé à chaque affichage."""
+        if self.view.is_board_visible():
+            self.view.show_list()
+            return
+        board = self.board_page()
+        board.reload()
+        self.refresh_board_counts()
+        self.view.show_board(board)
+
+    def board_page(self):
+        """Retourne le tableau, créé une seule fois."""
+        if self.board is None:
+            from views.widgets.task_board_view import TaskBoardView
+            self.board = TaskBoardView()
+            self.board.set_source(self.db)
+            # Comme pour la liste, les actions des cartes sont différées après le clic
+            # Les voisines préparées sont celles de la colonne de la carte, pas de la liste
+            self.board.edit_clicked.connect(
+                lambda id: self.open_task_detail(id, self.board.model_of(id)), Qt.QueuedConnection
+            )
+            self.board.delete_clicked.connect(self.delete_task, Qt.QueuedConnection)
+            self.board.status_dropped.connect(self.update_task_status)
+
+            self.board_counts_timer = QTimer()
+            self.board_counts_timer.setSingleShot(True)
+            self.board_counts_timer.setInterval(self.BOARD_COUNTS_DELAY_MS)
+            self.board_counts_timer.timeout.connect(self.refresh_board_counts)
+            for signal in (self.db.task_added, self.db.task_deleted, self.db.tasks_added,
+                           self.db.tasks_updated, self.db.tasks_deleted):
+                signal.connect(self.schedule_board_counts)
+            # Les mises à jour du seul compteur de commentaires ne changent pas les colonnes
+            self.db.task_updated.connect(lambda task: "status" in task and self.schedule_board_counts())
+        return self.board
+
+    def schedule_board_counts(self, *args):
+        if self.view.is_board_visible():
+            self.board_counts_timer.start()
+
+    def refresh_board_counts(self):
+        """Nombre de tâches par statut, en une requête GROUP BY servie par l'index des statuts."""
+        self.db.call("count_by_status", on_result=self.board.set_counts)
+
     # Gestion de la vue détaillée d'une tâche
 
-   
-    def open_task_detail(self, task_id):
-        """Ouvre la vue de détail d'une tâche dans le QStackedWidget."""
-        task = self.model.get_task(task_id)
+
+    def open_task_detail(self, task_id, model=None):
+        """
+        Ouvre la vue de détail d'une tâche.
+        Les données de la ligne affichée suffisent : pas d'aller-retour avec la base.
+        `model` est le modèle d'où la tâche est ouverte (colonne du tableau) ; par défaut la liste.
+        """
+        if model is None:
+            model = self.view.task_list_model
+        row = model.row_of(task_id)
+        if row == -1:
+            self.db.call(
+                "get_task", task_id,
+                on_result=self.show_task_detail,
+                on_error=lambda message: self.view.show_error(f"Erreur lors du chargement : {message}"),
+            )
+            return
+
+        self.show_task_detail(model.task_at(row))
+        from models.banner_cache import banner_cache
+        from models.banner_pipeline import PREVIEW_HEIGHT
+        # Les tâches voisines sont souvent ouvertes ensuite : leurs bannières sont préparées
+        first = max(0, row - self.PREFETCH_NEIGHBOURS)
+        last = min(model.rowCount() - 1, row + self.PREFETCH_NEIGHBOURS)
+        banner_cache().prefetch(
+            (model.task_at(r).get("image_path") for r in range(first, last + 1) if r != row), PREVIEW_HEIGHT
+        )
+
+    def detail_page(self):
+        """Retourne la vue de détail, créée une seule fois dans le QStackedWidget."""
+        if self.detail_view is None:
+            from models.banner_cache import banner_cache
+            from views.task_detail_view import TaskDetailView
+            # Les bannières affichées et ajoutées sont celles du magasin de la base ouverte
+            banner_cache().set_store(self.images)
+            self.detail_view = TaskDetailView(parent=self.view.stack, parent_controller=self)
+            self.detail_view.back_clicked.connect(self.back_to_main)
+            self.detail_view.status_changed.connect(
+                lambda s: self.update_task_status(self.detail_view.task["id"], s)
+            )
+            self.detail_view.save_clicked.connect(self.update_task)
+            self.detail_view.autosave.connect(self.save_task_changes)
+            # Statut changé ailleurs, ou retour en arrière après un échec d'écriture
+            self.db.task_updated.connect(self.sync_detail_status)
+            self.db.tasks_updated.connect(lambda tasks: [self.sync_detail_status(task) for task in tasks])
+            self.detail_view.comment_model.set_source(self.db)
+            self.detail_view.comment_submitted.connect(
+                lambda content: self.add_comment(self.detail_view.task["id"], content)
+            )
+            self.view.stack.addWidget(self.detail_view)
+        return self.detail_view
+
+    def show_task_detail(self, task):
+        """Affiche une tâche dans la vue de détail."""
         if not task:
             self.view.show_error("Tâche introuvable.")
             return
+        page = self.detail_page()
+        page.bind(task)
+        self.view.stack.setCurrentWidget(page)
 
-        # Crée la vue de détail (avec parent = stack pour s'assurer d'une hiérarchie Qt correcte)
-        detail_view = TaskDetailView(task, parent=self.view.stack, parent_controller=self)
-
-        # Connecte les signaux
-        detail_view.back_clicked.connect(self.back_to_main)
-        detail_view.status_changed.connect(lambda s: self.update_task_status(task_id, s))
-        detail_view.save_clicked.connect(self.update_task)
-
-        # Ajoute et affiche la vue détail dans le stack avec protection contre les erreurs
-        try:
-            # Vérifie que le widget n'est pas déjà présent avant de l'ajouter
-            if self.view.stack.indexOf(detail_view) == -1:
-                self.view.stack.addWidget(detail_view)
-            self.view.stack.setCurrentWidget(detail_view)
-            # Conserve la référence pour un accès ultérieur si nécessaire
-            self.detail_view = detail_view
-        except RuntimeError:
-            # Gestion d'erreur si l'objet C++ du parent a été détruit
-            try:
-                self.view.show_error("Erreur interne : l'interface a été détruite. Veuillez relancer l'application.")
-            except Exception:
-                pass
-
+    def sync_detail_status(self, task):
+        if "status" in task and task["id"] == self.detail_view.task.get("id"):
+            self.detail_view.set_status(task["status"])
 
     def back_to_main(self):
-        """Retourne à la page principale sans recréer la vue."""
+        """Retourne à la page principale sans recréer la vue ni recharger la liste."""
         self.view.stack.setCurrentIndex(0)
-        self.load_tasks()
 
-    # Mise à jour du statut depuis la liste principale
+    # Mise à jour du statut depuis la liste, le tableau ou la vue détail
     def update_task_status(self, task_id: int, new_status: str):
-        self.model.update_status(task_id, new_status)
-        # Pas de rechargement complet nécessaire, la mise à jour est instantanée
-
-    def update_task(self, task):
-        """Délègue la mise à jour au modèle et retourne à la liste."""
-        try:
-            self.model.update_task_details(task)
-            # Retour à la page principale après la sauvegarde
+        # Les vues suivent immédiatement via task_updated ; l'écriture est regroupée par la file
+        self.status_queue.set_status(task_id, new_status)
+
+    def update_task(self, changes):
+        """
+        Enregistre les champs modifiés ; retour à la liste une fois la sauvegarde faite.
+        Sans modification, aucune requête : le retour est immédiat.
+        """
+        self.status_queue.flush()  # les statuts en attente sont écrits avant la sauvegarde
+        if len(changes) == 1:  # l'id seul
             self.back_to_main()
-        except Exception as e:
-            self.view.show_error(f"Erreur lors de la mise à jour : {e}")
+            return
+        self.save_task_changes(changes, on_saved=self.back_to_main)
+
+    def save_task_changes(self, changes, on_saved=None):
+        """Envoie les champs modifiés au modèle (sauvegarde ou enregistrement automatique)."""
+        def saved(result):
+            if result is None:
+                return  # échec : task_update_failed a déjà affiché l'erreur
+            self.detail_view.mark_saved(changes)
+            if on_saved:
+                on_saved()
+
+        self.db.call(
+            "update_task_details", changes,
+            on_result=saved,
+            on_error=lambda message: self.view.show_error(f"Erreur lors de la mise à jour : {message}"),
+        )
 
     def handle_image_upload(self, task):
-        """Gère la mise à jour de l'image d'une tâche."""
-        try:
-            # Met à jour le chemin de l'image dans la tâche
-            self.model.update_task_details(task)
-            print(f"Image mise à jour pour la tâche {task['id']}")
-        except Exception as e:
-            print(f"Erreur lors de la mise à jour de l'image: {e}")
-            self.view.show_error(f"Erreur lors de la mise à jour de l'image: {e}")
+        """Gère la mise à jour de l'image d'une tâche : seule la colonne image_path est écrite."""
+        changes = {"id": task["id"], "image_path": task.get("image_path")}
+        self.save_task_changes(
+            changes, on_saved=lambda: print(f"Image mise à jour pour la tâche {task['id']}")
+        )
+
+    def add_comment(self, task_id: int, content: str):
+        """Ajoute un commentaire ; la liste et le compteur suivent via comment_added et task_updated."""
+        self.db.call(
+            "add_comment", task_id, content,
+            on_result=lambda _: self.detail_view.comment_input.clear(),
+            on_error=lambda message: self.view.show_error(f"Erreur lors de l'ajout du commentaire : {message}"),
+        )
+
+    # Ramasse-miettes du magasin d'images
+
+    def collect_image_garbage(self):
+        """
+        Supprime les images orphelines par lots ; un lot plein en relance un autre.
+        Maintenance en arrière-plan, comme poll_changes : pas d'indicateur de chargement.
+        """
+        def collected(count):
+            if count >= image_store.GC_BATCH_SIZE:
+                # Laisse passer les autres requêtes en file avant le lot suivant
+                QTimer.singleShot(0, self.collect_image_garbage)
+
+        self.db.call("collect_image_garbage", on_result=collected, background=True)
+
+    def sweep_images(self):
+        """Au démarrage : retire les fichiers inconnus de la base, puis les images orphelines."""
+        self.db.call("sweep_stray_images", on_result=lambda _: self.collect_image_garbage(), background=True)
@@ -1,10 +1,98 @@
-from PySide6.QtWidgets import QApplication
-from views.main_window import MainWindow
+# main.py
+"""
+Point d'entrée de l'application.
+
+La fenêtre est affichée et peinte avant l'ouverture de la base : le contrôleur (et donc
+SQLite, les migrations et la première page de tâches) n'est créé qu'après le premier rendu.
+
+    python main.py                     # lance l'application
+    python main.py --measure-startup   # affiche les temps de démarrage puis quitte
+"""
+import argparse
 import sys
-from controllers.task_controller import TaskController
+import time
+
+START = time.perf_counter()
+
+
+def elapsed_ms() -> float:
+    return (time.perf_counter() - START) * 1000
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Gestionnaire de tâches")
+    parser.add_argument("--db", default="app_data.db", help="chemin de la base SQLite")
+    parser.add_argument(
+        "--measure-startup", action="store_true",
+        help="mesure les imports, l'ouverture de la base et le premier rendu, puis quitte",
+    )
+    # Les arguments restants (-platform, -style…) sont laissés à Qt
+    return parser.parse_known_args(argv[1:])
+
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    args, qt_args = parse_args(argv)
+    timings = {}
+
+    # Seuls les modules nécessaires au premier rendu sont importés ici
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+    from views.main_window import MainWindow
+    timings["imports"] = elapsed_ms()
+
+    app = QApplication([argv[0], *qt_args])
+    window = MainWindow()
+    timings["window"] = elapsed_ms()
+
+    def report():
+        print("Temps de démarrage (ms depuis le lancement) :")
+        for label, key in (
+            ("imports", "imports"),
+            ("fenêtre construite", "window"),
+            ("premier rendu", "first_paint"),
+            ("base ouverte", "db_opened"),
+            ("premières tâches", "first_data"),
+        ):
+            print(f"  {label:<20}{timings[key]:>9.1f}")
+        print(f"  {'(ouverture SQLite)':<20}{timings['db_open']:>9.1f}")
+
+    def start_controller():
+        from controllers.task_controller import TaskController
+        controller = TaskController(window, args.db)
+        # Les requêtes en file sont terminées et la base fermée avant de quitter
+        app.aboutToQuit.connect(controller.shutdown)
+
+        def opened(seconds):
+            timings["db_opened"] = elapsed_ms()
+            timings["db_open"] = seconds * 1000
+
+        def idle(busy):
+            # La première fin d'activité correspond à la première page de tâches chargée
+            if not busy and "first_data" not in timings:
+                timings["first_data"] = elapsed_ms()
+                if args.measure_startup:
+                    report()
+                    app.quit()
+
+        controller.db.opened.connect(opened)
+        controller.db.busy_changed.connect(idle)
+
+    class FirstPaint(QObject):
+        """Détecte le premier rendu de la fenêtre, puis lance le chargement des données."""
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and "first_paint" not in timings:
+                timings["first_paint"] = elapsed_ms()
+                obj.removeEventFilter(self)
+                QTimer.singleShot(0, start_controller)  # après la fin du rendu en cours
+            return False
+
+    first_paint = FirstPaint(window)
+    window.installEventFilter(first_paint)
+    window.show()
+    return app.exec()
+
 
-app = QApplication(sys.argv)
-window = MainWindow()
-controller = TaskController(window)
-window.show()
-sys.exit(app.exec())
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+# models/banner_cache.py
+import os
+import threading
+from collections import OrderedDict
+
+from PySide6.QtCore import QRunnable, Qt
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+
+from models import image_store
+from models.banner_pipeline import BannerJobSignals, banner_pipeline
+
+
+MEMORY_LIMIT_KIB = 32 * 1024  # budget mémoire des pixmaps de bannières
+HASH_MEMO_SIZE = 4096
+
+_hashes = OrderedDict()  # chemin -> ((mtime, taille), hash du contenu)
+_hashes_lock = threading.Lock()
+
+
+def _stat_key(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def known_hash(path: str):
+    """Retourne le hash déjà calculé d'une image, sans lire le fichier (au plus un stat)."""
+    digest = image_store.stored_hash(path)
+    if digest:
+        return digest  # image du magasin : le hash est son nom
+    stat_key = _stat_key(path)
+    with _hashes_lock:
+        entry = _hashes.get(path)
+    if entry and entry[0] == stat_key:
+        return entry[1]
+    return None
+
+
+def content_hash(path: str) -> str:
+    """Hash SHA-1 du contenu d'une image, mémorisé tant que le fichier ne change pas."""
+    digest = known_hash(path)
+    if digest:
+        return digest
+
+    stat_key = _stat_key(path)
+    digest = image_store.file_hash(path)
+    with _hashes_lock:
+        _hashes[path] = (stat_key, digest)
+        _hashes.move_to_end(path)
+        while len(_hashes) > HASH_MEMO_SIZE:
+            _hashes.popitem(last=False)
+    return digest
+
+
+def rendition_path(cache_dir: str, digest: str, height) -> str:
+    """Taille pré-calculée d'une image, dans le dossier cache de son magasin (ImageStore.cache_dir)."""
+    return os.path.join(cache_dir, f"{digest}_{height}.png")
+
+
+def store_rendition(path: str, height: int, image: QImage, cache_dir: str):
+    """Enregistre sur disque une taille déjà calculée (appelable depuis n'importe quel thread)."""
+    target = rendition_path(cache_dir, content_hash(path), height)
+    if os.path.exists(target):
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{target}.{threading.get_ident()}.tmp"
+    if image.save(tmp_path, "PNG"):
+        os.replace(tmp_path, target)
+
+
+def render(path: str, height: int, cache_dir: str) -> QImage:
+    """Charge la taille demandée depuis le disque, ou la calcule et l'enregistre."""
+    target = rendition_path(cache_dir, content_hash(path), height)
+    image = QImage(target)
+    if image.isNull():
+        image = QImage(path)
+        if image.isNull():
+            raise ValueError(f"Image illisible : {path}")
+        image = image.scaledToHeight(height, Qt.SmoothTransformation)
+        store_rendition(path, height, image, cache_dir)
+    return image
+
+
+class RenditionJob(QRunnable):
+    """
+    Prépare une taille de bannière hors du thread de l'interface.
+    `path` est le chemin en base, rendu tel quel par le signal finished ; le fichier lu est store.resolve(path).
+    """
+
+    def __init__(self, path: str, height: int, store):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.path = path
+        self.height = height
+        self.store = store
+        self.signals = BannerJobSignals()
+
+    def cancel(self):
+        pass  # le chargement d'une taille pré-calculée est trop court pour être interrompu
+
+    def run(self):
+        try:
+            image = render(self.store.resolve(self.path), self.height, self.store.cache_dir)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self.path, image)
+
+
+class BannerCache:
+    """
+    Cache des bannières à deux niveaux :
+    - sur disque, une image par (hash du contenu, hauteur), partagée entre les ouvertures ;
+    - en mémoire, QPixmapCache (LRU borné en octets) pour un affichage immédiat.
+    Les chemins reçus sont ceux enregistrés en base, résolus par le magasin de la base ouverte (set_store).
+    """
+
+    def __init__(self, memory_limit_kib: int = MEMORY_LIMIT_KIB):
+        QPixmapCache.setCacheLimit(memory_limit_kib)
+        self.store = None
+
+    def set_store(self, store):
+        """Associe le magasin d'images (ImageStore) de la base ouverte."""
+        self.store = store
+
+    def exists(self, path: str) -> bool:
+        return bool(path) and os.path.exists(self.store.resolve(path))
+
+    @staticmethod
+    def key(digest: str, height: int) -> str:
+        return f"banner:{digest}:{height}"
+
+    def pixmap(self, path: str, height: int):
+        """Retourne la bannière si elle est déjà en mémoire, sinon None. Ne lit jamais le fichier."""
+        digest = known_hash(self.store.resolve(path))
+        if not digest:
+            return None
+        pixmap = QPixmapCache.find(self.key(digest, height))
+        return pixmap if pixmap and not pixmap.isNull() else None
+
+    def put(self, path: str, height: int, image: QImage) -> QPixmap:
+        """Ajoute une taille calculée au cache mémoire et retourne sa pixmap."""
+        pixmap = QPixmap.fromImage(image)
+        digest = known_hash(self.store.resolve(path))
+        if digest:
+            QPixmapCache.insert(self.key(digest, height), pixmap)
+        return pixmap
+
+    def request(self, path: str, height: int, on_ready=None) -> RenditionJob:
+        """
+        Prépare la bannière dans le pool de banner_pipeline puis l'ajoute au cache mémoire.
+        `on_ready(path, image)` est appelé ensuite, dans le thread de l'interface.
+        """
+        job = RenditionJob(path, height, self.store)
+        # Connexions faites avant le lancement : le cache est rempli avant l'appel de on_ready
+        job.signals.finished.connect(lambda path, image: self.put(path, height, image))
+        if on_ready:
+            job.signals.finished.connect(on_ready)
+        banner_pipeline().start(job)
+        return job
+
+    def prefetch(self, paths, height: int):
+        """Prépare en arrière-plan les bannières qui ne sont pas encore en mémoire."""
+        for path in paths:
+            if self.exists(path) and not self.pixmap(path, height):
+                self.request(path, height)
+
+
+_cache = None
+
+
+def banner_cache() -> BannerCache:
+    """Retourne le cache de bannières partagé par l'application."""
+    global _cache
+    if _cache is None:
+        _cache = BannerCache()
+    return _cache
@@ -0,0 +1,132 @@
+# models/banner_pipeline.py
+import os
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtGui import QImage
+
+
+BANNER_SIZE = (800, 300)  # taille maximale de la bannière enregistrée
+PREVIEW_HEIGHT = 160  # hauteur d'affichage dans la vue détail
+
+
+class BannerJobSignals(QObject):
+    """Signaux d'un traitement de bannière, reçus dans le thread de l'interface."""
+
+    progress = Signal(int)  # 0 à 100
+    finished = Signal(str, QImage)  # chemin de la bannière enregistrée, aperçu redimensionné
+    failed = Signal(str)
+    cancelled = Signal()
+
+
+class BannerJobCancelled(Exception):
+    pass
+
+
+class BannerJob(QRunnable):
+    """
+    Décode, redimensionne et encode une bannière hors du thread de l'interface,
+    puis la range dans le magasin d'images `store` (nom = hash du contenu) ;
+    finished transmet son chemin en base.
+    Seul un QImage prêt à afficher est renvoyé : la conversion en QPixmap se fait côté interface.
+    """
+
+    def __init__(self, source_path: str, store, preview_height: int = PREVIEW_HEIGHT):
+        super().__init__()
+        self.setAutoDelete(False)  # la durée de vie est gérée par BannerPipeline
+        self.source_path = source_path
+        self.store = store
+        self.preview_height = preview_height
+        self.signals = BannerJobSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Demande l'arrêt du traitement ; il s'interrompt à la fin de l'étape en cours."""
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def _step(self, percent: int):
+        if self._cancelled.is_set():
+            raise BannerJobCancelled()
+        self.signals.progress.emit(percent)
+
+    def run(self):
+        tmp_path = self.store.temp_path()
+        try:
+            from PIL import Image
+            from models.banner_cache import store_rendition
+
+            self._step(5)
+            with Image.open(self.source_path) as img:
+                # Pour un JPEG, décode directement à une échelle réduite (1/2, 1/4, 1/8)
+                img.draft("RGB", (BANNER_SIZE[0] * 2, BANNER_SIZE[1] * 2))
+                img.load()
+                self._step(50)
+
+                img.thumbnail(BANNER_SIZE)
+                if img.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+                    img = img.convert("RGB")
+                self._step(70)
+
+                # Écriture dans un fichier temporaire puis renommage : jamais de bannière à moitié écrite
+                img.save(tmp_path, format="PNG")
+            self._step(90)
+
+            preview = QImage(tmp_path).scaledToHeight(self.preview_height, Qt.SmoothTransformation)
+            self._step(95)
+            path = self.store.add_file(tmp_path)
+            # L'aperçu sert aussi de taille pré-calculée pour les prochaines ouvertures
+            store_rendition(self.store.resolve(path), self.preview_height, preview, self.store.cache_dir)
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(path, preview)
+
+        except BannerJobCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class BannerPipeline(QObject):
+    """File de traitement des bannières, sur un pool de threads dédié."""
+
+    def __init__(self, max_threads: int = 2, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._jobs = set()  # garde les traitements en vie jusqu'à leur fin
+
+    def submit(self, source_path: str, store) -> BannerJob:
+        """Lance le traitement d'une image source vers le magasin `store` et retourne le job."""
+        return self.start(BannerJob(source_path, store))
+
+    def start(self, job):
+        """Exécute un job dans le pool et le garde en vie jusqu'à sa fin."""
+        self._jobs.add(job)
+        for signal in (job.signals.finished, job.signals.failed, job.signals.cancelled):
+            signal.connect(lambda *_, job=job: self._jobs.discard(job))
+        self.pool.start(job)
+        return job
+
+    def cancel_all(self):
+        for job in list(self._jobs):
+            job.cancel()
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Attend la fin des traitements en cours (utile à la fermeture de l'application)."""
+        return self.pool.waitForDone(msecs)
+
+
+_pipeline = None
+
+
+def banner_pipeline() -> BannerPipeline:
+    """Retourne la file de traitement des bannières partagée par l'application."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = BannerPipeline()
+    return _pipeline
@@ -0,0 +1,143 @@
+# models/comment_list_model.py
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class CommentListModel(QAbstractListModel):
+    """
+    Modèle Qt des commentaires de la tâche affichée dans la vue de détail.
+    Les commentaires sont chargés par pages, du plus ancien au plus récent, à mesure du
+    défilement : une tâche qui en compte des milliers ne charge que ceux qui sont vus.
+    La source est un DatabaseClient, comme pour TaskListModel.
+    """
+
+    CommentRole = Qt.UserRole + 1
+
+    PAGE_SIZE = 50
+
+    def __init__(self, source=None, parent=None):
+        super().__init__(parent)
+        self.source = None
+        self._comments = []
+        self._task_id = None
+        self._cursor = None  # clé (created_at, id) du dernier commentaire chargé
+        self._exhausted = True
+        self._fetching = False
+        self._generation = 0  # incrémenté à chaque changement de tâche, pour ignorer les pages périmées
+        self.set_source(source)
+
+    def set_source(self, source):
+        """Associe la source (DatabaseClient) ; les ajouts et suppressions sont appliqués ligne par ligne."""
+        if self.source is not None:
+            self.source.comment_added.disconnect(self.on_comment_added)
+            self.source.comment_deleted.disconnect(self.on_comment_deleted)
+
+        self.source = source
+        if source is not None:
+            source.comment_added.connect(self.on_comment_added)
+            source.comment_deleted.connect(self.on_comment_deleted)
+
+    # --- API Qt ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._comments)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        comment = self._comments[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{comment['content']}\n{comment['created_at']}"
+        if role == self.CommentRole:
+            return comment
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return not self._exhausted and not self._fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Demande la page suivante, appelée par la vue quand on approche du bas de la liste."""
+        if parent.isValid() or self._exhausted or self._fetching:
+            return
+
+        self._fetching = True
+        generation = self._generation
+        self.source.call(
+            "get_comments_page", self._task_id, after=self._cursor, limit=self.PAGE_SIZE,
+            on_result=lambda page: self.append_page(generation, page),
+            on_error=lambda message: self.page_failed(generation, message),
+        )
+
+    def page_failed(self, generation, message):
+        if generation != self._generation:
+            return
+        self._fetching = False
+        self._exhausted = True
+        print(f"Erreur lors du chargement des commentaires : {message}")
+
+    def append_page(self, generation, page):
+        """Ajoute en bas de la liste une page reçue du thread de la base."""
+        if generation != self._generation:
+            return  # une autre tâche est affichée depuis la demande
+
+        self._fetching = False
+        self._exhausted = len(page) < self.PAGE_SIZE
+        if not page:
+            return
+
+        self._cursor = (page[-1]["created_at"], page[-1]["id"])
+        # Un commentaire déjà ajouté via comment_added ne doit pas apparaître deux fois
+        known = {comment["id"] for comment in self._comments[-self.PAGE_SIZE:]}
+        page = [comment for comment in page if comment["id"] not in known]
+        if not page:
+            return
+
+        first = len(self._comments)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._comments.extend(page)
+        self.endInsertRows()
+
+    # --- Chargement ---
+
+    def set_task(self, task_id):
+        """Affiche les commentaires d'une autre tâche, en repartant de la première page."""
+        self.beginResetModel()
+        self._generation += 1
+        self._comments = []
+        self._task_id = task_id
+        self._cursor = None
+        self._exhausted = task_id is None or self.source is None
+        self._fetching = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def task_id(self):
+        return self._task_id
+
+    # --- Mises à jour incrémentales ---
+
+    def on_comment_added(self, comment: dict):
+        """
+        Un nouveau commentaire est le plus récent : il n'est ajouté que si toutes les pages
+        sont chargées, sinon il arrivera avec la dernière.
+        """
+        if comment["task_id"] != self._task_id or not self._exhausted or self._fetching:
+            return
+
+        row = len(self._comments)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._comments.append(comment)
+        self.endInsertRows()
+
+    def on_comment_deleted(self, comment_id: int):
+        row = next((row for row, comment in enumerate(self._comments) if comment["id"] == comment_id), -1)
+        if row < 0:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._comments[row]
+        self.endRemoveRows()
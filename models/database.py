@@ -1,62 +1,374 @@
 # models/database.py
 import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 
+# INSERT ... RETURNING est disponible à partir de SQLite 3.35
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+@dataclass
+class ConnectionProfile:
+    """
+    Réglages PRAGMA appliqués à chaque ouverture de connexion.
+    Les valeurs par défaut privilégient une application de bureau : journal WAL (les lectures
+    ne bloquent plus les écritures) et synchronous=NORMAL (pas de fsync à chaque commit).
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size_kib: int = 64 * 1024  # 64 Mio de cache de pages
+    mmap_size: int = 256 * 1024 * 1024  # 256 Mio lus via mmap
+    temp_store: str = "MEMORY"
+    foreign_keys: bool = True  # nécessaire pour que ON DELETE CASCADE s'applique
+    busy_timeout_ms: int = 5000
+
+    def pragmas(self):
+        """Retourne les instructions PRAGMA correspondant au profil."""
+        return [
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA cache_size = -{self.cache_size_kib}",
+            f"PRAGMA mmap_size = {self.mmap_size}",
+            f"PRAGMA temp_store = {self.temp_store}",
+            f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}",
+            f"PRAGMA busy_timeout = {self.busy_timeout_ms}",
+        ]
+
+
+# --- Migrations du schéma ---
+# Chaque migration fait passer PRAGMA user_version de N-1 à N.
+# Elles s'exécutent dans une transaction : une base existante est mise à jour sur place.
+
+def _migration_initial_tables(connection):
+    """Tables principales (schéma d'origine)."""
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            status TEXT DEFAULT 'À faire' CHECK(status IN ('À faire', 'En cours', 'Terminée')),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS comments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
+        )
+    """
+    )
+
+
+def _migration_image_path(connection):
+    """Colonne image_path (bannière), déjà présente sur certaines bases créées à la main."""
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(tasks)")}
+    if "image_path" not in columns:
+        connection.execute("ALTER TABLE tasks ADD COLUMN image_path TEXT DEFAULT NULL")
+
+
+def _migration_indexes(connection):
+    """Index des requêtes de liste, de filtre par statut et de cascade des commentaires."""
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at, id)")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, created_at, id)")
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_comments_task_id ON comments(task_id, created_at, id)")
+
+
+def _migration_full_text_search(connection):
+    """
+    Index plein texte (FTS5) des tâches et des commentaires, tenus à jour par triggers.
+    Tables à contenu externe : le texte n'est pas dupliqué, seul l'index est stocké.
+    """
+    options = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+    connection.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+        f"title, description, content = 'tasks', content_rowid = 'id', {options})"
+    )
+    connection.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5("
+        f"content, task_id UNINDEXED, content = 'comments', content_rowid = 'id', {options})"
+    )
+    for trigger in (
+        """
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS comments_fts_insert AFTER INSERT ON comments BEGIN
+            INSERT INTO comments_fts (rowid, content, task_id) VALUES (new.id, new.content, new.task_id);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS comments_fts_delete AFTER DELETE ON comments BEGIN
+            INSERT INTO comments_fts (comments_fts, rowid, content, task_id)
+            VALUES ('delete', old.id, old.content, old.task_id);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS comments_fts_update AFTER UPDATE OF content ON comments BEGIN
+            INSERT INTO comments_fts (comments_fts, rowid, content, task_id)
+            VALUES ('delete', old.id, old.content, old.task_id);
+            INSERT INTO comments_fts (rowid, content, task_id) VALUES (new.id, new.content, new.task_id);
+        END
+        """,
+    ):
+        connection.execute(trigger)
+
+    # Indexation des données déjà présentes
+    connection.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+    connection.execute("INSERT INTO comments_fts (comments_fts) VALUES ('rebuild')")
+
+
+def _migration_image_store(connection):
+    """
+    Table `images` du magasin de bannières : une ligne par fichier, avec le nombre de tâches
+    qui le référencent, tenu à jour par triggers sur tasks.image_path.
+    orphaned_at date le passage à zéro référence ; le ramasse-miettes s'en sert pour le délai de grâce.
+    """
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS images (
+            path TEXT PRIMARY KEY,
+            refcount INTEGER NOT NULL DEFAULT 0,
+            orphaned_at TIMESTAMP
+        ) WITHOUT ROWID
+    """
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_images_orphaned ON images(orphaned_at) WHERE refcount = 0"
+    )
+    for trigger in (
+        """
+        CREATE TRIGGER IF NOT EXISTS images_ref_insert AFTER INSERT ON tasks
+        WHEN new.image_path IS NOT NULL BEGIN
+            INSERT INTO images (path, refcount) VALUES (new.image_path, 1)
+            ON CONFLICT(path) DO UPDATE SET refcount = refcount + 1, orphaned_at = NULL;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS images_ref_delete AFTER DELETE ON tasks
+        WHEN old.image_path IS NOT NULL BEGIN
+            UPDATE images SET refcount = refcount - 1,
+                orphaned_at = CASE WHEN refcount = 1 THEN CURRENT_TIMESTAMP END
+            WHERE path = old.image_path;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS images_ref_update AFTER UPDATE OF image_path ON tasks
+        WHEN old.image_path IS NOT new.image_path BEGIN
+            UPDATE images SET refcount = refcount - 1,
+                orphaned_at = CASE WHEN refcount = 1 THEN CURRENT_TIMESTAMP END
+            WHERE path = old.image_path;
+            INSERT INTO images (path, refcount) SELECT new.image_path, 1 WHERE new.image_path IS NOT NULL
+            ON CONFLICT(path) DO UPDATE SET refcount = refcount + 1, orphaned_at = NULL;
+        END
+        """,
+    ):
+        connection.execute(trigger)
+
+    # Références des bannières déjà attachées (anciens fichiers images/task_<id>_banner.png)
+    connection.execute(
+        "INSERT INTO images (path, refcount) "
+        "SELECT image_path, COUNT(*) FROM tasks WHERE image_path IS NOT NULL GROUP BY image_path"
+    )
+
+
+def _migration_comment_count(connection):
+    """
+    Colonne tasks.comment_count, tenue à jour par triggers sur comments :
+    la liste affiche le nombre de commentaires sans jointure ni COUNT(*).
+    """
+    connection.execute("ALTER TABLE tasks ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0")
+    for trigger in (
+        """
+        CREATE TRIGGER IF NOT EXISTS comments_count_insert AFTER INSERT ON comments BEGIN
+            UPDATE tasks SET comment_count = comment_count + 1 WHERE id = new.task_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS comments_count_delete AFTER DELETE ON comments BEGIN
+            UPDATE tasks SET comment_count = comment_count - 1 WHERE id = old.task_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS comments_count_update AFTER UPDATE OF task_id ON comments
+        WHEN old.task_id IS NOT new.task_id BEGIN
+            UPDATE tasks SET comment_count = comment_count - 1 WHERE id = old.task_id;
+            UPDATE tasks SET comment_count = comment_count + 1 WHERE id = new.task_id;
+        END
+        """,
+    ):
+        connection.execute(trigger)
+
+    # Commentaires déjà présents
+    connection.execute(
+        "UPDATE tasks SET comment_count = (SELECT COUNT(*) FROM comments WHERE task_id = tasks.id) "
+        "WHERE id IN (SELECT task_id FROM comments)"
+    )
+
+
+def _migration_change_log(connection):
+    """
+    Journal `changes` des tâches modifiées, alimenté par triggers quel que soit l'écrivain.
+    Le numéro seq ne décroît ni n'est réutilisé : la purge garde toujours la dernière entrée,
+    donc le rowid suivant reste croissant sans le coût d'AUTOINCREMENT (écriture dans
+    sqlite_sequence à chaque entrée). Une autre instance relit seulement les entrées
+    postérieures au dernier numéro qu'elle a vu.
+    """
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS changes (
+            seq INTEGER PRIMARY KEY,
+            task_id INTEGER NOT NULL,
+            op TEXT NOT NULL CHECK(op IN ('insert', 'update', 'delete'))
+        )
+    """)
+    for op, event, row in (("insert", "INSERT", "new"), ("update", "UPDATE", "new"), ("delete", "DELETE", "old")):
+        connection.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS changes_task_{op} AFTER {event} ON tasks BEGIN
+                INSERT INTO changes (task_id, op) VALUES ({row}.id, '{op}');
+            END
+        """)
+
+
+MIGRATIONS = [
+    _migration_initial_tables,
+    _migration_image_path,
+    _migration_indexes,
+    _migration_full_text_search,
+    _migration_image_store,
+    _migration_comment_count,
+    _migration_change_log,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
 class DatabaseManager:
     """
     Classe responsable de la connexion SQLite et de l'initialisation des tables.
     """
 
-    def __init__(self, db_path: str = "app_data.db"):
+    def __init__(self, db_path: str = "app_data.db", profile: ConnectionProfile = None):
         self.db_path = Path(db_path)
+        self.profile = profile or ConnectionProfile()
         self.connection = None
+        self._transaction_depth = 0
         self.connect()
-        self._create_tables()
+        self.migrate()
+        self.track_own_changes()
 
     def connect(self):
-        """Établit la connexion à la base SQLite."""
-        self.connection = sqlite3.connect(self.db_path)
+        """Établit la connexion à la base SQLite et applique le profil de connexion."""
+        # isolation_level=None : pas de transaction implicite, elles sont ouvertes par transaction()
+        self.connection = sqlite3.connect(self.db_path, isolation_level=None)
         self.connection.row_factory = sqlite3.Row  # permet un accès par nom de colonne
+        for pragma in self.profile.pragmas():
+            self.connection.execute(pragma)
 
-    def _create_tables(self):
-        """Crée les tables principales si elles n'existent pas."""
-        cursor = self.connection.cursor()
+    def schema_version(self) -> int:
+        """Retourne la version du schéma enregistrée dans la base."""
+        return self.connection.execute("PRAGMA user_version").fetchone()[0]
 
-        # Table des tâches
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT,
-                status TEXT DEFAULT 'À faire' CHECK(status IN ('À faire', 'En cours', 'Terminée')),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+    def migrate(self):
+        """Applique les migrations manquantes, chacune dans sa propre transaction."""
+        version = self.schema_version()
+        for target, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+            with self.transaction():
+                migration(self.connection)
+                self.connection.execute(f"PRAGMA user_version = {target}")
+
+    def track_own_changes(self):
         """
-        )
+        Note dans une table temporaire (propre à cette connexion) les entrées du journal `changes`
+        que nous écrivons : la scrutation les ignore sans requête supplémentaire par transaction.
+        Le trigger TEMP n'existe que pour cette connexion, les autres écrivains ne le voient pas.
+        """
+        self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS own_changes (seq INTEGER PRIMARY KEY)")
+        self.connection.execute("""
+            CREATE TEMP TRIGGER IF NOT EXISTS own_changes_insert AFTER INSERT ON main.changes BEGIN
+                INSERT INTO own_changes (seq) VALUES (new.seq);
+            END
+        """)
+
+    def last_change(self) -> int:
+        """Numéro de la dernière entrée du journal `changes` (0 s'il est vide)."""
+        return self.connection.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
 
-        # Table des commentaires
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS comments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task_id INTEGER NOT NULL,
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
-            )
+    def data_version(self) -> int:
+        """Change à chaque commit d'une autre connexion sur la base, jamais pour les nôtres."""
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    @contextmanager
+    def transaction(self):
         """
-        )
+        Regroupe plusieurs requêtes dans une seule transaction (un seul commit).
+        En cas d'exception, tout est annulé. Un appel imbriqué rejoint la transaction englobante.
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self.connection
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        # IMMEDIATE : le verrou d'écriture est pris dès le début, pas au milieu de l'opération
+        self.connection.execute("BEGIN IMMEDIATE")
+        self._transaction_depth = 1
+        try:
+            yield self.connection
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.connection.execute("COMMIT")
+        finally:
+            self._transaction_depth = 0
 
-        self.connection.commit()
+    def explain(self, query: str, params: tuple = ()):
+        """Retourne le plan d'exécution (EXPLAIN QUERY PLAN) d'une requête, une ligne par étape."""
+        rows = self.connection.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        return [row["detail"] for row in rows]
+
+    def query_one(self, query: str, params: tuple = ()):
+        """Lecture d'une ligne, sans commit."""
+        return self.connection.execute(query, params).fetchone()
+
+    def query_all(self, query: str, params: tuple = ()):
+        """Lecture de toutes les lignes, sans commit."""
+        return self.connection.execute(query, params).fetchall()
 
     def execute(self, query: str, params: tuple = (), fetchone=False, fetchall=False):
-        """Exécute une requête SQL avec gestion automatique du commit."""
+        """
+        Exécute une requête SQL.
+        Hors de transaction(), l'instruction est validée seule (mode autocommit de SQLite) ;
+        à l'intérieur, elle est validée avec le reste de la transaction.
+        """
         cursor = self.connection.cursor()
         cursor.execute(query, params)
-        self.connection.commit()
 
         if fetchone:
             return cursor.fetchone()
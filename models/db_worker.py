@@ -0,0 +1,154 @@
+# models/db_worker.py
+import time
+
+from PySide6.QtCore import QObject, QThread, Signal, Slot
+from models.task_model import TaskModel
+
+
+# Signaux de TaskModel relayés du thread de la base vers l'interface
+MODEL_SIGNALS = (
+    "task_added", "task_updated", "task_deleted", "task_update_failed",
+    "tasks_added", "tasks_updated", "tasks_deleted", "tasks_update_failed",
+    "comment_added", "comment_deleted",
+)
+
+
+class TaskModelSignals(QObject):
+    """Mêmes signaux que TaskModel, pour les objets qui les relaient."""
+
+    task_added = Signal(dict)
+    task_updated = Signal(dict)
+    task_deleted = Signal(int)
+    task_update_failed = Signal(int, str)
+    tasks_added = Signal(list)
+    tasks_updated = Signal(list)
+    tasks_deleted = Signal(list)
+    tasks_update_failed = Signal(list, str)
+    comment_added = Signal(dict)
+    comment_deleted = Signal(int)
+
+
+class DatabaseWorker(TaskModelSignals):
+    """
+    Exécute les appels à TaskModel dans un thread dédié.
+    Le TaskModel (et donc la connexion SQLite) est créé dans ce thread et n'en sort jamais.
+    """
+
+    opened = Signal(float)  # durée d'ouverture de la base (connexion + migrations), en secondes
+    finished = Signal(int, object)  # id de la requête, résultat
+    failed = Signal(int, str)  # id de la requête, message d'erreur
+
+    def __init__(self, db_path="app_data.db", profile=None):
+        super().__init__()
+        self.db_path = db_path
+        self.profile = profile
+        self.model = None
+
+    @Slot()
+    def open(self):
+        """Ouvre la base dans le thread du worker et relaie les signaux du modèle."""
+        start = time.perf_counter()
+        self.model = TaskModel(self.db_path, self.profile)
+        for name in MODEL_SIGNALS:
+            getattr(self.model, name).connect(getattr(self, name))
+        self.opened.emit(time.perf_counter() - start)
+
+    @Slot(int, str, object, object)
+    def run(self, request_id, method, args, kwargs):
+        """Exécute une méthode de TaskModel et renvoie son résultat par signal."""
+        try:
+            result = getattr(self.model, method)(*args, **kwargs)
+        except Exception as e:
+            self.failed.emit(request_id, str(e))
+            return
+        self.finished.emit(request_id, result)
+
+    @Slot()
+    def close(self):
+        """Ferme la connexion puis arrête la boucle d'événements du thread."""
+        if self.model:
+            self.model.db.close()
+            self.model = None
+        QThread.currentThread().quit()
+
+
+class DatabaseClient(TaskModelSignals):
+    """
+    Accès asynchrone à TaskModel depuis le thread de l'interface.
+    Chaque appel est transmis au DatabaseWorker ; le résultat revient par callback,
+    dans le thread de l'interface, sans jamais bloquer la boucle d'événements.
+    """
+
+    busy_changed = Signal(bool)  # True tant que des requêtes sont en cours
+    opened = Signal(float)  # la base est ouverte (durée d'ouverture en secondes)
+
+    _requested = Signal(int, str, object, object)
+    _close_requested = Signal()
+
+    def __init__(self, db_path="app_data.db", profile=None, parent=None):
+        super().__init__(parent)
+        self._callbacks = {}  # id de la requête -> (on_result, on_error)
+        self._visible = set()  # requêtes signalées par busy_changed (hors tâches de fond)
+        self._next_id = 0
+
+        self._thread = QThread()
+        self._thread.setObjectName("database")
+        self._worker = DatabaseWorker(db_path, profile)
+        self._worker.moveToThread(self._thread)
+
+        # Connexions inter-threads : les appels sont mis en file et exécutés dans l'ordre
+        self._thread.started.connect(self._worker.open)
+        self._requested.connect(self._worker.run)
+        self._close_requested.connect(self._worker.close)
+        self._worker.opened.connect(self.opened)
+        self._worker.finished.connect(self._on_finished)
+        self._worker.failed.connect(self._on_failed)
+        for name in MODEL_SIGNALS:
+            getattr(self._worker, name).connect(getattr(self, name))
+
+        self._thread.start()
+
+    def call(self, method: str, *args, on_result=None, on_error=None, background=False, **kwargs) -> int:
+        """
+        Demande l'exécution de TaskModel.<method>(*args, **kwargs) dans le thread de la base.
+        `on_result(résultat)` ou `on_error(message)` est appelé à la fin. Retourne l'id de la requête.
+        Une requête `background` (scrutation, maintenance) n'affiche pas d'indicateur de chargement.
+        """
+        self._next_id += 1
+        request_id = self._next_id
+        self._callbacks[request_id] = (on_result, on_error)
+        if not background:
+            self._visible.add(request_id)
+            if len(self._visible) == 1:
+                self.busy_changed.emit(True)
+        self._requested.emit(request_id, method, args, kwargs)
+        return request_id
+
+    def is_busy(self) -> bool:
+        return bool(self._callbacks)
+
+    def shutdown(self):
+        """Termine les requêtes en file, ferme la base et attend la fin du thread."""
+        if self._thread.isRunning():
+            self._close_requested.emit()
+            self._thread.wait()
+
+    def _pop_callbacks(self, request_id):
+        callbacks = self._callbacks.pop(request_id, (None, None))
+        if request_id in self._visible:
+            self._visible.discard(request_id)
+            if not self._visible:
+                self.busy_changed.emit(False)
+        return callbacks
+
+    def _on_finished(self, request_id, result):
+        on_result, _ = self._pop_callbacks(request_id)
+        if on_result:
+            on_result(result)
+
+    def _on_failed(self, request_id, message):
+        _, on_error = self._pop_callbacks(request_id)
+        if on_error:
+            on_error(message)
+        else:
+            print(f"Erreur base de données : {message}")
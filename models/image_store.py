@@ -0,0 +1,130 @@
+# models/image_store.py
+import glob
+import hashlib
+import os
+import threading
+import time
+
+from models.database import DatabaseManager
+
+
+# Chaque base a son propre magasin, à côté d'elle : <dossier de la base>/images/<nom de la base>/
+#   store/ab/abcdef….png        bannières rangées par hash de contenu
+#   cache/<hash>_<hauteur>.png  tailles pré-calculées (banner_cache)
+# Une même image attachée à plusieurs tâches n'est stockée qu'une fois ;
+# la table `images` de la base compte ses références (tenue à jour par triggers, voir database.py).
+# Les chemins enregistrés en base sont relatifs au dossier de la base, jamais au répertoire courant.
+IMAGE_DIR = "images"
+STORE_DIR = "store"
+CACHE_DIR = "cache"
+# Anciens fichiers, un par tâche : seule app_data.db, l'unique base des versions précédentes, les référence
+LEGACY_PATTERN = os.path.join(IMAGE_DIR, "task_*_banner.png")
+LEGACY_DATABASE = "app_data.db"
+
+GC_GRACE_SECONDS = 3600  # une image non référencée est conservée ce délai avant suppression
+GC_BATCH_SIZE = 100
+
+
+def file_hash(path: str) -> str:
+    """Hash SHA-1 du contenu d'un fichier."""
+    sha = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def stored_hash(path: str):
+    """Retourne le hash d'une image du magasin d'après son nom, sans lire le fichier."""
+    if os.path.basename(os.path.dirname(os.path.dirname(path))) == STORE_DIR:
+        return os.path.splitext(os.path.basename(path))[0]
+    return None
+
+
+class ImageStore:
+    """
+    Magasin d'images d'une base de données.
+    Les chemins manipulés (tasks.image_path, images.path) sont ceux enregistrés en base ;
+    resolve() donne le fichier correspondant, quel que soit le répertoire courant.
+    """
+
+    def __init__(self, db_path):
+        db_path = os.path.abspath(db_path)
+        self.db_path = db_path
+        self.base_dir = os.path.dirname(db_path)
+        self.root = os.path.join(IMAGE_DIR, os.path.splitext(os.path.basename(db_path))[0])
+        self.owns_legacy = os.path.basename(db_path) == LEGACY_DATABASE
+
+    def resolve(self, path: str) -> str:
+        """Chemin du fichier d'une image enregistrée en base (un chemin absolu est gardé tel quel)."""
+        return os.path.join(self.base_dir, path)
+
+    def store_path(self, digest: str) -> str:
+        return os.path.join(self.root, STORE_DIR, digest[:2], f"{digest}.png")
+
+    @property
+    def cache_dir(self) -> str:
+        return os.path.join(self.base_dir, self.root, CACHE_DIR)
+
+    def temp_path(self) -> str:
+        """Chemin temporaire dans le magasin (même système de fichiers : os.replace est atomique)."""
+        directory = self.resolve(os.path.join(self.root, STORE_DIR))
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{threading.get_ident()}_{time.monotonic_ns()}.tmp")
+
+    def add_file(self, tmp_path: str) -> str:
+        """
+        Range un fichier temporaire dans le magasin sous le nom de son hash et retourne son chemin en base.
+        Si le contenu existe déjà, le fichier est simplement remplacé par une copie identique.
+        Le fichier est rangé dans une transaction d'écriture qui re-date la ligne `images` de ce contenu
+        si elle est orpheline : le ramasse-miettes (qui efface ses fichiers dans sa propre transaction)
+        ne peut pas supprimer l'image entre son ajout ici et son enregistrement dans la tâche.
+        """
+        path = self.store_path(file_hash(tmp_path))
+        target = self.resolve(path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        db = DatabaseManager(self.db_path)
+        try:
+            with db.transaction():
+                db.execute(
+                    "UPDATE images SET orphaned_at = CURRENT_TIMESTAMP WHERE path = ? AND refcount = 0", (path,)
+                )
+                os.replace(tmp_path, target)
+        finally:
+            db.close()
+        return path
+
+    def remove_image(self, path: str):
+        """Supprime une image et ses tailles pré-calculées ; un fichier déjà absent est ignoré."""
+        from models.banner_cache import content_hash, rendition_path
+
+        target = self.resolve(path)
+        try:
+            digest = content_hash(target)
+        except OSError:
+            return
+        for rendition in glob.glob(rendition_path(glob.escape(self.cache_dir), digest, "*")):
+            os.remove(rendition)
+        try:
+            os.remove(target)
+        except FileNotFoundError:
+            pass
+
+    def stray_files(self, grace_seconds: int = GC_GRACE_SECONDS):
+        """
+        Parcourt les fichiers du magasin de cette base (et, pour app_data.db, les anciennes bannières)
+        plus vieux que grace_seconds, sous leur chemin en base. Sert à retrouver les fichiers
+        qu'aucune ligne de `images` ne référence (upload interrompu…).
+        """
+        limit = time.time() - grace_seconds
+        store = glob.escape(self.resolve(os.path.join(self.root, STORE_DIR)))
+        patterns = [os.path.join(store, "*.tmp"), os.path.join(store, "*", "*.png")]
+        if self.owns_legacy:
+            patterns.insert(0, os.path.join(glob.escape(self.base_dir), LEGACY_PATTERN))
+        for pattern in patterns:
+            for target in glob.iglob(pattern):
+                try:
+                    if os.path.getmtime(target) < limit:
+                        yield os.path.relpath(target, self.base_dir)
+                except OSError:
+                    continue
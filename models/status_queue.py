@@ -0,0 +1,63 @@
+# models/status_queue.py
+from PySide6.QtCore import QCoreApplication, QObject, QTimer
+
+
+class StatusWriteQueue(QObject):
+    """
+    File d'écriture différée des changements de statut.
+    Les vues sont mises à jour tout de suite (task_updated relayé par le DatabaseClient) ;
+    les changements d'une même tâche pendant FLUSH_DELAY_MS sont fusionnés, seul le dernier
+    est écrit, et tous sont enregistrés en une transaction (TaskModel.update_statuses).
+    Si l'écriture échoue, tasks_update_failed remet les vues sur les statuts enregistrés.
+    """
+
+    FLUSH_DELAY_MS = 500
+
+    def __init__(self, client, parent=None):
+        super().__init__(parent)
+        self.client = client
+        self._pending = {}  # id de la tâche -> dernier statut demandé
+
+        # Délai compté depuis le premier changement : des clics continus n'empêchent pas l'écriture
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.FLUSH_DELAY_MS)
+        self._timer.timeout.connect(self.flush)
+
+        client.tasks_update_failed.connect(self.on_update_failed)
+        # Rien n'est perdu à la fermeture : la file est écrite avant l'arrêt du thread de la base
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
+    def set_status(self, task_id: int, status: str):
+        """Affiche le nouveau statut et programme son écriture."""
+        self._pending[task_id] = status
+        self.client.task_updated.emit({"id": task_id, "status": status})
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def flush(self):
+        """Envoie les changements en attente au thread de la base, en un seul appel."""
+        self._timer.stop()
+        if not self._pending:
+            return
+        changes, self._pending = self._pending, {}
+        self.client.call("update_statuses", changes)
+
+    def on_update_failed(self, task_ids: list, message: str):
+        """Annule l'affichage optimiste : les vues reprennent les statuts enregistrés, relus en une requête."""
+        # Une tâche dont un statut plus récent est déjà en attente d'écriture garde celui-ci
+        task_ids = [task_id for task_id in task_ids if task_id not in self._pending]
+        if not task_ids:
+            return
+
+        def restore(tasks):
+            tasks = [task for task in tasks if task["id"] not in self._pending]
+            if tasks:
+                self.client.tasks_updated.emit(tasks)
+
+        self.client.call("get_statuses", task_ids, on_result=restore)
@@ -0,0 +1,399 @@
+# models/task_list_model.py
+import json
+
+from PySide6.QtCore import QAbstractListModel, QMimeData, QModelIndex, Qt, Signal
+
+
+class TaskListModel(QAbstractListModel):
+    """
+    Modèle Qt de la liste principale des tâches.
+    Ne conserve que les dictionnaires fournis par TaskModel : aucun widget n'est créé par ligne,
+    le rendu est assuré par TaskItemDelegate.
+    La source est un DatabaseClient : les pages sont demandées au thread de la base
+    et insérées à leur arrivée, sans bloquer l'interface.
+    Avec `status`, le modèle ne contient que les tâches de ce statut (colonne du tableau) :
+    ses tâches peuvent alors être glissées vers une autre colonne.
+    """
+
+    IdRole = Qt.UserRole + 1
+    StatusRole = Qt.UserRole + 2
+    TaskRole = Qt.UserRole + 3
+    CommentCountRole = Qt.UserRole + 4
+
+    status_edited = Signal(int, str)  # id, nouveau statut
+    tasks_dropped = Signal(list, str)  # tâches déposées dans la colonne, statut de la colonne
+    task_left = Signal(dict)  # tâche sortie de la colonne après un changement de statut
+
+    PAGE_SIZE = 200
+    MIME_TYPE = "application/x-task-list"
+
+    def __init__(self, source=None, parent=None, status: str = None):
+        super().__init__(parent)
+        self.source = None
+        self.status = status  # filtre de la colonne, None pour la liste principale
+        self._tasks = []  # triées par (created_at, id) décroissant
+        self._keys = {}  # id -> clé de tri, pour retrouver une ligne sans parcourir la liste
+        self._cursor = None  # clé de la dernière tâche chargée
+        self._exhausted = True
+        self._searching = False  # résultats de recherche, triés par pertinence
+        self._fetching = False  # une page est en cours de chargement
+        self._generation = 0  # incrémenté à chaque réinitialisation, pour ignorer les pages périmées
+        self.set_source(source)
+
+    def set_source(self, source):
+        """
+        Associe la source (DatabaseClient) qui alimente la liste.
+        Ses signaux sont appliqués ligne par ligne, sans rechargement complet.
+        """
+        if self.source is not None:
+            for signal, slot in self._subscriptions(self.source):
+                signal.disconnect(slot)
+
+        self.source = source
+        if source is not None:
+            for signal, slot in self._subscriptions(source):
+                signal.connect(slot)
+
+    def _subscriptions(self, source):
+        """Couples (signal du modèle métier, slot de la liste)."""
+        return [
+            (source.task_added, self.on_task_added),
+            (source.task_updated, self.on_task_updated),
+            (source.task_deleted, self.on_task_deleted),
+            (source.tasks_added, self.on_tasks_added),
+            (source.tasks_updated, self.on_tasks_updated),
+            (source.tasks_deleted, self.on_tasks_deleted),
+        ]
+
+    # --- API Qt ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._tasks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        task = self._tasks[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return task["title"]
+        if role == Qt.ToolTipRole:
+            return task.get("snippet") or task.get("description") or None
+        if role == self.IdRole:
+            return task["id"]
+        if role == self.StatusRole:
+            return task["status"]
+        if role == self.TaskRole:
+            return task
+        if role == self.CommentCountRole:
+            return task.get("comment_count") or 0
+        return None
+
+    def flags(self, index):
+        if self.status is not None:
+            # Colonne du tableau : on dépose sur la colonne, pas sur une tâche
+            if not index.isValid():
+                return Qt.ItemIsDropEnabled
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsDragEnabled
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Seul le statut est éditable directement depuis la liste."""
+        if not index.isValid() or role != self.StatusRole:
+            return False
+
+        task = self._tasks[index.row()]
+        if task["status"] == value:
+            return False
+
+        task["status"] = value
+        self.dataChanged.emit(index, index, [self.StatusRole])
+        self.status_edited.emit(task["id"], value)
+        return True
+
+    # --- Glisser-déposer entre colonnes ---
+
+    def supportedDragActions(self):
+        return Qt.MoveAction
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def mimeTypes(self):
+        return [self.MIME_TYPE]
+
+    def mimeData(self, indexes):
+        """Les tâches glissées voyagent entières : la colonne cible les affiche sans requête."""
+        mime = QMimeData()
+        tasks = [self._tasks[index.row()] for index in sorted(indexes, key=lambda index: index.row())]
+        mime.setData(self.MIME_TYPE, json.dumps(tasks).encode())
+        return mime
+
+    def canDropMimeData(self, data, action, row, column, parent):
+        return self.status is not None and data.hasFormat(self.MIME_TYPE)
+
+    def dropMimeData(self, data, action, row, column, parent):
+        """
+        Insère les tâches déposées avec le statut de la colonne et émet tasks_dropped.
+        La colonne d'origine n'a rien à retirer ensuite : tasks_dropped mène, de façon synchrone,
+        au task_updated optimiste de StatusWriteQueue.set_status, et son on_task_updated sort déjà
+        la ligne (task_left) avant le retour d'ici. Ne pas la retirer une seconde fois.
+        """
+        if not self.canDropMimeData(data, action, row, column, parent):
+            return False
+        tasks = [task for task in json.loads(bytes(data.data(self.MIME_TYPE))) if task["status"] != self.status]
+        if not tasks:
+            return False  # déposées dans leur propre colonne
+
+        for task in tasks:
+            task["status"] = self.status
+        self.on_tasks_added(tasks)
+        self.tasks_dropped.emit(tasks, self.status)
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        """
+        Retire des lignes de l'affichage seulement.
+        Après un déplacement (MoveAction), la vue appelle removeRows sur les lignes encore sélectionnées
+        de la colonne d'origine : la carte déplacée en est déjà sortie (voir dropMimeData), avec sa
+        sélection, donc cet appel ne retire rien de plus.
+        """
+        if parent.isValid() or row < 0 or row + count > len(self._tasks):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        for task in self._tasks[row:row + count]:
+            del self._keys[task["id"]]
+        del self._tasks[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return not self._exhausted and not self._fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Demande la page suivante, appelée par la vue quand on approche du bas de la liste."""
+        if parent.isValid() or self._exhausted or self._fetching:
+            return
+
+        self._fetching = True
+        generation = self._generation
+        self.source.call(
+            "get_tasks_page", after=self._cursor, limit=self.PAGE_SIZE, status=self.status,
+            on_result=lambda page: self.append_page(generation, page),
+            on_error=lambda message: self.page_failed(generation, message),
+        )
+
+    def page_failed(self, generation, message):
+        if generation != self._generation:
+            return
+        self._fetching = False
+        self._exhausted = True  # pas de nouvelle tentative en boucle
+        print(f"Erreur lors du chargement des tâches : {message}")
+
+    def append_page(self, generation, page):
+        """Ajoute en bas de la liste une page reçue du thread de la base."""
+        if generation != self._generation:
+            return  # la liste a été réinitialisée depuis la demande
+
+        self._fetching = False
+        self._exhausted = len(page) < self.PAGE_SIZE
+        if not page:
+            return
+
+        self._cursor = self.sort_key(page[-1])
+        # Une tâche déjà insérée via task_added ne doit pas apparaître deux fois
+        page = [task for task in page if task["id"] not in self._keys]
+        if not page:
+            return
+
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._tasks.extend(page)
+        for task in page:
+            self._keys[task["id"]] = self.sort_key(task)
+        self.endInsertRows()
+
+    # --- Chargement ---
+
+    def _reset(self, tasks, exhausted, searching):
+        self.beginResetModel()
+        self._generation += 1
+        self._tasks = tasks
+        self._keys = {task["id"]: self.sort_key(task) for task in tasks}
+        self._cursor = None
+        self._exhausted = exhausted
+        self._searching = searching
+        self._fetching = False
+        self.endResetModel()
+
+    def reload(self):
+        """Repart de la première page ; les suivantes sont chargées à la demande (fetchMore)."""
+        self._reset([], exhausted=self.source is None, searching=False)
+        self.fetchMore()
+
+    def clear(self):
+        """Vide la liste."""
+        self._reset([], exhausted=True, searching=False)
+
+    def show_search_results(self, tasks: list):
+        """Affiche des résultats de recherche, dans leur ordre de pertinence."""
+        self._reset(tasks, exhausted=True, searching=True)
+
+    def is_searching(self):
+        return self._searching
+
+    def task_at(self, row: int):
+        """Retourne le dictionnaire de la tâche affichée à la ligne donnée."""
+        return self._tasks[row]
+
+    def task_ids(self, rows):
+        """Retourne les ids des tâches affichées aux lignes données."""
+        return [self._tasks[row]["id"] for row in rows]
+
+    # --- Mises à jour incrémentales ---
+
+    @staticmethod
+    def sort_key(task: dict):
+        """Clé de tri de la liste : (created_at, id), parcourue en ordre décroissant."""
+        return (task.get("created_at") or "", task["id"])
+
+    def _bisect(self, key):
+        """Indice de la première ligne dont la clé est inférieure ou égale à key (recherche binaire)."""
+        low, high = 0, len(self._tasks)
+        while low < high:
+            middle = (low + high) // 2
+            if self.sort_key(self._tasks[middle]) > key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def row_of(self, task_id: int):
+        """Retourne la ligne d'une tâche, ou -1 si elle n'est pas affichée."""
+        key = self._keys.get(task_id)
+        if key is None:
+            return -1
+        if self._searching:
+            # Quelques dizaines de résultats, non triés par date : recherche linéaire
+            return next(row for row, task in enumerate(self._tasks) if task["id"] == task_id)
+        row = self._bisect(key)
+        if row < len(self._tasks) and self._tasks[row]["id"] == task_id:
+            return row
+        return -1
+
+    def accepts(self, task: dict):
+        """Indique si une tâche a sa place dans ce modèle (statut de la colonne)."""
+        return self.status is None or task.get("status") == self.status
+
+    def insert_task(self, task: dict):
+        """Insère une tâche à sa place dans l'ordre de tri."""
+        if task["id"] in self._keys:
+            self.on_task_updated(task)
+            return
+        if self._searching or not self.accepts(task):
+            return
+
+        key = self.sort_key(task)
+        if not self._exhausted and self._cursor is not None and key < self._cursor:
+            # Plus ancienne que la dernière page chargée : elle arrivera avec fetchMore
+            return
+
+        row = self._bisect(key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tasks.insert(row, dict(task))
+        self._keys[task["id"]] = key
+        self.endInsertRows()
+
+    def on_task_added(self, task: dict):
+        self.insert_task(task)
+
+    def on_task_updated(self, task: dict):
+        """
+        Fusionne les champs modifiés dans la ligne existante.
+        Dans une colonne, une tâche qui change de statut en sort (task_left, avec la ligne
+        complète) ; elle y entre si la modification est une ligne complète du bon statut.
+        """
+        row = self.row_of(task["id"])
+        if row < 0:
+            if self.status is not None and "created_at" in task and self.accepts(task):
+                self.insert_task(task)
+            return
+
+        self._tasks[row].update(task)
+        if not self.accepts(self._tasks[row]):
+            task = self._tasks[row]
+            self.removeRows(row, 1)
+            self.task_left.emit(task)
+            return
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
+    def on_task_deleted(self, task_id: int):
+        row = self.row_of(task_id)
+        if row < 0:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tasks[row]
+        del self._keys[task_id]
+        self.endRemoveRows()
+
+    # --- Mises à jour groupées (un signal par lot) ---
+
+    def on_tasks_added(self, tasks: list):
+        """Insère un lot de tâches, par blocs contigus plutôt que ligne par ligne."""
+        groups = {}
+        for task in sorted(tasks, key=self.sort_key, reverse=True):
+            key = self.sort_key(task)
+            if task["id"] in self._keys:
+                self.on_task_updated(task)
+            elif self._searching or not self.accepts(task):
+                continue
+            elif self._exhausted or self._cursor is None or key > self._cursor:
+                groups.setdefault(self._bisect(key), []).append(task)
+
+        # Du bas vers le haut : les positions restant à traiter ne bougent pas
+        for row in sorted(groups, reverse=True):
+            block = [dict(task) for task in groups[row]]
+            self.beginInsertRows(QModelIndex(), row, row + len(block) - 1)
+            self._tasks[row:row] = block
+            for task in block:
+                self._keys[task["id"]] = self.sort_key(task)
+            self.endInsertRows()
+
+    def on_tasks_updated(self, tasks: list):
+        """Fusionne un lot de modifications et notifie la vue en une fois."""
+        if self.status is not None:
+            # Des tâches peuvent sortir de la colonne : traitées une par une
+            for task in tasks:
+                self.on_task_updated(task)
+            return
+
+        rows = []
+        for task in tasks:
+            row = self.row_of(task["id"])
+            if row >= 0:
+                self._tasks[row].update(task)
+                rows.append(row)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0))
+
+    def on_tasks_deleted(self, task_ids: list):
+        """Retire un lot de tâches, par plages de lignes contiguës."""
+        rows = sorted((row for row in map(self.row_of, task_ids) if row >= 0), reverse=True)
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for task in self._tasks[first:last + 1]:
+                del self._keys[task["id"]]
+            del self._tasks[first:last + 1]
+            self.endRemoveRows()
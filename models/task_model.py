@@ -1,9 +1,111 @@
 # models/task_model.py
 from PySide6.QtCore import QObject, Signal
-from models.database import DatabaseManager
+from models.database import DatabaseManager, SUPPORTS_RETURNING
+from models import image_store
 import sqlite3
 
 
+STATUSES = ("À faire", "En cours", "Terminée")
+EDITABLE_FIELDS = ("title", "description", "status", "image_path")  # colonnes modifiables par update_task_details
+
+# Tout changement de statut date la tâche (updated_at)
+STATUS_UPDATE_QUERY = "UPDATE tasks SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+
+FIRST_PAGE_QUERY = "SELECT * FROM tasks ORDER BY created_at DESC, id DESC LIMIT ?"
+NEXT_PAGE_QUERY = (
+    "SELECT * FROM tasks WHERE (created_at, id) < (?, ?) "
+    "ORDER BY created_at DESC, id DESC LIMIT ?"
+)
+
+# Mêmes pages, limitées à un statut (colonnes du tableau) : index (status, created_at, id)
+STATUS_FIRST_PAGE_QUERY = "SELECT * FROM tasks WHERE status = ? ORDER BY created_at DESC, id DESC LIMIT ?"
+STATUS_NEXT_PAGE_QUERY = (
+    "SELECT * FROM tasks WHERE status = ? AND (created_at, id) < (?, ?) "
+    "ORDER BY created_at DESC, id DESC LIMIT ?"
+)
+COUNT_BY_STATUS_QUERY = "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+
+# Commentaires d'une tâche, du plus ancien au plus récent, par pages (index task_id, created_at, id)
+COMMENTS_FIRST_PAGE_QUERY = "SELECT * FROM comments WHERE task_id = ? ORDER BY created_at, id LIMIT ?"
+COMMENTS_NEXT_PAGE_QUERY = (
+    "SELECT * FROM comments WHERE task_id = ? AND (created_at, id) > (?, ?) "
+    "ORDER BY created_at, id LIMIT ?"
+)
+
+# Recherche plein texte : meilleur résultat par tâche entre son titre/description et ses commentaires.
+# Le classement bm25 ne porte que sur les :window correspondances les plus récentes de chaque index
+# (borne basse sur le rowid, exploitée par FTS5) : un mot très courant ne fait pas classer toute la base.
+SEARCH_QUERY = """
+    SELECT t.*, hit.snippet, hit.rank FROM (
+        SELECT task_id, MIN(rank) AS rank, snippet FROM (
+            SELECT * FROM (
+                SELECT rowid AS task_id, bm25(tasks_fts, 10.0, 1.0) AS rank,
+                       snippet(tasks_fts, -1, '[', ']', '…', 12) AS snippet
+                FROM tasks_fts
+                WHERE tasks_fts MATCH :match AND rowid >= (
+                    SELECT MIN(rowid) FROM (
+                        SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH :match
+                        ORDER BY rowid DESC LIMIT :window
+                    )
+                )
+                ORDER BY rank LIMIT :limit
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT task_id, bm25(comments_fts) AS rank,
+                       snippet(comments_fts, 0, '[', ']', '…', 12) AS snippet
+                FROM comments_fts
+                WHERE comments_fts MATCH :match AND rowid >= (
+                    SELECT MIN(rowid) FROM (
+                        SELECT rowid FROM comments_fts WHERE comments_fts MATCH :match
+                        ORDER BY rowid DESC LIMIT :window
+                    )
+                )
+                ORDER BY rank LIMIT :limit * 4
+            )
+        ) GROUP BY task_id
+    ) AS hit
+    JOIN tasks t ON t.id = hit.task_id
+    ORDER BY hit.rank
+    LIMIT :limit
+"""
+
+# Vrai si l'un des index a plus de :window correspondances : les plus anciennes n'ont pas été classées.
+# Seuls les rowid des :window + 1 premières correspondances sont lus, sans calcul de bm25 ni d'extrait.
+SEARCH_TRUNCATED_QUERY = """
+    SELECT (SELECT COUNT(*) FROM (SELECT 1 FROM tasks_fts WHERE tasks_fts MATCH :match LIMIT :window + 1)) > :window
+        OR (SELECT COUNT(*) FROM (SELECT 1 FROM comments_fts WHERE comments_fts MATCH :match LIMIT :window + 1)) > :window
+"""
+
+# Images du magasin qui ne sont plus référencées depuis le délai de grâce
+ORPHAN_IMAGES_QUERY = (
+    "SELECT path FROM images WHERE refcount = 0 AND orphaned_at <= datetime('now', ?) LIMIT ?"
+)
+
+# Entrées du journal postérieures au dernier numéro vu (parcours de la clé primaire),
+# hors celles que cette connexion a écrites (table temporaire own_changes)
+CHANGES_QUERY = (
+    "SELECT seq, task_id, op FROM changes WHERE seq > ? "
+    "AND NOT EXISTS (SELECT 1 FROM temp.own_changes AS own WHERE own.seq = changes.seq) "
+    "ORDER BY seq LIMIT ?"
+)
+
+# Requêtes les plus fréquentes de l'application : chacune doit être servie par un index
+HOT_QUERIES = {
+    "list_first_page": (FIRST_PAGE_QUERY, (200,)),
+    "list_next_page": (NEXT_PAGE_QUERY, ("2000-01-01 00:00:00", 0, 200)),
+    "task_by_id": ("SELECT * FROM tasks WHERE id = ?", (1,)),
+    "status_first_page": (STATUS_FIRST_PAGE_QUERY, ("À faire", 200)),
+    "status_next_page": (STATUS_NEXT_PAGE_QUERY, ("À faire", "2000-01-01 00:00:00", 0, 200)),
+    "count_by_status": (COUNT_BY_STATUS_QUERY, ()),
+    "comments_of_task": ("SELECT id FROM comments WHERE task_id = ?", (1,)),
+    "comments_first_page": (COMMENTS_FIRST_PAGE_QUERY, (1, 50)),
+    "comments_next_page": (COMMENTS_NEXT_PAGE_QUERY, (1, "2000-01-01 00:00:00", 0, 50)),
+    "orphan_images": (ORPHAN_IMAGES_QUERY, ("-3600 seconds", 100)),
+    "changes_since": (CHANGES_QUERY, (0, 500)),
+}
+
+
 class TaskModel(QObject):
     """
     Modèle métier des tâches.
@@ -14,48 +116,147 @@ class TaskModel(QObject):
     task_updated = Signal(dict)
     task_deleted = Signal(int)
     task_update_failed = Signal(int, str) 
+    # Opérations groupées : un seul signal par lot
+    tasks_added = Signal(list)
+    tasks_updated = Signal(list)
+    tasks_deleted = Signal(list)
+    tasks_update_failed = Signal(list, str)  # ids du lot, message d'erreur
+    comment_added = Signal(dict)
+    comment_deleted = Signal(int)  # id du commentaire
 
-    
+    SEARCH_WINDOW = 2000  # correspondances récentes classées par la recherche plein texte
+    CHANGES_BATCH = 500  # entrées du journal lues par requête
+    CHANGE_LOG_KEEP = 10_000  # entrées conservées par prune_changes
 
-    def __init__(self, db_path="app_data.db"):
+    def __init__(self, db_path="app_data.db", profile=None):
         super().__init__()
-        self.db = DatabaseManager(db_path)
+        self.db = DatabaseManager(db_path, profile)
+        self.images = image_store.ImageStore(db_path)  # magasin d'images de cette base, à côté d'elle
+        # Les données lues à partir d'ici sont à jour : seuls les changements suivants comptent
+        self.change_seq = self.db.last_change()
+        self.data_version = self.db.data_version()
 
     # --- CRUD ---
 
     def create_task(self, title: str, description: str = "", status: str = "À faire"):
-        """Crée une nouvelle tâche et émet un signal."""
-        self.db.execute(
-            "INSERT INTO tasks (title, description, status) VALUES (?, ?, ?)",
-            (title, description, status),
-        )
-        new_task = self.db.execute(
-            "SELECT * FROM tasks ORDER BY id DESC LIMIT 1", fetchone=True
-        )
+        """
+        Crée une nouvelle tâche et émet un signal.
+        La ligne insérée (valeurs par défaut comprises, comme created_at) est relue par
+        INSERT ... RETURNING, ou à défaut par son lastrowid : jamais la tâche d'un autre écrivain.
+        """
+        params = (title, description, status)
+        with self.db.transaction():
+            if SUPPORTS_RETURNING:
+                new_task = self.db.execute(
+                    "INSERT INTO tasks (title, description, status) VALUES (?, ?, ?) RETURNING *",
+                    params, fetchone=True
+                )
+            else:
+                cursor = self.db.connection.execute(
+                    "INSERT INTO tasks (title, description, status) VALUES (?, ?, ?)", params
+                )
+                new_task = self.db.query_one("SELECT * FROM tasks WHERE id=?", (cursor.lastrowid,))
         if new_task:
             task_data = dict(new_task)
             self.task_added.emit(task_data)
             return task_data
 
+    def create_tasks(self, tasks: list):
+        """
+        Crée plusieurs tâches en une seule transaction.
+        `tasks` est une liste de dictionnaires (title, description, status optionnels).
+        """
+        rows = [
+            (task["title"], task.get("description", ""), task.get("status", "À faire"))
+            for task in tasks
+        ]
+        if not rows:
+            return []
+
+        with self.db.transaction():
+            # BEGIN IMMEDIATE : aucun autre écrivain ne peut intercaler d'id pendant le lot
+            last_id = self.db.query_one("SELECT COALESCE(MAX(id), 0) FROM tasks")[0]
+            self.db.connection.executemany(
+                "INSERT INTO tasks (title, description, status) VALUES (?, ?, ?)", rows
+            )
+            created = [
+                dict(row) for row in self.db.query_all("SELECT * FROM tasks WHERE id > ? ORDER BY id", (last_id,))
+            ]
+        self.tasks_added.emit(created)
+        return created
+
     def get_all_tasks(self):
         """Retourne la liste complète des tâches."""
-        rows = self.db.execute(
-            "SELECT * FROM tasks ORDER BY created_at DESC", fetchall=True
-        )
+        rows = self.db.query_all("SELECT * FROM tasks ORDER BY created_at DESC, id DESC")
         return [dict(row) for row in rows]
 
+    def get_tasks_page(self, after=None, limit: int = 200, status: str = None):
+        """
+        Retourne une page de tâches triées par date de création décroissante.
+        `after` est le curseur (created_at, id) de la dernière tâche de la page précédente :
+        la requête reprend juste après lui au lieu de sauter N lignes avec OFFSET.
+        Avec `status`, seules les tâches de ce statut sont retournées (colonnes du tableau).
+        """
+        if status is None:
+            if after is None:
+                rows = self.db.query_all(FIRST_PAGE_QUERY, (limit,))
+            else:
+                rows = self.db.query_all(NEXT_PAGE_QUERY, (after[0], after[1], limit))
+        elif after is None:
+            rows = self.db.query_all(STATUS_FIRST_PAGE_QUERY, (status, limit))
+        else:
+            rows = self.db.query_all(STATUS_NEXT_PAGE_QUERY, (status, after[0], after[1], limit))
+        return [dict(row) for row in rows]
+
+    def count_by_status(self):
+        """Retourne {statut: nombre de tâches}, en une requête servie par l'index des statuts."""
+        counts = dict.fromkeys(STATUSES, 0)
+        counts.update((status, count) for status, count in self.db.query_all(COUNT_BY_STATUS_QUERY))
+        return counts
+
+    @staticmethod
+    def fts_query(text: str):
+        """
+        Transforme la saisie de l'utilisateur en requête FTS5.
+        Seul le dernier mot, en cours de frappe, est cherché comme préfixe : les autres sont
+        des termes exacts, bien moins coûteux à résoudre qu'une fusion de tous les termes préfixés.
+        """
+        words = [word.replace('"', "") for word in text.split()]
+        terms = [f'"{word}"' for word in words if word]
+        if terms and not text[-1].isspace():
+            terms[-1] += "*"
+        return " ".join(terms)
+
+    def search(self, query: str, limit: int = 50):
+        """
+        Recherche plein texte dans les titres, descriptions et commentaires.
+        Retourne les tâches classées par pertinence (bm25), avec un extrait `snippet`.
+        Seules les SEARCH_WINDOW correspondances les plus récentes de chaque index sont classées
+        (voir search_truncated).
+        """
+        match = self.fts_query(query)
+        if not match:
+            return []
+        rows = self.db.query_all(SEARCH_QUERY, {"match": match, "window": self.SEARCH_WINDOW, "limit": limit})
+        return [dict(row) for row in rows]
+
+    def search_truncated(self, query: str) -> bool:
+        """Indique si des correspondances plus anciennes que SEARCH_WINDOW ont été écartées par search()."""
+        match = self.fts_query(query)
+        if not match:
+            return False
+        return bool(self.db.query_one(SEARCH_TRUNCATED_QUERY, {"match": match, "window": self.SEARCH_WINDOW})[0])
+
     def get_task_by_id(self, task_id: int):
         """Récupère une tâche par son ID."""
-        row = self.db.execute(
-            "SELECT * FROM tasks WHERE id=?", (task_id,), fetchone=True
-        )
+        row = self.db.query_one("SELECT * FROM tasks WHERE id=?", (task_id,))
         return dict(row) if row else None
    
     def get_task(self, task_id: int):
         """Récupère une tâche par son ID."""
         query = "SELECT id, title, description, status, image_path FROM tasks WHERE id = ?"
 
-        row = self.db.execute(query, (task_id,), fetchone=True)
+        row = self.db.query_one(query, (task_id,))
         if row:
             return {
                 "id": row[0],
@@ -68,33 +269,261 @@ class TaskModel(QObject):
     
    
     def delete_task(self, task_id: int):
-        """Supprime une tâche et émet un signal."""
-        self.db.execute("DELETE FROM tasks WHERE id=?", (task_id,))
+        """Supprime une tâche (et ses commentaires, par cascade) et émet un signal."""
+        with self.db.transaction():
+            self.db.execute("DELETE FROM tasks WHERE id=?", (task_id,))
         self.task_deleted.emit(task_id)
 
+    def delete_tasks(self, task_ids: list):
+        """Supprime plusieurs tâches en une seule transaction."""
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+        with self.db.transaction():
+            self.db.connection.executemany("DELETE FROM tasks WHERE id=?", [(task_id,) for task_id in task_ids])
+        self.tasks_deleted.emit(task_ids)
+
     def update_task_details(self, task):
+        """
+        Met à jour les champs présents dans `task` (en plus de son id) et updated_at.
+        Seules ces colonnes sont écrites, et la ligne n'est réécrite que si l'une d'elles change
+        réellement : une description inchangée n'est ni recopiée ni réindexée (trigger FTS).
+        Retourne les champs enregistrés ({} si rien n'a changé), ou None en cas d'échec.
+        """
+        changes = {field: task[field] for field in EDITABLE_FIELDS if field in task}
+        if not changes:
+            return {}  # rien à écrire : aucune requête
         try:
-            fields = ["title", "description", "status"]
-            params = [task.get(field) for field in fields]
-
-            if "image_path" in task:
-                fields.append("image_path")
-                params.append(task["image_path"])
-
-            set_clause = ", ".join([f"{field} = ?" for field in fields])
-            query = f"UPDATE tasks SET {set_clause} WHERE id = ?"
-            params.append(task["id"])
-
-            self.db.execute(query, params)
-            self.task_updated.emit(task)  # Succès → notifie les vues
+            set_clause = ", ".join(f"{field} = ?" for field in changes)
+            unchanged = " AND ".join(f"{field} IS ?" for field in changes)
+            query = f"UPDATE tasks SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ? AND NOT ({unchanged})"
+            values = list(changes.values())
 
+            with self.db.transaction():
+                written = self.db.connection.execute(query, [*values, task["id"], *values]).rowcount
         except sqlite3.Error as e:
             print(f"Erreur SQL : {e}")
             self.task_update_failed.emit(task["id"], str(e))  # Échec → notifie l'erreur
+            return None
+
+        if written:
+            self.task_updated.emit({"id": task["id"], **changes})  # Succès → notifie les vues
+            return changes
+        return {}
 
 
 
+    def check_query_plans(self):
+        """
+        Vérifie avec EXPLAIN QUERY PLAN que les requêtes chaudes utilisent un index.
+        Retourne {nom: plan} pour chaque requête qui parcourt une table entière
+        ou trie en mémoire ; un dictionnaire vide signifie que tout est indexé.
+        """
+        problems = {}
+        for name, (query, params) in HOT_QUERIES.items():
+            plan = self.db.explain(query, params)
+            if any(
+                (step.startswith("SCAN") and "INDEX" not in step) or "TEMP B-TREE" in step
+                for step in plan
+            ):
+                problems[name] = plan
+        return problems
+
     def update_status(self, task_id, status):
-        self.db.execute("UPDATE tasks SET status=? WHERE id=?", (status, task_id))
+        with self.db.transaction():
+            self.db.execute(STATUS_UPDATE_QUERY, (status, task_id))
+        self.task_updated.emit({"id": task_id, "status": status})
+
+    def update_status_many(self, task_ids: list, status: str):
+        """Change le statut de plusieurs tâches en une seule transaction."""
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+        with self.db.transaction():
+            self.db.connection.executemany(
+                STATUS_UPDATE_QUERY, [(status, task_id) for task_id in task_ids]
+            )
+        self.tasks_updated.emit([{"id": task_id, "status": status} for task_id in task_ids])
+
+    def update_statuses(self, changes: dict):
+        """
+        Applique plusieurs changements de statut {id: statut} en une seule transaction.
+        En cas d'échec rien n'est écrit et tasks_update_failed est émis une fois pour tout le lot.
+        """
+        updates = [{"id": task_id, "status": status} for task_id, status in changes.items()]
+        if not updates:
+            return []
+        try:
+            with self.db.transaction():
+                self.db.connection.executemany(
+                    STATUS_UPDATE_QUERY, [(task["status"], task["id"]) for task in updates]
+                )
+        except sqlite3.Error as e:
+            self.tasks_update_failed.emit([task["id"] for task in updates], str(e))
+            return []
+        self.tasks_updated.emit(updates)
+        return updates
+
+    def get_statuses(self, task_ids: list):
+        """Statuts enregistrés de plusieurs tâches, en une requête : [{"id", "status"}]."""
+        task_ids = list(task_ids)
+        if not task_ids:
+            return []
+        rows = self.db.query_all(
+            f"SELECT id, status FROM tasks WHERE id IN ({', '.join('?' * len(task_ids))})", task_ids
+        )
+        return [dict(row) for row in rows]
+
+    # --- Modifications des autres instances ---
+
+    def poll_changes(self):
+        """
+        Émet les modifications écrites par d'autres instances depuis l'appel précédent.
+        PRAGMA data_version ne change qu'après le commit d'une autre connexion : sinon rien n'est lu.
+        Seules les entrées du journal `changes` postérieures au dernier numéro vu sont parcourues,
+        nos propres écritures exclues ; les tâches concernées sont relues par id, une fois chacune.
+        Retourne False si le journal a été purgé au-delà de ce numéro : tout est à recharger.
+        """
+        last = self.db.last_change()
+        version = self.db.data_version()
+        if version == self.data_version:
+            # Aucune autre connexion n'a écrit : les nouvelles entrées sont toutes les nôtres
+            self.skip_changes(last)
+            return True
+        self.data_version = version
+
+        oldest = self.db.query_one("SELECT MIN(seq) FROM changes")[0]
+        if oldest is not None and oldest > self.change_seq + 1:
+            self.skip_changes(last)
+            return False
+
+        inserted, last_op = set(), {}
+        seen = self.change_seq
+        while rows := self.db.query_all(CHANGES_QUERY, (seen, self.CHANGES_BATCH)):
+            for seq, task_id, op in rows:
+                if op == "insert":
+                    inserted.add(task_id)
+                last_op[task_id] = op
+            seen = rows[-1]["seq"]
+        self.skip_changes(max(seen, last))
+
+        # Une tâche créée puis supprimée entre deux appels n'a jamais été affichée ici
+        deleted = [task_id for task_id, op in last_op.items() if op == "delete" and task_id not in inserted]
+        alive = [task_id for task_id, op in last_op.items() if op != "delete"]
+        tasks = {}
+        for i in range(0, len(alive), self.CHANGES_BATCH):
+            chunk = alive[i:i + self.CHANGES_BATCH]
+            query = f"SELECT * FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})"
+            tasks.update((row["id"], dict(row)) for row in self.db.query_all(query, chunk))
+
+        added = [tasks[task_id] for task_id in alive if task_id in tasks and task_id in inserted]
+        updated = [tasks[task_id] for task_id in alive if task_id in tasks and task_id not in inserted]
+        if added:
+            self.tasks_added.emit(added)
+        if updated:
+            self.tasks_updated.emit(updated)
+        if deleted:
+            self.tasks_deleted.emit(deleted)
+        return True
+
+    def skip_changes(self, seq: int):
+        """Avance le dernier numéro vu ; nos entrées jusqu'à lui n'ont plus à être écartées."""
+        if seq == self.change_seq:
+            return  # journal inchangé : rien de nouveau dans own_changes non plus
+        self.change_seq = seq
+        self.db.execute("DELETE FROM temp.own_changes WHERE seq <= ?", (seq,))
+
+    def prune_changes(self, keep: int = CHANGE_LOG_KEEP) -> int:
+        """
+        Ne garde que les `keep` dernières entrées du journal ; retourne le nombre supprimé.
+        La dernière entrée est toujours conservée : c'est elle qui garantit des numéros croissants.
+        """
+        with self.db.transaction():
+            removed = self.db.connection.execute(
+                "DELETE FROM changes WHERE seq <= (SELECT MAX(seq) FROM changes) - ?", (max(1, keep),)
+            ).rowcount
+        return removed
+
+    # --- Commentaires ---
+
+    def get_comments_page(self, task_id: int, after=None, limit: int = 50):
+        """
+        Retourne une page de commentaires d'une tâche, du plus ancien au plus récent.
+        `after` est le curseur (created_at, id) du dernier commentaire de la page précédente.
+        """
+        if after is None:
+            rows = self.db.query_all(COMMENTS_FIRST_PAGE_QUERY, (task_id, limit))
+        else:
+            rows = self.db.query_all(COMMENTS_NEXT_PAGE_QUERY, (task_id, after[0], after[1], limit))
+        return [dict(row) for row in rows]
+
+    def add_comment(self, task_id: int, content: str):
+        """
+        Ajoute un commentaire à une tâche et émet comment_added.
+        Le compteur tasks.comment_count, mis à jour par trigger, est relayé par task_updated.
+        """
+        with self.db.transaction():
+            cursor = self.db.connection.execute(
+                "INSERT INTO comments (task_id, content) VALUES (?, ?)", (task_id, content)
+            )
+            comment = dict(self.db.query_one("SELECT * FROM comments WHERE id = ?", (cursor.lastrowid,)))
+            count = self.db.query_one("SELECT comment_count FROM tasks WHERE id = ?", (task_id,))[0]
+        self.comment_added.emit(comment)
+        self.task_updated.emit({"id": task_id, "comment_count": count})
+        return comment
+
+    def delete_comment(self, comment_id: int):
+        """Supprime un commentaire et émet comment_deleted."""
+        with self.db.transaction():
+            row = self.db.query_one("SELECT task_id FROM comments WHERE id = ?", (comment_id,))
+            if row is None:
+                return
+            self.db.execute("DELETE FROM comments WHERE id = ?", (comment_id,))
+            count = self.db.query_one("SELECT comment_count FROM tasks WHERE id = ?", (row["task_id"],))[0]
+        self.comment_deleted.emit(comment_id)
+        self.task_updated.emit({"id": row["task_id"], "comment_count": count})
+
+    # Ramasse-miettes du magasin d'images
 
+    def collect_image_garbage(self, grace_seconds: int = image_store.GC_GRACE_SECONDS,
+                              batch_size: int = image_store.GC_BATCH_SIZE) -> int:
+        """
+        Supprime un lot d'images sans référence depuis plus de grace_seconds.
+        Retourne le nombre d'images supprimées : un lot plein signifie qu'il en reste.
+        """
+        params = (f"-{grace_seconds} seconds", batch_size)
+        # Sélection, suppression des lignes et des fichiers dans la même transaction d'écriture :
+        # une image de nouveau référencée entre-temps (autre instance) n'est pas touchée, seuls les
+        # fichiers dont la ligne a réellement été supprimée sont effacés, et un nouvel upload du même
+        # contenu (ImageStore.add_file, qui re-date la ligne dans sa propre transaction) passe avant
+        # ou après le lot, jamais entre la suppression de la ligne et celle du fichier.
+        with self.db.transaction():
+            if SUPPORTS_RETURNING:
+                rows = self.db.query_all(
+                    f"DELETE FROM images WHERE path IN ({ORPHAN_IMAGES_QUERY}) RETURNING path", params
+                )
+            else:
+                # BEGIN IMMEDIATE : aucun autre écrivain entre la sélection et la suppression
+                rows = self.db.query_all(ORPHAN_IMAGES_QUERY, params)
+                self.db.connection.executemany(
+                    "DELETE FROM images WHERE path = ?", [(row["path"],) for row in rows]
+                )
+            paths = [row["path"] for row in rows]
+            # Si la validation échouait ensuite, la ligne orpheline resterait sans fichier :
+            # le passage suivant la supprime (un fichier absent est ignoré)
+            for path in paths:
+                self.images.remove_image(path)
+        return len(paths)
 
+    def sweep_stray_images(self, grace_seconds: int = image_store.GC_GRACE_SECONDS) -> int:
+        """
+        Supprime les fichiers du magasin qu'aucune ligne de `images` ne connaît
+        (upload interrompu, anciennes bannières de tâches supprimées). Retourne leur nombre.
+        Seul le magasin de cette base est parcouru : celui d'une autre base n'est jamais touché.
+        """
+        removed = 0
+        for path in self.images.stray_files(grace_seconds):
+            if not self.db.query_one("SELECT 1 FROM images WHERE path = ?", (path,)):
+                self.images.remove_image(path)
+                removed += 1
+        return removed
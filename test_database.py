@@ -0,0 +1,364 @@
+# test_database.py
+import os
+import sqlite3
+
+import pytest
+
+from models.database import ConnectionProfile, DatabaseManager, SCHEMA_VERSION
+from models import image_store
+from models.task_model import TaskModel
+
+
+def test_fresh_database_is_fully_migrated(tmp_path):
+    db = DatabaseManager(tmp_path / "fresh.db")
+
+    assert db.schema_version() == SCHEMA_VERSION
+    columns = {row["name"] for row in db.connection.execute("PRAGMA table_info(tasks)")}
+    assert "image_path" in columns
+    indexes = {row["name"] for row in db.connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_tasks_created_at", "idx_tasks_status", "idx_comments_task_id"} <= indexes
+
+
+def test_legacy_database_is_upgraded_in_place(tmp_path):
+    path = tmp_path / "legacy.db"
+    legacy = sqlite3.connect(path)
+    legacy.execute(
+        "CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, description TEXT, "
+        "status TEXT DEFAULT 'À faire', created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+        "updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    legacy.execute("INSERT INTO tasks (title) VALUES ('Ancienne tâche')")
+    legacy.commit()
+    legacy.close()
+
+    model = TaskModel(path)
+    task_id = model.get_all_tasks()[0]["id"]
+
+    assert model.db.schema_version() == SCHEMA_VERSION
+    assert model.get_task(task_id) == {
+        "id": task_id, "title": "Ancienne tâche", "description": None, "status": "À faire", "image_path": None
+    }
+
+
+def test_hot_queries_use_indexes(tmp_path):
+    model = TaskModel(tmp_path / "plans.db")
+
+    assert model.check_query_plans() == {}
+
+
+def test_connection_profile_is_applied(tmp_path):
+    db = DatabaseManager(tmp_path / "profile.db")
+
+    assert db.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert db.connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert db.connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    custom = DatabaseManager(tmp_path / "custom.db", ConnectionProfile(journal_mode="DELETE"))
+    assert custom.connection.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+
+def test_deleting_a_task_cascades_to_its_comments(tmp_path):
+    model = TaskModel(tmp_path / "cascade.db")
+    task = model.create_task("Avec commentaires")
+    model.db.execute("INSERT INTO comments (task_id, content) VALUES (?, ?)", (task["id"], "Bonjour"))
+
+    model.delete_task(task["id"])
+
+    assert model.db.execute("SELECT COUNT(*) FROM comments", fetchone=True)[0] == 0
+
+
+def test_transaction_rolls_back_every_statement_on_error(tmp_path):
+    db = DatabaseManager(tmp_path / "rollback.db")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.transaction():
+            db.execute("INSERT INTO tasks (title) VALUES ('Première')")
+            with db.transaction():  # imbriquée : rejoint la transaction englobante
+                db.execute("INSERT INTO tasks (title) VALUES ('Seconde')")
+            db.execute("INSERT INTO tasks (title) VALUES (NULL)")
+
+    assert db.query_one("SELECT COUNT(*) FROM tasks")[0] == 0
+    assert not db.connection.in_transaction
+
+
+def test_search_ranks_titles_descriptions_and_comments(tmp_path):
+    model = TaskModel(tmp_path / "search.db")
+    in_title = model.create_task("Préparer la réunion", "Ordre du jour")
+    in_comment = model.create_task("Autre chose")
+    model.create_task("Sans rapport")
+    model.db.execute("INSERT INTO comments (task_id, content) VALUES (?, ?)", (in_comment["id"], "voir la réunion de lundi"))
+
+    results = model.search("reuni")  # préfixe, sans accent
+
+    assert [task["id"] for task in results] == [in_title["id"], in_comment["id"]]
+    assert "[réunion]" in results[1]["snippet"]
+
+    # Au-delà de SEARCH_WINDOW correspondances dans un index, la troncature est signalée
+    assert model.search_truncated("reuni") is False
+    model.SEARCH_WINDOW = 1
+    extra = model.create_task("Autre réunion")
+    assert model.search_truncated("reuni") is True
+    model.SEARCH_WINDOW = TaskModel.SEARCH_WINDOW
+    model.delete_task(extra["id"])
+
+    model.update_task_details({"id": in_title["id"], "title": "Renommée", "description": "", "status": "À faire"})
+    model.delete_task(in_comment["id"])
+    assert model.search("réunion") == []
+
+
+def test_shared_images_are_reference_counted_and_collected(tmp_path):
+    model = TaskModel(tmp_path / "images.db")
+    first = model.create_task("Première")
+    second = model.create_task("Seconde")
+    path = model.images.store_path("ab" * 20)
+    target = tmp_path / "images" / "images" / "store" / "ab" / f"{'ab' * 20}.png"
+    assert model.images.resolve(path) == str(target)  # à côté de la base, pas du répertoire courant
+    target.parent.mkdir(parents=True)
+    target.write_bytes(b"png")
+
+    def refcount():
+        row = model.db.query_one("SELECT refcount FROM images WHERE path = ?", (path,))
+        return row["refcount"] if row else None
+
+    model.update_task_details({**model.get_task(first["id"]), "image_path": path})
+    model.update_task_details({**model.get_task(second["id"]), "image_path": path})
+    assert refcount() == 2
+
+    model.update_task_details({**model.get_task(first["id"]), "image_path": None})
+    assert refcount() == 1
+    assert model.collect_image_garbage(grace_seconds=0) == 0
+
+    model.delete_task(second["id"])
+    assert refcount() == 0
+    assert model.collect_image_garbage(grace_seconds=3600) == 0  # encore dans le délai de grâce
+    assert model.collect_image_garbage(grace_seconds=0) == 1
+    assert refcount() is None
+    assert not target.exists()
+
+
+def test_uploading_an_expired_orphan_again_protects_it_from_the_collector(tmp_path):
+    model = TaskModel(tmp_path / "reupload.db")
+    upload = tmp_path / "upload.tmp"
+    upload.write_bytes(b"png")
+    path = model.images.store_path(image_store.file_hash(upload))
+    model.db.execute(
+        "INSERT INTO images (path, refcount, orphaned_at) VALUES (?, 0, datetime('now', '-2 hours'))", (path,)
+    )
+
+    # Le même contenu est de nouveau ajouté : la tâche ne le référence pas encore
+    assert model.images.add_file(str(upload)) == path
+    assert model.collect_image_garbage(grace_seconds=3600) == 0
+    assert os.path.exists(model.images.resolve(path))
+
+    task = model.create_task("Bannière réutilisée")
+    model.update_task_details({"id": task["id"], "image_path": path})
+    assert model.db.query_one("SELECT refcount FROM images WHERE path = ?", (path,))[0] == 1
+
+
+def test_sweep_leaves_the_images_of_other_databases(tmp_path):
+    legacy = tmp_path / "images" / "task_1_banner.png"
+    legacy.parent.mkdir()
+    legacy.write_bytes(b"png")
+    owner = TaskModel(tmp_path / "app_data.db")
+    task = owner.create_task("Ancienne bannière")
+    owner.update_task_details({"id": task["id"], "image_path": "images/task_1_banner.png"})
+    stored = owner.images.resolve(owner.images.store_path("cd" * 20))
+    os.makedirs(os.path.dirname(stored))
+    open(stored, "wb").close()
+    owner.update_task_details({"id": task["id"], "image_path": owner.images.store_path("cd" * 20)})
+    owner.update_task_details({"id": task["id"], "image_path": "images/task_1_banner.png"})
+
+    # Une autre base du même dossier ne parcourt que son propre magasin
+    other = TaskModel(tmp_path / "other.db")
+    assert other.sweep_stray_images(grace_seconds=0) == 0
+    assert legacy.exists() and os.path.exists(stored)
+
+    # Fichier du magasin sans référence (ligne `images` encore présente) : laissé au ramasse-miettes
+    assert owner.sweep_stray_images(grace_seconds=0) == 0
+    owner.db.execute("DELETE FROM images WHERE path = ?", (owner.images.store_path("cd" * 20),))
+    assert owner.sweep_stray_images(grace_seconds=0) == 1
+    assert legacy.exists() and not os.path.exists(stored)
+
+
+def test_seeded_database_is_reproducible_and_indexed(tmp_path):
+    from benchmarks.seed import seed_database
+
+    # Même nom de base dans deux dossiers : les chemins de bannières (relatifs à la base) sont identiques
+    (tmp_path / "a").mkdir(), (tmp_path / "b").mkdir()
+    counts = seed_database(tmp_path / "a" / "seed.db", tasks=500, comments=2000, banners=5)
+    seed_database(tmp_path / "b" / "seed.db", tasks=500, comments=2000, banners=5)
+    assert (counts["tasks"], counts["comments"]) == (500, 2000)
+    first, second = TaskModel(tmp_path / "a" / "seed.db"), TaskModel(tmp_path / "b" / "seed.db")
+    for query in ("SELECT * FROM tasks ORDER BY id", "SELECT * FROM comments ORDER BY id"):
+        assert [tuple(row) for row in first.db.query_all(query)] == [tuple(row) for row in second.db.query_all(query)]
+
+    # Index plein texte et compteurs reconstruits, triggers recréés
+    assert first.search("budget")
+    assert first.db.query_one("SELECT SUM(refcount) FROM images")[0] == first.db.query_one(
+        "SELECT COUNT(*) FROM tasks WHERE image_path IS NOT NULL"
+    )[0]
+    created = first.create_task("Réunion budget trimestriel")
+    assert created["id"] in [task["id"] for task in first.search("trimestriel")]
+
+    first.db.close()
+    with pytest.raises(ValueError):
+        seed_database(tmp_path / "a" / "seed.db", tasks=1)
+
+
+def test_comment_count_and_pages_follow_comments(tmp_path):
+    model = TaskModel(tmp_path / "comments.db")
+    task = model.create_task("Discussion")
+    other = model.create_task("Autre")
+    assert task["comment_count"] == 0
+
+    comments = [model.add_comment(task["id"], f"Commentaire {i}") for i in range(7)]
+    model.add_comment(other["id"], "Ailleurs")
+    assert model.get_task_by_id(task["id"])["comment_count"] == 7
+
+    # Pages consécutives sans doublon ni trou, dans l'ordre chronologique
+    seen, cursor = [], None
+    while page := model.get_comments_page(task["id"], after=cursor, limit=3):
+        seen += [comment["id"] for comment in page]
+        cursor = (page[-1]["created_at"], page[-1]["id"])
+    assert seen == [comment["id"] for comment in comments]
+
+    model.delete_comment(comments[0]["id"])
+    assert model.get_task_by_id(task["id"])["comment_count"] == 6
+    model.db.execute("UPDATE comments SET task_id = ? WHERE id = ?", (other["id"], comments[1]["id"]))
+    assert model.get_task_by_id(other["id"])["comment_count"] == 2
+
+
+def test_status_pages_and_counts(tmp_path):
+    model = TaskModel(tmp_path / "board.db")
+    tasks = [model.create_task(f"Tâche {i}") for i in range(9)]
+    for task in tasks[::3]:
+        model.update_status(task["id"], "En cours")
+    assert model.count_by_status() == {"À faire": 6, "En cours": 3, "Terminée": 0}
+
+    # Pages d'une colonne : uniquement son statut, sans doublon ni trou
+    seen, cursor = [], None
+    while page := model.get_tasks_page(after=cursor, limit=2, status="À faire"):
+        assert {task["status"] for task in page} == {"À faire"}
+        seen += [task["id"] for task in page]
+        cursor = (page[-1]["created_at"], page[-1]["id"])
+    assert sorted(seen) == sorted(task["id"] for i, task in enumerate(tasks) if i % 3)
+
+
+def test_status_changes_are_written_together_or_not_at_all(tmp_path):
+    model = TaskModel(tmp_path / "statuses.db")
+    first, second = model.create_task("Première"), model.create_task("Seconde")
+    failed = []
+    model.tasks_update_failed.connect(lambda task_ids, message: failed.append(task_ids))
+
+    model.update_statuses({first["id"]: "En cours", second["id"]: "Terminée"})
+    assert model.count_by_status() == {"À faire": 0, "En cours": 1, "Terminée": 1}
+
+    # Un statut invalide annule tout le lot
+    model.update_statuses({first["id"]: "À faire", second["id"]: "Inconnu"})
+    assert failed == [[first["id"], second["id"]]]  # un seul signal pour le lot
+    assert model.get_task_by_id(first["id"])["status"] == "En cours"
+    assert sorted(model.get_statuses([first["id"], second["id"]]), key=lambda task: task["id"]) == [
+        {"id": first["id"], "status": "En cours"}, {"id": second["id"], "status": "Terminée"},
+    ]
+
+
+def test_only_changed_fields_are_written(tmp_path):
+    model = TaskModel(tmp_path / "partial.db")
+    task = model.create_task("Rapport", "Version initiale")
+    model.db.execute("UPDATE tasks SET updated_at = '2000-01-01 00:00:00' WHERE id = ?", (task["id"],))
+    updated = []
+    model.task_updated.connect(updated.append)
+
+    # Valeurs identiques : aucune écriture, updated_at intact
+    assert model.update_task_details({"id": task["id"], "description": "Version initiale"}) == {}
+    assert model.update_task_details({"id": task["id"]}) == {}
+    assert model.get_task_by_id(task["id"])["updated_at"] == "2000-01-01 00:00:00"
+    assert updated == []
+
+    assert model.update_task_details({"id": task["id"], "description": "Version finale"}) == {"description": "Version finale"}
+    stored = model.get_task_by_id(task["id"])
+    assert (stored["title"], stored["description"]) == ("Rapport", "Version finale")
+    assert stored["updated_at"] > "2000-01-01 00:00:00"
+    assert updated == [{"id": task["id"], "description": "Version finale"}]
+    assert [found["id"] for found in model.search("finale")] == [task["id"]]
+
+
+def test_changes_from_another_connection_are_polled(tmp_path):
+    path = tmp_path / "shared.db"
+    mine, other = TaskModel(path), TaskModel(path)
+    kept = mine.create_task("Partagée")
+    doomed = mine.create_task("Supprimée ailleurs")
+    emitted = []
+    for name in ("tasks_added", "tasks_updated", "tasks_deleted"):
+        getattr(mine, name).connect(lambda tasks, name=name: emitted.append((name, tasks)))
+
+    # Sans écriture d'une autre connexion, rien n'est émis (nos propres écritures comprises)
+    mine.update_status(kept["id"], "En cours")
+    emitted.clear()
+    assert mine.poll_changes() is True and emitted == []
+
+    added = other.create_task("Nouvelle")
+    other.update_task_details({"id": kept["id"], "title": "Renommée"})
+    other.update_status(kept["id"], "Terminée")
+    other.delete_task(doomed["id"])
+    transient = other.create_task("Éphémère")
+    other.delete_task(transient["id"])
+    mine.update_status(added["id"], "En cours")  # intercalée : lue en base, pas dans le journal
+
+    assert mine.poll_changes() is True
+    emitted = dict(emitted)
+    assert [task["id"] for task in emitted["tasks_added"]] == [added["id"]]
+    assert emitted["tasks_added"][0]["status"] == "En cours"
+    assert [(task["title"], task["status"]) for task in emitted["tasks_updated"]] == [("Renommée", "Terminée")]
+    assert emitted["tasks_deleted"] == [doomed["id"]]
+
+    # Journal purgé au-delà du dernier numéro vu : rechargement complet demandé
+    other.update_status(kept["id"], "À faire")
+    other.update_status(kept["id"], "En cours")
+    other.prune_changes(keep=1)
+    assert mine.poll_changes() is False
+
+
+def test_bulk_operations_are_all_or_nothing_with_one_signal(tmp_path):
+    model = TaskModel(tmp_path / "bulk.db")
+    emitted = []
+    for name in ("tasks_added", "tasks_updated", "tasks_deleted"):
+        getattr(model, name).connect(lambda tasks, name=name: emitted.append((name, tasks)))
+
+    # Une ligne invalide (titre NULL) annule toute la création
+    with pytest.raises(sqlite3.IntegrityError):
+        model.create_tasks([{"title": "Valide"}, {"title": None}])
+    assert model.db.query_one("SELECT COUNT(*) FROM tasks")[0] == 0 and emitted == []
+
+    created = model.create_tasks([{"title": f"Tâche {i}"} for i in range(3)])
+    ids = [task["id"] for task in created]
+    assert emitted == [("tasks_added", created)]
+
+    # Une ligne refusée par la base annule le lot entier, sans signal
+    model.db.execute(
+        f"CREATE TEMP TRIGGER protect BEFORE UPDATE ON tasks WHEN old.id = {ids[-1]} "
+        "BEGIN SELECT RAISE(ABORT, 'protégée'); END"
+    )
+    emitted.clear()
+    with pytest.raises(sqlite3.IntegrityError):
+        model.update_status_many(ids, "Terminée")
+    assert model.count_by_status()["Terminée"] == 0 and emitted == []
+    model.db.execute("DROP TRIGGER temp.protect")
+
+    model.update_status_many(ids, "Terminée")
+    assert model.count_by_status()["Terminée"] == 3
+    assert emitted == [("tasks_updated", [{"id": task_id, "status": "Terminée"} for task_id in ids])]
+
+    model.db.execute(
+        f"CREATE TEMP TRIGGER protect BEFORE DELETE ON tasks WHEN old.id = {ids[-1]} "
+        "BEGIN SELECT RAISE(ABORT, 'protégée'); END"
+    )
+    emitted.clear()
+    with pytest.raises(sqlite3.IntegrityError):
+        model.delete_tasks(ids)
+    assert model.db.query_one("SELECT COUNT(*) FROM tasks")[0] == 3 and emitted == []
+    model.db.execute("DROP TRIGGER temp.protect")
+
+    model.delete_tasks(ids)
+    assert model.db.query_one("SELECT COUNT(*) FROM tasks")[0] == 0
+    assert emitted == [("tasks_deleted", ids)]
@@ -1,34 +1,28 @@
-# test_tasks.py
+# test_task.py
 from models.task_model import TaskModel
 
-# On initialise le modèle
-task_model = TaskModel()
 
-# On crée quelques tâches
-t1 = task_model.create_task("Découvrir PySide6", "Tester la création d'une tâche")
-t2 = task_model.create_task("Faire l'interface", "Prochaine étape après le modèle")
+def test_task_lifecycle(tmp_path):
+    # On initialise le modèle sur une base temporaire
+    task_model = TaskModel(tmp_path / "tasks.db")
 
-print("Tâches créées :")
-print(t1)
-print(t2)
+    # On crée quelques tâches
+    t1 = task_model.create_task("Découvrir PySide6", "Tester la création d'une tâche")
+    t2 = task_model.create_task("Faire l'interface", "Prochaine étape après le modèle")
+    assert t1["status"] == "À faire"
 
-# On récupère toutes les tâches
-tasks = task_model.get_all_tasks()
-print("\nToutes les tâches :")
-for t in tasks:
-    print(f"- {t['id']}: {t['title']} ({t['status']})")
+    # On récupère toutes les tâches, les plus récentes en premier
+    assert [t["id"] for t in task_model.get_all_tasks()] == [t2["id"], t1["id"]]
 
-# On met à jour une tâche
-updated = task_model.update_task(
-    t1["id"], "Découvrir PySide6", "Modèle terminé", "En cours"
-)
-print("\nTâche mise à jour :", updated)
+    # On met à jour une tâche
+    task_model.update_task_details({
+        "id": t1["id"], "title": "Découvrir PySide6", "description": "Modèle terminé", "status": "En cours"
+    })
+    updated = task_model.get_task(t1["id"])
+    assert (updated["description"], updated["status"]) == ("Modèle terminé", "En cours")
 
-# On supprime une tâche
-task_model.delete_task(t2["id"])
-print("\nTâche supprimée :", t2["id"])
+    # On supprime une tâche
+    task_model.delete_task(t2["id"])
 
-# Liste finale
-print("\nTâches restantes :")
-for t in task_model.get_all_tasks():
-    print(f"- {t['id']}: {t['title']} ({t['status']})")
+    # Liste finale
+    assert [t["id"] for t in task_model.get_all_tasks()] == [t1["id"]]
@@ -0,0 +1,32 @@
+# views/icons.py
+"""
+Icônes de l'application, lues depuis les ressources Qt compilées (views/resources_rc.py).
+Chaque icône est chargée une seule fois pour tout le processus, et ses versions
+rastérisées sont mises en cache par taille et par densité d'écran (devicePixelRatio).
+
+Pour régénérer les ressources après modification de assets/ :
+    pyside6-rcc assets/resources.qrc -o views/resources_rc.py
+"""
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon
+
+import views.resources_rc  # noqa: F401  (enregistre les ressources :/icons/…)
+
+
+_icons = {}  # nom -> QIcon
+_pixmaps = {}  # (nom, largeur, hauteur, devicePixelRatio) -> QPixmap
+
+
+def icon(name: str) -> QIcon:
+    """Retourne l'icône partagée `name` (ex. "pen", "trash")."""
+    if name not in _icons:
+        _icons[name] = QIcon(f":/icons/{name}.svg")
+    return _icons[name]
+
+
+def pixmap(name: str, size: QSize, device_pixel_ratio: float = 1.0):
+    """Retourne l'icône rastérisée à la taille logique `size` pour une densité d'écran donnée."""
+    key = (name, size.width(), size.height(), device_pixel_ratio)
+    if key not in _pixmaps:
+        _pixmaps[key] = icon(name).pixmap(size, device_pixel_ratio)
+    return _pixmaps[key]
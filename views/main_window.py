@@ -1,19 +1,25 @@
 # views/main_window.py
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout,
-    QHBoxLayout, QListWidget, QPushButton, QLineEdit, QLabel, QMessageBox, QListWidgetItem, QStackedWidget
+    QHBoxLayout, QPushButton, QLineEdit, QLabel, QMessageBox, QStackedWidget, QComboBox
 )
-from PySide6.QtCore import Qt, QSettings
-from PySide6.QtGui import QIcon
-from views.widgets.task_row_widget import TaskRowWidget
+from PySide6.QtCore import Qt, QSettings, QTimer
+from models.task_list_model import TaskListModel
+from models.task_model import STATUSES
+from views.widgets.task_item_delegate import TaskItemDelegate
+from views.widgets.task_list_view import TaskListView
+from views import theme
 
 class MainWindow(QMainWindow):
     """Vue principale de l'application de gestion de tâches."""
 
+    SEARCH_DEBOUNCE_MS = 150
+
     def __init__(self):
         super().__init__()
 
         self.parent_controller = None
+        self.board = None  # tableau kanban, créé au premier affichage par le contrôleur
         self.settings = QSettings("TaskManager", "DarkMode")
         self.dark_mode = self.settings.value("dark_mode", False, type=bool)
         
@@ -39,9 +45,18 @@ class MainWindow(QMainWindow):
         
         self.title_label = QLabel("Mes Tâches")
         self.title_label.setAlignment(Qt.AlignCenter)
+        theme.set_role(self.title_label, "title")
         header_layout.addStretch()
         header_layout.addWidget(self.title_label)
         header_layout.addStretch()
+
+        # Bascule entre la liste et le tableau (kanban)
+        self.board_btn = QPushButton("Tableau")
+        self.board_btn.setFixedHeight(40)
+        self.board_btn.setCursor(Qt.PointingHandCursor)
+        self.board_btn.setToolTip("Afficher les tâches par statut")
+        self.board_btn.clicked.connect(lambda: self.parent_controller.toggle_board())
+        header_layout.addWidget(self.board_btn)
         
         # Bouton pour basculer entre mode clair et sombre
         self.dark_mode_btn = QPushButton()
@@ -54,8 +69,57 @@ class MainWindow(QMainWindow):
         
         self.layout.addLayout(header_layout)
 
-        self.task_list = QListWidget()
-        self.layout.addWidget(self.task_list)
+        # Recherche plein texte, lancée pendant la frappe après une courte pause
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Rechercher dans les tâches et commentaires...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.search_timer.timeout.connect(
+            lambda: self.parent_controller.search_tasks(self.search_input.text().strip())
+        )
+        self.layout.addWidget(self.search_input)
+
+        # Prévient quand la recherche n'a classé que les correspondances les plus récentes
+        self.search_truncated = False
+        self.search_notice = QLabel(
+            "Recherche limitée aux correspondances les plus récentes : précisez les termes pour trouver les plus anciennes."
+        )
+        self.search_notice.setWordWrap(True)
+        theme.set_role(self.search_notice, "hint")
+        self.search_notice.setVisible(False)
+        self.layout.addWidget(self.search_notice)
+
+        # Liste virtualisée : modèle + délégué, aucun widget par ligne
+        self.task_list_model = TaskListModel(parent=self)
+        self.task_delegate = TaskItemDelegate(self)
+        self.task_list = TaskListView()
+        self.task_list.setModel(self.task_list_model)
+        self.task_list.setItemDelegate(self.task_delegate)
+
+        # La liste et le tableau occupent la même place
+        self.tasks_stack = QStackedWidget()
+        self.tasks_stack.addWidget(self.task_list)
+        self.layout.addWidget(self.tasks_stack)
+
+        # Les actions des lignes sont différées pour ne pas modifier le modèle pendant un clic
+        self.task_delegate.edit_clicked.connect(
+            lambda id: self.parent_controller.open_task_detail(id), Qt.QueuedConnection
+        )
+        self.task_delegate.delete_clicked.connect(
+            lambda id: self.parent_controller.delete_task(id), Qt.QueuedConnection
+        )
+        self.task_list_model.status_edited.connect(
+            lambda id, status: self.parent_controller.update_task_status(id, status)
+        )
+
+        # Barre d'actions groupées, visible dès qu'une sélection existe
+        self.setup_bulk_bar()
+        self.task_list.selectionModel().selectionChanged.connect(self.update_bulk_bar)
+        self.task_list_model.modelReset.connect(self.update_bulk_bar)
+        self.task_list_model.rowsRemoved.connect(self.update_bulk_bar)
         
         input_layout = QHBoxLayout()
         self.task_title = QLineEdit()
@@ -78,6 +142,70 @@ class MainWindow(QMainWindow):
         self.apply_theme()
         
    
+    def setup_bulk_bar(self):
+        """Configure la barre d'actions sur les tâches sélectionnées."""
+        self.bulk_bar = QWidget()
+        bulk_layout = QHBoxLayout(self.bulk_bar)
+        bulk_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.bulk_label = QLabel()
+        self.bulk_status_box = QComboBox()
+        self.bulk_status_box.addItems(STATUSES)
+        self.bulk_status_btn = QPushButton("Appliquer le statut")
+        self.bulk_delete_btn = QPushButton("Supprimer la sélection")
+
+        self.bulk_status_btn.clicked.connect(
+            lambda: self.parent_controller.update_selected_status(self.bulk_status_box.currentText())
+        )
+        self.bulk_delete_btn.clicked.connect(lambda: self.parent_controller.delete_selected_tasks())
+
+        bulk_layout.addWidget(self.bulk_label)
+        bulk_layout.addStretch()
+        bulk_layout.addWidget(self.bulk_status_box)
+        bulk_layout.addWidget(self.bulk_status_btn)
+        bulk_layout.addWidget(self.bulk_delete_btn)
+        self.layout.addWidget(self.bulk_bar)
+        self.bulk_bar.setVisible(False)
+
+    def update_bulk_bar(self, *args):
+        """Affiche le nombre de tâches sélectionnées, ou masque la barre."""
+        count = len(self.task_list.selectionModel().selectedRows())
+        self.bulk_bar.setVisible(count > 0 and not self.is_board_visible())
+        self.bulk_label.setText(f"{count} tâche(s) sélectionnée(s)")
+
+    def show_board(self, board):
+        """Affiche le tableau à la place de la liste (la recherche et les actions groupées sont masquées)."""
+        if self.board is None:
+            self.board = board
+            self.tasks_stack.addWidget(board)
+        self.tasks_stack.setCurrentWidget(board)
+        self.search_input.setVisible(False)
+        self.search_notice.setVisible(False)
+        self.bulk_bar.setVisible(False)
+        self.board_btn.setText("Liste")
+        self.board_btn.setToolTip("Afficher la liste des tâches")
+
+    def show_list(self):
+        """Revient à la liste des tâches."""
+        self.tasks_stack.setCurrentWidget(self.task_list)
+        self.search_input.setVisible(True)
+        self.search_notice.setVisible(self.search_truncated)
+        self.update_bulk_bar()
+        self.board_btn.setText("Tableau")
+        self.board_btn.setToolTip("Afficher les tâches par statut")
+
+    def show_search_notice(self, truncated: bool):
+        """Affiche ou masque l'avertissement de résultats de recherche tronqués."""
+        self.search_truncated = truncated
+        self.search_notice.setVisible(truncated and not self.is_board_visible())
+
+    def is_board_visible(self):
+        return self.board is not None and self.tasks_stack.currentWidget() is self.board
+
+    def selected_task_ids(self):
+        """Retourne les ids des tâches sélectionnées dans la liste."""
+        return self.task_list_model.task_ids(self.task_list.selected_rows())
+
     def get_task_inputs(self):
         return self.task_title.text().strip(), self.task_desc.text().strip()
 
@@ -86,32 +214,24 @@ class MainWindow(QMainWindow):
         self.task_desc.clear()
 
     def clear_tasks(self):
-        self.task_list.clear()
+        self.task_list_model.clear()
 
     def add_task_to_list(self, task: dict):
         """
-        Ajoute une tâche dans la liste sous forme de widget personnalisé.
+        Ajoute une tâche à sa place dans la liste.
+        Seule une ligne du modèle est créée : le rendu est fait par le délégué.
         """
-        # 1️⃣ Crée un "slot" (ligne vide) dans la QListWidget
-        item = QListWidgetItem()
-
-        # 2️⃣ Crée ton widget custom (TaskRowWidget) en lui passant les données de la tâche
-        widget = TaskRowWidget(task, self.dark_mode)
-
-        # 3️⃣ Ajuste la hauteur de la ligne à la taille du widget
-        item.setSizeHint(widget.sizeHint())
+        self.task_list_model.insert_task(task)
 
-        # 4️⃣ Ajoute la ligne vide dans la QListWidget
-        self.task_list.addItem(item)
-
-        # 5️⃣ Place le widget à l’intérieur de cette ligne
-        self.task_list.setItemWidget(item, widget)
-
-        # 6️⃣ Connecte les signaux du widget à ton contrôleur
-        widget.edit_clicked.connect(lambda id=task["id"]: self.parent_controller.open_task_detail(id))
-        
-        widget.delete_clicked.connect(lambda id=task["id"]: self.parent_controller.delete_task(id))
 
+    def set_loading(self, loading: bool):
+        """Indique qu'une requête est en cours sans bloquer l'interface."""
+        if loading:
+            self.statusBar().showMessage("Chargement…")
+            self.setCursor(Qt.BusyCursor)
+        else:
+            self.statusBar().clearMessage()
+            self.unsetCursor()
 
     def show_error(self, message: str):
         """Affiche une boîte de dialogue d'erreur."""
@@ -124,12 +244,10 @@ class MainWindow(QMainWindow):
         self.apply_theme()
         self.update_dark_mode_button()
         
-        # Mettre à jour tous les widgets de tâches existants
-        for i in range(self.task_list.count()):
-            item = self.task_list.item(i)
-            widget = self.task_list.itemWidget(item)
-            if isinstance(widget, TaskRowWidget):
-                widget.apply_theme(self.dark_mode)
+        # Les lignes sont peintes par le délégué : un simple rafraîchissement suffit
+        self.task_list.refresh_theme()
+        if self.board is not None:
+            self.board.refresh_theme()
     
     def update_dark_mode_button(self):
         """Met à jour le texte et l'infobulle du bouton de thème."""
@@ -141,95 +259,5 @@ class MainWindow(QMainWindow):
             self.dark_mode_btn.setToolTip("Mode sombre")
     
     def apply_theme(self):
-        """Applique le thème (clair ou sombre) à l'application."""
-        if self.dark_mode:
-            self.setStyleSheet(self.get_dark_stylesheet())
-        else:
-            self.setStyleSheet(self.get_light_stylesheet())
-    
-    def get_light_stylesheet(self):
-        """Retourne la feuille de style pour le mode clair."""
-        return """
-            QMainWindow, QWidget {
-                background-color: #ffffff;
-                color: #000000;
-            }
-            QLabel {
-                color: #000000;
-                font-size: 20px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-            QListWidget {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 5px;
-            }
-            QLineEdit {
-                background-color: #ffffff;
-                color: #000000;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton {
-                background-color: #f5f5f5;
-                color: #000000;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e9e9e9;
-            }
-            QPushButton#dark_mode_btn {
-                background-color: transparent;
-                border: none;
-                font-size: 24px;
-            }
-        """
-    
-    def get_dark_stylesheet(self):
-        """Retourne la feuille de style pour le mode sombre."""
-        return """
-            QMainWindow, QWidget {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-            }
-            QLabel {
-                color: #e0e0e0;
-                font-size: 20px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-            QListWidget {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                color: #e0e0e0;
-            }
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                border: 1px solid #4d4d4d;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton#dark_mode_btn {
-                background-color: transparent;
-                border: none;
-                font-size: 24px;
-            }
-        """
+        """Applique le thème (clair ou sombre) à l'application, voir views/theme.py."""
+        theme.apply(self.dark_mode)
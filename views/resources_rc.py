@@ -0,0 +1,222 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.10.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x06\x93\
+<\
+svg width=\x2224\x22 h\
+eight=\x2224\x22 viewB\
+ox=\x220 0 24 24\x22 f\
+ill=\x22none\x22 xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22>\x0a<\
+path d=\x22M20.25 4\
+.5H16.5V3.75C16.\
+5 3.15326 16.262\
+9 2.58097 15.841\
+ 2.15901C15.419 \
+1.73705 14.8467 \
+1.5 14.25 1.5H9.\
+75C9.15326 1.5 8\
+.58097 1.73705 8\
+.15901 2.15901C7\
+.73705 2.58097 7\
+.5 3.15326 7.5 3\
+.75V4.5H3.75C3.5\
+5109 4.5 3.36032\
+ 4.57902 3.21967\
+ 4.71967C3.07902\
+ 4.86032 3 5.051\
+09 3 5.25C3 5.44\
+891 3.07902 5.63\
+968 3.21967 5.78\
+033C3.36032 5.92\
+098 3.55109 6 3.\
+75 6H4.5V19.5C4.\
+5 19.8978 4.6580\
+4 20.2794 4.9393\
+4 20.5607C5.2206\
+4 20.842 5.60218\
+ 21 6 21H18C18.3\
+978 21 18.7794 2\
+0.842 19.0607 20\
+.5607C19.342 20.\
+2794 19.5 19.897\
+8 19.5 19.5V6H20\
+.25C20.4489 6 20\
+.6397 5.92098 20\
+.7803 5.78033C20\
+.921 5.63968 21 \
+5.44891 21 5.25C\
+21 5.05109 20.92\
+1 4.86032 20.780\
+3 4.71967C20.639\
+7 4.57902 20.448\
+9 4.5 20.25 4.5Z\
+M9 3.75C9 3.5510\
+9 9.07902 3.3603\
+2 9.21967 3.2196\
+7C9.36032 3.0790\
+2 9.55109 3 9.75\
+ 3H14.25C14.4489\
+ 3 14.6397 3.079\
+02 14.7803 3.219\
+67C14.921 3.3603\
+2 15 3.55109 15 \
+3.75V4.5H9V3.75Z\
+M18 19.5H6V6H18V\
+19.5ZM10.5 9.75V\
+15.75C10.5 15.94\
+89 10.421 16.139\
+7 10.2803 16.280\
+3C10.1397 16.421\
+ 9.94891 16.5 9.\
+75 16.5C9.55109 \
+16.5 9.36032 16.\
+421 9.21967 16.2\
+803C9.07902 16.1\
+397 9 15.9489 9 \
+15.75V9.75C9 9.5\
+5109 9.07902 9.3\
+6032 9.21967 9.2\
+1967C9.36032 9.0\
+7902 9.55109 9 9\
+.75 9C9.94891 9 \
+10.1397 9.07902 \
+10.2803 9.21967C\
+10.421 9.36032 1\
+0.5 9.55109 10.5\
+ 9.75ZM15 9.75V1\
+5.75C15 15.9489 \
+14.921 16.1397 1\
+4.7803 16.2803C1\
+4.6397 16.421 14\
+.4489 16.5 14.25\
+ 16.5C14.0511 16\
+.5 13.8603 16.42\
+1 13.7197 16.280\
+3C13.579 16.1397\
+ 13.5 15.9489 13\
+.5 15.75V9.75C13\
+.5 9.55109 13.57\
+9 9.36032 13.719\
+7 9.21967C13.860\
+3 9.07902 14.051\
+1 9 14.25 9C14.4\
+489 9 14.6397 9.\
+07902 14.7803 9.\
+21967C14.921 9.3\
+6032 15 9.55109 \
+15 9.75Z\x22 fill=\x22\
+#010102\x22/>\x0a</svg\
+>\x0a\
+\x00\x00\x04F\
+<\
+svg width=\x2224\x22 h\
+eight=\x2224\x22 viewB\
+ox=\x220 0 24 24\x22 f\
+ill=\x22none\x22 xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22>\x0a<\
+path d=\x22M21.3113\
+ 6.87821L17.1216\
+ 2.68946C16.9823\
+ 2.55014 16.8169\
+ 2.43962 16.6349\
+ 2.36421C16.4529\
+ 2.28881 16.2578\
+ 2.25 16.0608 2.\
+25C15.8638 2.25 \
+15.6687 2.28881 \
+15.4867 2.36421C\
+15.3047 2.43962 \
+15.1393 2.55014 \
+15 2.68946L3.439\
+69 14.2498C3.299\
+8 14.3886 3.1888\
+9 14.5538 3.1134\
+1 14.7358C3.0379\
+2 14.9178 2.9993\
+8 15.113 3.00001\
+ 15.3101V19.4998\
+C3.00001 19.8976\
+ 3.15804 20.2791\
+ 3.43935 20.5604\
+C3.72065 20.8417\
+ 4.10218 20.9998\
+ 4.50001 20.9998\
+H20.25C20.4489 2\
+0.9998 20.6397 2\
+0.9208 20.7803 2\
+0.7801C20.921 20\
+.6395 21 20.4487\
+ 21 20.2498C21 2\
+0.0509 20.921 19\
+.8601 20.7803 19\
+.7194C20.6397 19\
+.5788 20.4489 19\
+.4998 20.25 19.4\
+998H10.8113L21.3\
+113 8.99977C21.4\
+506 8.86048 21.5\
+611 8.69511 21.6\
+365 8.5131C21.71\
+19 8.33109 21.75\
+07 8.136 21.7507\
+ 7.93899C21.7507\
+ 7.74198 21.7119\
+ 7.5469 21.6365 \
+7.36489C21.5611 \
+7.18288 21.4506 \
+7.0175 21.3113 6\
+.87821ZM8.68969 \
+19.4998H4.50001V\
+15.3101L12.75 7.\
+06009L16.9397 11\
+.2498L8.68969 19\
+.4998ZM18 10.189\
+5L13.8113 5.9997\
+7L16.0613 3.7497\
+7L20.25 7.93946L\
+18 10.1895Z\x22 fil\
+l=\x22#010102\x22/>\x0a</\
+svg>\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x09\
+\x08\x9b\xad\xc7\
+\x00t\
+\x00r\x00a\x00s\x00h\x00.\x00s\x00v\x00g\
+\x00\x07\
+\x06\xc1Z'\
+\x00p\
+\x00e\x00n\x00.\x00s\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00(\x00\x00\x00\x00\x00\x01\x00\x00\x06\x97\
+\x00\x00\x01\x9a\xd1CD\xb0\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9a\xd1CD\xb0\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -1,32 +1,72 @@
 # views/task_detail_view.py
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QTextEdit, QPushButton, QComboBox, QHBoxLayout,
-    QFileDialog, QMessageBox, QSpacerItem, QSizePolicy
+    QFileDialog, QMessageBox, QSpacerItem, QSizePolicy, QProgressBar, QListView, QLineEdit
 )
 from PySide6.QtGui import QPixmap
-from PySide6.QtCore import Qt, Signal
-import os
-import shutil
-from PIL import Image
+from PySide6.QtCore import Qt, Signal, QTimer
+from models.banner_pipeline import PREVIEW_HEIGHT, banner_pipeline
+from models.banner_cache import banner_cache
+from models.comment_list_model import CommentListModel
+from views import theme
 
 class TaskDetailView(QWidget):
-    """Vue détaillée d'une tâche (édition, description, image, statut)."""
+    """
+    Vue détaillée d'une tâche (édition, description, image, statut, commentaires).
+    Créée une seule fois : bind() l'associe à une autre tâche sans reconstruire les widgets.
+    Seuls les champs modifiés depuis le dernier enregistrement sont envoyés (changes()) ;
+    la description est enregistrée d'elle-même AUTOSAVE_DELAY_MS après la dernière frappe.
+    """
+
+    AUTOSAVE_DELAY_MS = 1500
 
     upload_clicked = Signal(object)
     back_clicked = Signal()
     status_changed = Signal(str)
-    save_clicked = Signal(dict)
+    save_clicked = Signal(dict)  # id et champs modifiés
+    autosave = Signal(dict)  # id et champs modifiés, sans quitter la vue
+    comment_submitted = Signal(str)
 
-    def __init__(self, task: dict, parent=None, parent_controller=None):
+    def __init__(self, task: dict = None, parent=None, parent_controller=None):
         super().__init__(parent)
-        self.task = task
+        self.task = {}
         self.parent_controller = parent_controller
-        self.dark_mode = False
-        if parent and hasattr(parent, 'dark_mode'):
-            self.dark_mode = parent.dark_mode
-        elif parent_controller and hasattr(parent_controller, 'view') and hasattr(parent_controller.view, 'dark_mode'):
-            self.dark_mode = parent_controller.view.dark_mode
+        self.banner_job = None  # traitement de bannière en cours
+        self.saved = {}  # valeurs enregistrées en base, référence des champs modifiés
+
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(self.AUTOSAVE_DELAY_MS)
+        self.autosave_timer.timeout.connect(self.flush_autosave)
+
         self.setup_ui()
+        if task:
+            self.bind(task)
+
+    def bind(self, task: dict):
+        """Affiche une autre tâche dans la vue existante."""
+        self.cancel_banner_upload()
+        self.flush_autosave()  # la description en cours de frappe appartient à la tâche précédente
+        self.task = dict(task)  # copie : la vue modifie image_path sans toucher aux données de la liste
+        self.saved = {field: self.task.get(field) for field in ("title", "description", "status", "image_path")}
+        self.saved["description"] = self.saved["description"] or ""
+
+        self.title_label.setText(self.task["title"])
+        self.show_banner(self.task.get("image_path"))
+        self.clear_banner_btn.setVisible(bool(self.task.get("image_path")))
+        self.description_edit.blockSignals(True)
+        self.description_edit.setPlainText(self.saved["description"])
+        self.description_edit.blockSignals(False)
+        self.set_status(self.task["status"])
+        self.comment_input.clear()
+        self.comment_model.set_task(self.task["id"])
+
+    def set_status(self, status: str):
+        """Met à jour le statut affiché sans émettre status_changed."""
+        self.task["status"] = status
+        self.status_box.blockSignals(True)
+        self.status_box.setCurrentText(status)
+        self.status_box.blockSignals(False)
 
     def setup_ui(self):
         """Configure l'interface utilisateur."""
@@ -38,14 +78,15 @@ class TaskDetailView(QWidget):
         header = QHBoxLayout()
         back_btn = QPushButton("← Retour")
         back_btn.setFixedWidth(100)
+        back_btn.clicked.connect(self.flush_autosave)
         back_btn.clicked.connect(self.back_clicked.emit)
 
-        title_label = QLabel(self.task["title"])
-        title_label.setStyleSheet("font-size: 20px; font-weight: bold;")
+        self.title_label = QLabel()
+        theme.set_role(self.title_label, "title")
 
         header.addWidget(back_btn)
         header.addStretch()
-        header.addWidget(title_label)
+        header.addWidget(self.title_label)
         layout.addLayout(header)
 
         # Configuration de la section bannière (image)
@@ -54,27 +95,21 @@ class TaskDetailView(QWidget):
         # Configuration de la section description
         self.setup_description_section(layout)
 
+        # Configuration de la section des commentaires
+        self.setup_comments_section(layout)
+
         # Configuration de la section statut
         self.setup_status_section(layout)
 
         # Ajout du bouton de sauvegarde
         self.setup_save_button(layout)
 
-        # Style global
-        self.setStyleSheet(self.get_stylesheet())
-
     def setup_banner_section(self, layout):
         """Configure la section de la bannière."""
         self.banner = QLabel()
         self.banner.setAlignment(Qt.AlignCenter)
-        self.banner.setFixedHeight(160)
-        self.banner.setStyleSheet("background-color: #f1f1f1; border-radius: 10px;")
-
-        if self.task.get("image_path") and os.path.exists(self.task["image_path"]):
-            pix = QPixmap(self.task["image_path"])
-            self.banner.setPixmap(pix.scaledToHeight(160, Qt.SmoothTransformation))
-        else:
-            self.banner.setText("Aucune image")
+        self.banner.setFixedHeight(PREVIEW_HEIGHT)
+        theme.set_role(self.banner, "banner")
 
         layout.addWidget(self.banner)
 
@@ -83,10 +118,20 @@ class TaskDetailView(QWidget):
         upload_btn = QPushButton("Changer la bannière")
         upload_btn.clicked.connect(self.upload_banner)
 
+        # Progression du traitement de l'image, visible uniquement pendant l'upload
+        self.banner_progress = QProgressBar()
+        self.banner_progress.setRange(0, 100)
+        self.banner_progress.setFixedWidth(160)
+        self.banner_progress.setVisible(False)
+        self.cancel_banner_btn = QPushButton("Annuler")
+        self.cancel_banner_btn.clicked.connect(self.cancel_banner_upload)
+        self.cancel_banner_btn.setVisible(False)
+
         clear_btn = QPushButton("Supprimer")
         clear_btn.clicked.connect(self.clear_banner)
-        clear_btn.setVisible(bool(self.task.get("image_path")))
 
+        banner_btn_layout.addWidget(self.banner_progress)
+        banner_btn_layout.addWidget(self.cancel_banner_btn)
         banner_btn_layout.addStretch()
         banner_btn_layout.addWidget(upload_btn)
         banner_btn_layout.addWidget(clear_btn)
@@ -102,121 +147,94 @@ class TaskDetailView(QWidget):
 
         self.description_edit = QTextEdit()
         self.description_edit.setPlaceholderText("Décris la tâche en détail...")
-        self.description_edit.setText(self.task.get("description", ""))
+        # La comparaison avec la valeur enregistrée n'est faite qu'à l'échéance, pas à chaque frappe
+        self.description_edit.textChanged.connect(self.autosave_timer.start)
         layout.addWidget(self.description_edit)
 
+    def setup_comments_section(self, layout):
+        """
+        Configure la section des commentaires.
+        La liste est alimentée par pages (CommentListModel) à mesure du défilement.
+        """
+        layout.addWidget(QLabel("Commentaires :"))
+
+        self.comment_model = CommentListModel(parent=self)
+        self.comments_view = QListView()
+        self.comments_view.setModel(self.comment_model)
+        self.comments_view.setWordWrap(True)
+        self.comments_view.setSpacing(2)
+        layout.addWidget(self.comments_view)
+
+        comment_layout = QHBoxLayout()
+        self.comment_input = QLineEdit()
+        self.comment_input.setPlaceholderText("Ajouter un commentaire...")
+        self.comment_input.returnPressed.connect(self.submit_comment)
+        comment_btn = QPushButton("Commenter")
+        comment_btn.clicked.connect(self.submit_comment)
+        comment_layout.addWidget(self.comment_input)
+        comment_layout.addWidget(comment_btn)
+        layout.addLayout(comment_layout)
+
+    def submit_comment(self):
+        content = self.comment_input.text().strip()
+        if content:
+            self.comment_submitted.emit(content)
+
     def setup_status_section(self, layout):
         """Configure la section de statut."""
         status_layout = QHBoxLayout()
         status_label = QLabel("Statut :")
         status_layout.addWidget(status_label)
 
-        self.status_colors = {
-            "À faire": "#ffb347",
-            "En cours": "#6fa3ef",
-            "Terminée": "#77dd77"
-        }
-
         self.status_box = QComboBox()
-        for status, color in self.status_colors.items():
+        for status, color in theme.STATUS_COLORS.items():
             self.status_box.addItem(status)
             index = self.status_box.findText(status)
             self.status_box.setItemData(index, color, Qt.BackgroundRole)
 
-        self.status_box.setCurrentText(self.task["status"])
-        self.status_box.currentTextChanged.connect(self.status_changed.emit)
+        self.status_box.currentTextChanged.connect(self.on_status_selected)
         status_layout.addWidget(self.status_box)
         layout.addLayout(status_layout)
 
+    def on_status_selected(self, status: str):
+        self.task["status"] = status
+        self.saved["status"] = status  # écrit par la file des statuts, pas par save_clicked
+        self.status_changed.emit(status)
+
     def setup_save_button(self, layout):
         """Configure le bouton de sauvegarde."""
         save_btn = QPushButton("Enregistrer")
         save_btn.clicked.connect(self.save_task)
         layout.addWidget(save_btn, alignment=Qt.AlignRight)
 
-    def get_stylesheet(self):
-        """Retourne la feuille de style pour le widget."""
-        if self.dark_mode:
-            return """
-                QWidget {
-                    background-color: #1e1e1e;
-                    color: #e0e0e0;
-                }
-                QLabel {
-                    color: #e0e0e0;
-                }
-                QPushButton {
-                    background-color: #3d3d3d;
-                    color: #e0e0e0;
-                    border: 1px solid #4d4d4d;
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                }
-                QPushButton:hover {
-                    background-color: #4d4d4d;
-                }
-                QTextEdit {
-                    background: #2d2d2d;
-                    color: #e0e0e0;
-                    border: 1px solid #3d3d3d;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: 13px;
-                }
-                QComboBox {
-                    background: #2d2d2d;
-                    color: #e0e0e0;
-                    border: 1px solid #3d3d3d;
-                    border-radius: 6px;
-                    padding: 5px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2d2d2d;
-                    color: #e0e0e0;
-                    selection-background-color: #4d4d4d;
-                }
-            """
-        else:
-            return """
-                QWidget {
-                    background-color: #ffffff;
-                    color: #000000;
-                }
-                QLabel {
-                    color: #000000;
-                }
-                QPushButton {
-                    background-color: #f5f5f5;
-                    color: #000000;
-                    border: 1px solid #ccc;
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                }
-                QPushButton:hover {
-                    background-color: #e9e9e9;
-                }
-                QTextEdit {
-                    background: #fff;
-                    color: #000000;
-                    border: 1px solid #ccc;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: 13px;
-                }
-                QComboBox {
-                    background: #fff;
-                    color: #000000;
-                    border: 1px solid #ccc;
-                    border-radius: 6px;
-                    padding: 5px;
-                }
-            """
+    def show_banner(self, path):
+        """
+        Affiche la bannière depuis le cache mémoire si possible ;
+        sinon elle est préparée en arrière-plan (taille pré-calculée sur disque).
+        """
+        if not banner_cache().exists(path):
+            self.banner.setText("Aucune image")
+            return
+
+        pixmap = banner_cache().pixmap(path, PREVIEW_HEIGHT)
+        if pixmap:
+            self.banner.setPixmap(pixmap)
+            return
+
+        self.banner.setText("Chargement…")
+        banner_cache().request(path, PREVIEW_HEIGHT, on_ready=self.on_banner_loaded)
+
+    def on_banner_loaded(self, path, image):
+        # La bannière a pu changer pendant le chargement
+        if path == self.task.get("image_path"):
+            self.banner.setPixmap(banner_cache().pixmap(path, PREVIEW_HEIGHT) or QPixmap.fromImage(image))
 
     def upload_banner(self):
-        """Gère l'upload d'une nouvelle bannière."""
+        """
+        Gère l'upload d'une nouvelle bannière.
+        Le décodage, le redimensionnement et l'encodage sont faits par banner_pipeline,
+        hors du thread de l'interface ; seul l'aperçu final est affiché ici.
+        """
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Sélectionner une bannière",
@@ -227,65 +245,96 @@ class TaskDetailView(QWidget):
         if not file_path:
             return
 
-        try:
-            # Créer le dossier images/ s'il n'existe pas
-            image_dir = "images"
-            os.makedirs(image_dir, exist_ok=True)
-
-            # Générer un nom de fichier unique
-            image_filename = f"task_{self.task['id']}_banner.png"
-            dest_path = os.path.join(image_dir, image_filename)
-
-            # Copier et redimensionner l'image
-            shutil.copy2(file_path, dest_path)
-            img = Image.open(dest_path)
-            img.thumbnail((800, 300))
-            img.save(dest_path)
-
-            # Mettre à jour la tâche
-            self.task["image_path"] = dest_path
-
-            # Mettre à jour l'affichage
-            pix = QPixmap(dest_path)
-            self.banner.setPixmap(pix.scaledToHeight(160, Qt.SmoothTransformation))
-            self.banner.setText("")
+        # Un seul traitement par vue : seul le dernier fichier choisi compte
+        self.cancel_banner_upload()
+
+        job = banner_pipeline().submit(file_path, banner_cache().store)
+        job.signals.progress.connect(self.banner_progress.setValue)
+        job.signals.finished.connect(lambda path, preview: self.on_banner_ready(job, path, preview))
+        job.signals.failed.connect(lambda message: self.on_banner_failed(job, message))
+        job.signals.cancelled.connect(lambda: self.on_banner_done(job))
+        self.banner_job = job
+
+        self.banner_progress.setValue(0)
+        self.banner_progress.setVisible(True)
+        self.cancel_banner_btn.setVisible(True)
+
+    def cancel_banner_upload(self):
+        """Interrompt le traitement de bannière en cours, s'il y en a un."""
+        if self.banner_job:
+            self.banner_job.cancel()
+            self.on_banner_done(self.banner_job)
+
+    def on_banner_done(self, job):
+        """Masque la progression une fois le traitement terminé, annulé ou en échec."""
+        if job is not self.banner_job:
+            return  # réponse d'un traitement remplacé ou annulé
+        self.banner_job = None
+        self.banner_progress.setVisible(False)
+        self.cancel_banner_btn.setVisible(False)
+
+    def on_banner_ready(self, job, path, preview):
+        """Affiche la bannière traitée et enregistre son chemin."""
+        if job is not self.banner_job:
+            return
+        self.on_banner_done(job)
 
-            # Activer le bouton de suppression
-            self.clear_banner_btn.setVisible(True)
+        self.task["image_path"] = path
+        self.banner.setPixmap(banner_cache().put(path, PREVIEW_HEIGHT, preview))
+        self.clear_banner_btn.setVisible(True)
 
-            # Notifier le contrôleur
-            if self.parent_controller:
-                self.parent_controller.update_task(self.task)
-                self.upload_clicked.emit(self.task)
+        # Notifier le contrôleur (la vue détail reste affichée)
+        if self.parent_controller:
+            self.parent_controller.handle_image_upload(self.task)
+        self.upload_clicked.emit(self.task)
 
-        except Exception as e:
-            QMessageBox.warning(self, "Erreur", f"Impossible d'uploader l'image : {e}")
+    def on_banner_failed(self, job, message):
+        if job is not self.banner_job:
+            return
+        self.on_banner_done(job)
+        QMessageBox.warning(self, "Erreur", f"Impossible d'uploader l'image : {message}")
 
     def clear_banner(self):
-        """Supprime la bannière actuelle."""
-        try:
-            if "image_path" in self.task and self.task["image_path"] and os.path.exists(self.task["image_path"]):
-                os.remove(self.task["image_path"])
-
-            # Mettre à jour la tâche et l'affichage
-            self.task["image_path"] = None
-            self.banner.setText("Aucune image")
-            self.clear_banner_btn.setVisible(False)
-
-            # Notifier le contrôleur
-            if self.parent_controller:
-                self.parent_controller.update_task(self.task)
-
-        except Exception as e:
-            QMessageBox.warning(self, "Erreur", f"Impossible de supprimer l'image : {e}")
-
-    def save_task(self):
-        """Sauvegarde les modifications de la tâche."""
-        updated_task = {
-            "id": self.task["id"],
+        """
+        Retire la bannière de la tâche.
+        Le fichier n'est pas supprimé ici : il peut être partagé avec d'autres tâches,
+        le ramasse-miettes du magasin d'images s'en charge quand plus rien ne le référence.
+        """
+        self.cancel_banner_upload()
+        self.task["image_path"] = None
+        self.banner.setText("Aucune image")
+        self.clear_banner_btn.setVisible(False)
+
+        # Notifier le contrôleur
+        if self.parent_controller:
+            self.parent_controller.handle_image_upload(self.task)
+
+    def changes(self) -> dict:
+        """Id de la tâche et champs qui diffèrent des valeurs enregistrées."""
+        current = {
             "title": self.task["title"],
             "description": self.description_edit.toPlainText(),
             "status": self.status_box.currentText(),
-            "image_path": self.task.get("image_path")
+            "image_path": self.task.get("image_path"),
         }
-        self.save_clicked.emit(updated_task)
+        changed = {field: value for field, value in current.items() if value != self.saved.get(field)}
+        return {"id": self.task["id"], **changed}
+
+    def mark_saved(self, changes: dict):
+        """Les valeurs envoyées sont désormais celles de la base (ignoré si une autre tâche est affichée)."""
+        if changes.get("id") == self.task.get("id"):
+            self.saved.update((field, value) for field, value in changes.items() if field != "id")
+
+    def flush_autosave(self):
+        """Enregistre tout de suite la description en attente, si elle a changé."""
+        self.autosave_timer.stop()
+        if not self.task:
+            return
+        changes = self.changes()
+        if "description" in changes:
+            self.autosave.emit({"id": changes["id"], "description": changes["description"]})
+
+    def save_task(self):
+        """Sauvegarde les modifications de la tâche (seulement les champs modifiés)."""
+        self.autosave_timer.stop()
+        self.save_clicked.emit(self.changes())
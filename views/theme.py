@@ -0,0 +1,243 @@
+# views/theme.py
+"""
+Thème de l'application : palettes de couleurs et feuille de style unique.
+
+La feuille de style contient les deux thèmes, chacun limité aux fenêtres dont la
+propriété dynamique `theme` vaut "light" ou "dark". Elle est installée une seule fois
+sur QApplication ; changer de thème ne fait que changer cette propriété.
+Les widgets ne définissent pas de style propre : ils portent une propriété `role`
+(title, row, icon, danger, banner, card…) reconnue par la feuille de style.
+"""
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication, QWidget
+
+
+STATUS_COLORS = {
+    "À faire": "#ffb347",
+    "En cours": "#6fa3ef",
+    "Terminée": "#77dd77"
+}
+
+PALETTES = {
+    "light": {
+        "window": "#ffffff",
+        "text": "#000000",
+        "surface": "#ffffff",
+        "border": "#cccccc",
+        "button": "#f5f5f5",
+        "button_hover": "#e9e9e9",
+        "selection": "#e9e9e9",
+        "row": "#ffffff",
+        "row_hover": "#fafafa",
+        "row_border": "#eeeeee",
+        "combo": "#fafafa",
+        "combo_hover": "#f0f0f0",
+        "icon_button": "#f1f3f5",
+        "icon_button_hover": "#e6e9ec",
+        "icon_button_border": "#d0d0d0",
+        "danger": "#ffe3e3",
+        "danger_hover": "#ffcccc",
+        "danger_border": "#ffbdbd",
+        "banner": "#f1f1f1",
+        "card": "#f9f9f9",
+        "card_hover": "#f0f0f0",
+        "pill_text": "#000000",
+    },
+    "dark": {
+        "window": "#1e1e1e",
+        "text": "#e0e0e0",
+        "surface": "#2d2d2d",
+        "border": "#3d3d3d",
+        "button": "#3d3d3d",
+        "button_hover": "#4d4d4d",
+        "selection": "#4d4d4d",
+        "row": "#2d2d2d",
+        "row_hover": "#3d3d3d",
+        "row_border": "#3d3d3d",
+        "combo": "#3d3d3d",
+        "combo_hover": "#4d4d4d",
+        "icon_button": "#3d3d3d",
+        "icon_button_hover": "#4d4d4d",
+        "icon_button_border": "#4d4d4d",
+        "danger": "#3d3d3d",
+        "danger_hover": "#4d4d4d",
+        "danger_border": "#4d4d4d",
+        "banner": "#2d2d2d",
+        "card": "#2d2d2d",
+        "card_hover": "#3d3d3d",
+        "pill_text": "#000000",
+    },
+}
+
+# Règles communes aux deux thèmes ; {scope} limite chaque règle aux fenêtres du thème
+TEMPLATE = """
+{scope}, {scope} QWidget {{
+    background-color: {window};
+    color: {text};
+}}
+{scope} QLabel {{
+    background-color: transparent;
+}}
+{scope} QLabel[role="title"] {{
+    font-size: 20px;
+    font-weight: bold;
+}}
+{scope} QLineEdit, {scope} QTextEdit {{
+    background-color: {surface};
+    color: {text};
+    border: 1px solid {border};
+    border-radius: 5px;
+    padding: 8px;
+}}
+{scope} QListView, {scope} QTableView {{
+    background-color: {surface};
+    border: 1px solid {border};
+    border-radius: 5px;
+}}
+{scope} QComboBox {{
+    background-color: {surface};
+    color: {text};
+    border: 1px solid {border};
+    border-radius: 6px;
+    padding: 5px;
+}}
+{scope} QComboBox::drop-down {{
+    border: none;
+}}
+{scope} QComboBox QAbstractItemView {{
+    background-color: {surface};
+    color: {text};
+    selection-background-color: {selection};
+}}
+{scope} QPushButton {{
+    background-color: {button};
+    color: {text};
+    border: 1px solid {border};
+    border-radius: 5px;
+    padding: 8px 16px;
+    font-weight: bold;
+}}
+{scope} QPushButton:hover {{
+    background-color: {button_hover};
+}}
+{scope} QPushButton[role="icon"] {{
+    background-color: {icon_button};
+    border: 1px solid {icon_button_border};
+    border-radius: 6px;
+    padding: 0;
+}}
+{scope} QPushButton[role="icon"]:hover {{
+    background-color: {icon_button_hover};
+}}
+{scope} QPushButton[role="danger"] {{
+    background-color: {danger};
+    border: 1px solid {danger_border};
+    border-radius: 6px;
+    padding: 0;
+}}
+{scope} QPushButton[role="danger"]:hover {{
+    background-color: {danger_hover};
+}}
+{scope} QPushButton[role="flat"] {{
+    background-color: transparent;
+    border: none;
+    padding: 0;
+}}
+{scope} QWidget[role="row"] {{
+    background-color: {row_hover};
+    border-bottom: 1px solid {row_border};
+}}
+{scope} QWidget[role="row"] QLabel {{
+    font-size: 14px;
+}}
+{scope} QWidget[role="row"] QComboBox {{
+    background-color: {combo};
+    border: 1px solid {icon_button_border};
+    padding: 2px 6px;
+    border-radius: 5px;
+}}
+{scope} QWidget[role="row"] QComboBox:hover {{
+    background-color: {combo_hover};
+}}
+{scope} QLabel[role="hint"] {{
+    font-style: italic;
+}}
+{scope} QLabel[role="banner"] {{
+    background-color: {banner};
+    border-radius: 10px;
+}}
+{scope} QWidget[role="card"] {{
+    background-color: {card};
+    border: 1px solid {border};
+    border-radius: 8px;
+}}
+{scope} QWidget[role="card"]:hover {{
+    background-color: {card_hover};
+}}
+{scope} QLabel[role="card-title"] {{
+    font-size: 14px;
+    font-weight: bold;
+}}
+"""
+
+_current = "light"
+_stylesheet = None
+_colors = {}  # (thème, jeton) -> QColor, pour le délégué
+
+
+def stylesheet() -> str:
+    """Feuille de style des deux thèmes, générée une seule fois."""
+    global _stylesheet
+    if _stylesheet is None:
+        _stylesheet = "".join(
+            TEMPLATE.format(scope=f'*[theme="{name}"]', **palette) for name, palette in PALETTES.items()
+        )
+    return _stylesheet
+
+
+def current() -> str:
+    return _current
+
+
+def is_dark() -> bool:
+    return _current == "dark"
+
+
+def color(name: str) -> QColor:
+    """QColor d'un jeton de la palette active (mis en cache)."""
+    key = (_current, name)
+    if key not in _colors:
+        _colors[key] = QColor(PALETTES[_current][name])
+    return _colors[key]
+
+
+def apply(dark: bool):
+    """
+    Active un thème. La feuille de style est installée au premier appel ;
+    ensuite seules les fenêtres de premier niveau changent de propriété `theme`
+    (coût indépendant du nombre de tâches : les lignes de la liste sont peintes par le délégué).
+    """
+    global _current
+    _current = "dark" if dark else "light"
+
+    app = QApplication.instance()
+    if app.styleSheet() != stylesheet():
+        app.setStyleSheet(stylesheet())
+    for window in app.topLevelWidgets():
+        if window.property("theme") != _current:
+            window.setProperty("theme", _current)
+            repolish(window)
+
+
+def repolish(widget: QWidget):
+    """Recalcule le style d'un widget et de ses enfants après un changement de propriété."""
+    style = widget.style()
+    for target in (widget, *widget.findChildren(QWidget)):
+        style.unpolish(target)
+        style.polish(target)
+    widget.update()
+
+
+def set_role(widget: QWidget, role: str):
+    """Associe un rôle de la feuille de style à un widget."""
+    widget.setProperty("role", role)
@@ -0,0 +1,103 @@
+# views/widgets/task_board_view.py
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QAbstractItemView
+from PySide6.QtCore import Qt, Signal
+from models.task_list_model import TaskListModel
+from models.task_model import STATUSES
+from views.widgets.task_card_delegate import TaskCardDelegate
+from views.widgets.task_list_view import TaskListView
+from views import theme
+
+
+class TaskColumnView(TaskListView):
+    """
+    Colonne du tableau : liste virtualisée de cartes, comme la liste principale.
+    Les cartes se glissent d'une colonne à l'autre ; leur ordre reste celui des dates.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setDragDropMode(QAbstractItemView.DragDrop)
+        self.setDefaultDropAction(Qt.MoveAction)
+        self.setDropIndicatorShown(False)
+
+
+class TaskBoardView(QWidget):
+    """
+    Tableau kanban : une colonne par statut.
+    Chaque colonne a son propre modèle paginé (TaskListModel filtré par statut) : seules les
+    cartes visibles sont peintes et les pages suivantes ne sont chargées qu'au défilement.
+    Les nombres de tâches des en-têtes sont fournis par set_counts (requête GROUP BY status).
+    """
+
+    edit_clicked = Signal(int)
+    delete_clicked = Signal(int)
+    status_dropped = Signal(int, str)  # id, nouveau statut
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.headers = {}
+        self.models = {}
+        self.views = {}
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.delegate = TaskCardDelegate(self)
+        self.delegate.edit_clicked.connect(self.edit_clicked)
+        self.delegate.delete_clicked.connect(self.delete_clicked)
+
+        for status in STATUSES:
+            column = QVBoxLayout()
+            header = QLabel(status)
+            theme.set_role(header, "card-title")
+            column.addWidget(header)
+
+            model = TaskListModel(parent=self, status=status)
+            model.tasks_dropped.connect(self.on_tasks_dropped)
+            model.task_left.connect(self.on_task_left)
+            view = TaskColumnView()
+            view.setModel(model)
+            view.setItemDelegate(self.delegate)
+            column.addWidget(view)
+            layout.addLayout(column)
+
+            self.headers[status] = header
+            self.models[status] = model
+            self.views[status] = view
+
+    def set_source(self, source):
+        """Associe la source (DatabaseClient) aux modèles des colonnes."""
+        for model in self.models.values():
+            model.set_source(source)
+
+    def reload(self):
+        """Recharge la première page de chaque colonne."""
+        for model in self.models.values():
+            model.reload()
+
+    def model_of(self, task_id: int):
+        """Retourne le modèle de la colonne qui affiche la tâche (None si aucune ne l'a chargée)."""
+        for model in self.models.values():
+            if model.row_of(task_id) != -1:
+                return model
+        return None
+
+    def set_counts(self, counts: dict):
+        """Affiche le nombre de tâches de chaque statut dans les en-têtes."""
+        for status, header in self.headers.items():
+            header.setText(f"{status} ({counts.get(status, 0)})")
+
+    def refresh_theme(self):
+        for view in self.views.values():
+            view.refresh_theme()
+
+    def on_tasks_dropped(self, tasks: list, status: str):
+        for task in tasks:
+            self.status_dropped.emit(task["id"], status)
+
+    def on_task_left(self, task: dict):
+        """Une tâche a changé de statut hors du tableau : elle rejoint sa nouvelle colonne."""
+        model = self.models.get(task["status"])
+        if model is not None:
+            model.insert_task(task)
@@ -0,0 +1,102 @@
+# views/widgets/task_card_delegate.py
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+from PySide6.QtCore import Qt, Signal, QRect, QSize
+from PySide6.QtGui import QPen
+from models.task_list_model import TaskListModel
+from views.widgets.task_card_widget import TaskCardWidget
+from views import icons, theme
+
+
+class TaskCardDelegate(QStyledItemDelegate):
+    """
+    Délégué de rendu des cartes du tableau (kanban).
+    Peint le titre, le début de la description et les icônes d'action sans créer de widget ;
+    un TaskCardWidget n'est instancié que pour la carte survolée.
+    """
+
+    edit_clicked = Signal(int)
+    delete_clicked = Signal(int)
+
+    CARD_HEIGHT = 112
+    CARD_MARGIN = 4  # espace autour de chaque carte
+    PADDING = 8
+    TITLE_HEIGHT = 20
+    BUTTON_SIZE = 24
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.CARD_HEIGHT)
+
+    def card_rect(self, rect: QRect):
+        return rect.adjusted(self.CARD_MARGIN, self.CARD_MARGIN, -self.CARD_MARGIN, -self.CARD_MARGIN)
+
+    def item_rects(self, rect: QRect):
+        """Calcule les zones du titre, de la description et des deux boutons d'une carte."""
+        inner = self.card_rect(rect).adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        size = self.BUTTON_SIZE
+        title_rect = QRect(inner.left(), inner.top(), inner.width(), self.TITLE_HEIGHT)
+        edit_rect = QRect(inner.left(), inner.bottom() - size + 1, size, size)
+        delete_rect = QRect(edit_rect.right() + 7, edit_rect.top(), size, size)
+        description_rect = QRect(
+            inner.left(), title_rect.bottom() + 7, inner.width(), max(0, edit_rect.top() - title_rect.bottom() - 13)
+        )
+        return title_rect, description_rect, edit_rect, delete_rect
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+
+        # Fond de la colonne puis carte, couleurs lues dans la palette du thème actif
+        painter.fillRect(option.rect, theme.color("surface"))
+        hovered = option.state & (QStyle.State_MouseOver | QStyle.State_Selected)
+        painter.setPen(QPen(theme.color("border")))
+        painter.setBrush(theme.color("card_hover" if hovered else "card"))
+        painter.drawRoundedRect(self.card_rect(option.rect).adjusted(0, 0, -1, -1), 8, 8)
+
+        task = index.data(TaskListModel.TaskRole)
+        title_rect, description_rect, edit_rect, delete_rect = self.item_rects(option.rect)
+
+        # Titre
+        font = option.font
+        font.setPixelSize(14)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(theme.color("text"))
+        metrics = painter.fontMetrics()
+        painter.drawText(
+            title_rect, Qt.AlignVCenter | Qt.AlignLeft,
+            metrics.elidedText(task["title"], Qt.ElideRight, title_rect.width()),
+        )
+
+        # Début de la description, coupé à la hauteur disponible
+        font.setBold(False)
+        font.setPixelSize(12)
+        painter.setFont(font)
+        painter.drawText(
+            description_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
+            TaskCardWidget.summary(task.get("description")),
+        )
+
+        # Boutons d'action : icônes seules, comme les boutons plats de la carte
+        dpr = painter.device().devicePixelRatioF()
+        for button_rect, icon_name in ((edit_rect, "pen"), (delete_rect, "trash")):
+            icon_rect = button_rect.adjusted(4, 4, -4, -4)
+            painter.drawPixmap(icon_rect, icons.pixmap(icon_name, icon_rect.size(), dpr))
+
+        painter.restore()
+
+    # --- Éditeur créé à la demande (carte survolée) ---
+
+    def createEditor(self, parent, option, index):
+        editor = TaskCardWidget(dict(index.data(TaskListModel.TaskRole)), parent)
+        editor.edit_clicked.connect(self.edit_clicked.emit)
+        editor.delete_clicked.connect(self.delete_clicked.emit)
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.set_task(dict(index.data(TaskListModel.TaskRole)))
+
+    def setModelData(self, editor, model, index):
+        pass  # la carte ne modifie rien directement : le statut change par glisser-déposer
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(self.card_rect(option.rect))
@@ -1,57 +1,71 @@
 # views/widgets/task_card_widget.py
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
 from PySide6.QtCore import Signal, Qt
-from PySide6.QtGui import QIcon
+from views import icons, theme
 
 class TaskCardWidget(QWidget):
-    """Widget pour l'affichage d'une tâche en mode carte (kanban)."""
+    """
+    Widget pour l'affichage d'une tâche en mode carte (kanban).
+    Comme TaskRowWidget pour la liste, il n'est créé que pour la carte survolée :
+    les autres cartes sont peintes par TaskCardDelegate.
+    """
     edit_clicked = Signal(int)
     delete_clicked = Signal(int)
 
-    def __init__(self, task: dict):
-        super().__init__()
+    SUMMARY_LENGTH = 90  # caractères de description affichés sur la carte
+
+    def __init__(self, task: dict, parent=None):
+        super().__init__(parent)
         self.task = task
+        theme.set_role(self, "card")
+        self.setAttribute(Qt.WA_StyledBackground)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(6)
 
         # Titre de la tâche
-        title = QLabel(task["title"])
-        title.setStyleSheet("font-weight: bold; font-size: 14px;")
-        layout.addWidget(title)
+        self.title_label = QLabel(task["title"])
+        theme.set_role(self.title_label, "card-title")
+        layout.addWidget(self.title_label)
 
-        # Description
-        if task.get("description"):
-            desc = QLabel(task["description"])
-            desc.setWordWrap(True)
-            layout.addWidget(desc)
+        # Début de la description
+        self.description_label = QLabel(self.summary(task.get("description")))
+        self.description_label.setWordWrap(True)
+        self.description_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        layout.addWidget(self.description_label, 1)
 
         # Ligne boutons
         btn_layout = QHBoxLayout()
         edit_btn = QPushButton()
-        edit_btn.setIcon(QIcon.fromTheme("document-edit"))
+        edit_btn.setIcon(icons.icon("pen"))
+        edit_btn.setToolTip("Modifier la tâche")
         edit_btn.setFixedSize(24, 24)
-        edit_btn.setStyleSheet("border: none;")
-        edit_btn.clicked.connect(lambda: self.edit_clicked.emit(task["id"]))
+        theme.set_role(edit_btn, "flat")
+        edit_btn.clicked.connect(lambda: self.edit_clicked.emit(self.task["id"]))
         btn_layout.addWidget(edit_btn)
 
         delete_btn = QPushButton()
-        delete_btn.setIcon(QIcon.fromTheme("edit-delete"))
+        delete_btn.setIcon(icons.icon("trash"))
+        delete_btn.setToolTip("Supprimer la tâche")
         delete_btn.setFixedSize(24, 24)
-        delete_btn.setStyleSheet("border: none;")
-        delete_btn.clicked.connect(lambda: self.delete_clicked.emit(task["id"]))
+        theme.set_role(delete_btn, "flat")
+        delete_btn.clicked.connect(lambda: self.delete_clicked.emit(self.task["id"]))
         btn_layout.addWidget(delete_btn)
+        btn_layout.addStretch()
 
         layout.addLayout(btn_layout)
 
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f9f9f9;
-                border: 1px solid #ccc;
-                border-radius: 8px;
-            }
-            QWidget:hover {
-                background-color: #f0f0f0;
-            }
-        """)
+    @classmethod
+    def summary(cls, description) -> str:
+        """Début de la description, sur une seule ligne logique (partagé avec le délégué)."""
+        text = " ".join((description or "").split())
+        if len(text) > cls.SUMMARY_LENGTH:
+            text = text[:cls.SUMMARY_LENGTH].rstrip() + "…"
+        return text
+
+    def set_task(self, task: dict):
+        """Met à jour le titre et la description affichés."""
+        self.task = task
+        self.title_label.setText(task["title"])
+        self.description_label.setText(self.summary(task.get("description")))
@@ -0,0 +1,115 @@
+# views/widgets/task_item_delegate.py
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+from PySide6.QtCore import Qt, Signal, QRect, QSize
+from PySide6.QtGui import QColor, QPen
+from models.task_list_model import TaskListModel
+from views.widgets.task_row_widget import TaskRowWidget
+from views import icons, theme
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """
+    Délégué de rendu des lignes de tâches.
+    Peint le titre, le nombre de commentaires, la pastille de statut et les icônes d'action
+    sans créer de widget ; un TaskRowWidget n'est instancié que pour la ligne survolée ou en cours d'édition.
+    """
+
+    edit_clicked = Signal(int)
+    delete_clicked = Signal(int)
+
+    ROW_HEIGHT = 44
+    BUTTON_SIZE = 28
+    PILL_WIDTH = 96
+    COUNT_WIDTH = 48
+    MARGIN = 5
+    SPACING = 6
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def item_rects(self, rect: QRect):
+        """Calcule les zones du titre, du compteur de commentaires, de la pastille et des deux boutons."""
+        size = self.BUTTON_SIZE
+        top = rect.top() + (rect.height() - size) // 2
+        delete_rect = QRect(rect.right() - self.MARGIN - size, top, size, size)
+        edit_rect = QRect(delete_rect.left() - self.SPACING - size, top, size, size)
+        pill_rect = QRect(edit_rect.left() - self.SPACING * 2 - self.PILL_WIDTH, top, self.PILL_WIDTH, size)
+        count_rect = QRect(pill_rect.left() - self.SPACING - self.COUNT_WIDTH, top, self.COUNT_WIDTH, size)
+        title_rect = QRect(
+            rect.left() + self.MARGIN * 2, rect.top(),
+            max(0, count_rect.left() - rect.left() - self.MARGIN * 4), rect.height()
+        )
+        return title_rect, count_rect, pill_rect, edit_rect, delete_rect
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+
+        # Couleurs lues dans la palette du thème actif
+        rect = option.rect
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(rect, theme.color("row_hover").darker(110))
+        elif option.state & QStyle.State_MouseOver:
+            painter.fillRect(rect, theme.color("row_hover"))
+        else:
+            painter.fillRect(rect, theme.color("row"))
+        painter.setPen(QPen(theme.color("row_border")))
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+
+        title_rect, count_rect, pill_rect, edit_rect, delete_rect = self.item_rects(rect)
+
+        # Titre
+        font = option.font
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.setPen(theme.color("text"))
+        title = option.fontMetrics.elidedText(index.data(Qt.DisplayRole) or "", Qt.ElideRight, title_rect.width())
+        painter.drawText(title_rect, Qt.AlignVCenter | Qt.AlignLeft, title)
+
+        # Nombre de commentaires (colonne tenue à jour en base, sans COUNT)
+        count = index.data(TaskListModel.CommentCountRole)
+        if count:
+            painter.drawText(count_rect, Qt.AlignVCenter | Qt.AlignRight, f"💬 {count}")
+
+        # Pastille de statut
+        status = index.data(TaskListModel.StatusRole) or ""
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(theme.STATUS_COLORS.get(status, "#cccccc")))
+        painter.drawRoundedRect(pill_rect, 5, 5)
+        painter.setPen(theme.color("pill_text"))
+        painter.drawText(pill_rect, Qt.AlignCenter, status)
+
+        # Boutons d'action : icônes rastérisées une fois par densité d'écran
+        dpr = painter.device().devicePixelRatioF()
+        for button_rect, icon_name, bg, bd in (
+            (edit_rect, "pen", "icon_button", "icon_button_border"),
+            (delete_rect, "trash", "danger", "danger_border"),
+        ):
+            painter.setPen(QPen(theme.color(bd)))
+            painter.setBrush(theme.color(bg))
+            painter.drawRoundedRect(button_rect.adjusted(0, 0, -1, -1), 6, 6)
+            icon_rect = button_rect.adjusted(6, 6, -6, -6)
+            painter.drawPixmap(icon_rect, icons.pixmap(icon_name, icon_rect.size(), dpr))
+
+        painter.restore()
+
+    # --- Éditeur créé à la demande (ligne survolée) ---
+
+    def createEditor(self, parent, option, index):
+        task = dict(index.data(TaskListModel.TaskRole))
+        editor = TaskRowWidget(task, parent)
+        editor.edit_clicked.connect(self.edit_clicked.emit)
+        editor.delete_clicked.connect(self.delete_clicked.emit)
+        editor.status_changed.connect(lambda *_: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.title_label.setText(index.data(Qt.DisplayRole))
+        editor.set_status(index.data(TaskListModel.StatusRole))
+        editor.set_comment_count(index.data(TaskListModel.CommentCountRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.status_box.currentText(), TaskListModel.StatusRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
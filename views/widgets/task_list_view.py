@@ -0,0 +1,77 @@
+# views/widgets/task_list_view.py
+from PySide6.QtWidgets import QTableView, QAbstractItemView, QComboBox, QHeaderView, QStyleOptionViewItem
+from PySide6.QtCore import Qt, QEvent, QModelIndex, QPersistentModelIndex
+
+
+class TaskListView(QTableView):
+    """
+    Liste virtualisée des tâches.
+    Seules les lignes visibles sont peintes par le délégué ; un éditeur (TaskRowWidget)
+    est ouvert uniquement sur la ligne survolée puis refermé quand la souris la quitte.
+    Une table à une colonne et à hauteur de ligne fixe plutôt qu'un QListView : celui-ci
+    recalcule la position de toutes les lignes à chaque page ajoutée, la table non.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hovered = QPersistentModelIndex()
+
+        self.setMouseTracking(True)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setCornerButtonEnabled(False)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Ctrl/Maj + clic pour sélectionner plusieurs tâches (actions groupées)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.entered.connect(self.open_hover_editor)
+        self.viewport().installEventFilter(self)
+
+    def setItemDelegate(self, delegate):
+        """La hauteur des lignes est celle, fixe, que donne le délégué."""
+        super().setItemDelegate(delegate)
+        height = delegate.sizeHint(QStyleOptionViewItem(), QModelIndex()).height()
+        self.verticalHeader().setMinimumSectionSize(1)
+        self.verticalHeader().setDefaultSectionSize(height)
+
+    def open_hover_editor(self, index):
+        """Ouvre l'éditeur de la ligne survolée et ferme le précédent."""
+        if self._hovered.isValid() and self._hovered == index:
+            return
+        self.close_hover_editor()
+        if index.isValid():
+            self._hovered = QPersistentModelIndex(index)
+            self.openPersistentEditor(index)
+
+    def close_hover_editor(self):
+        """Ferme l'éditeur de survol, sauf si l'un de ses menus déroulants est ouvert."""
+        if not self._hovered.isValid():
+            self._hovered = QPersistentModelIndex()
+            return
+
+        index = self.model().index(self._hovered.row(), 0)
+        editor = self.indexWidget(index)
+        if editor is not None and any(box.view().isVisible() for box in editor.findChildren(QComboBox)):
+            return
+        self.closePersistentEditor(index)
+        self._hovered = QPersistentModelIndex()
+
+    def selected_rows(self):
+        """Retourne les lignes sélectionnées, dans l'ordre d'affichage."""
+        return sorted(index.row() for index in self.selectionModel().selectedRows())
+
+    def refresh_theme(self):
+        """Redessine les lignes après un changement de thème."""
+        self.close_hover_editor()
+        self.viewport().update()
+
+    def eventFilter(self, obj, event):
+        if obj is self.viewport() and event.type() == QEvent.Leave:
+            self.close_hover_editor()
+        return super().eventFilter(obj, event)